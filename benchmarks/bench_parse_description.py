@@ -0,0 +1,128 @@
+"""
+Benchmark parse_description: versi lama (regex per keyword, per row)
+vs engine satu-scan di data_recruitment/description.py.
+
+Jalankan dari root repo:
+    python -m benchmarks.bench_parse_description --rows 20000
+"""
+import argparse
+import random
+import re
+import time
+
+import pandas as pd
+
+from data_recruitment.description import (
+    SKILLS_KEYWORDS, BENEFITS_KEYWORDS, DESCRIPTION_COLUMNS, parse_descriptions
+)
+
+
+def legacy_parse_description(desc):
+    # Salinan parse_description sebelum engine satu-scan (referensi output)
+    if pd.isna(desc):
+        return pd.Series([None, None, None, None])
+
+    skills = []
+    for skill in SKILLS_KEYWORDS:
+        if re.search(rf"\b{re.escape(skill)}\b", desc, re.IGNORECASE):
+            skills.append(skill)
+
+    level_patterns = {
+        "Entry": r"\b(entry|0[-\s]?to[-\s]?2\s+years?|under\s+1\s+year|junior|fresher|0[-\s]?2\s+years?)\b",
+        "Mid": r"\b(mid|3[-\s]?to[-\s]?5\s+years?|intermediate|3[-\s]?5\s+years?)\b",
+        "Senior": r"\b(senior|lead|6\+?\s+years?|8\+?\s+years?|manager|principal|staff|architect)\b"
+    }
+    level = None
+    for lvl, pattern in level_patterns.items():
+        if re.search(pattern, desc, re.IGNORECASE):
+            level = lvl
+            break
+
+    job_types = []
+    if re.search(r"\bfull[-\s]?time\b", desc, re.IGNORECASE):
+        job_types.append("Full-time")
+    if re.search(r"\bpart[-\s]?time\b", desc, re.IGNORECASE):
+        job_types.append("Part-time")
+    if re.search(r"\bcontract\b", desc, re.IGNORECASE):
+        job_types.append("Contract")
+    if re.search(r"\bintern(ship)?\b", desc, re.IGNORECASE):
+        job_types.append("Internship")
+    if re.search(r"\bremote\b", desc, re.IGNORECASE):
+        job_types.append("Remote")
+    if re.search(r"\bhybrid\b", desc, re.IGNORECASE):
+        job_types.append("Hybrid")
+    job_type = ", ".join(job_types) if job_types else None
+
+    benefits = []
+    for benefit_type, keywords in BENEFITS_KEYWORDS.items():
+        for keyword in keywords:
+            if re.search(rf"\b{re.escape(keyword)}\b", desc, re.IGNORECASE):
+                benefits.append(benefit_type.capitalize())
+                break
+
+    return pd.Series([
+        ", ".join(skills) if skills else None,
+        level,
+        job_type,
+        ", ".join(benefits) if benefits else None
+    ])
+
+
+FILLER = (
+    "we are looking for a data engineer to join our team and build reliable "
+    "pipelines with modern tooling the candidate will work closely with analysts "
+    "and stakeholders to deliver insights across the business"
+).split()
+
+PHRASES = (
+    SKILLS_KEYWORDS
+    + [k for keywords in BENEFITS_KEYWORDS.values() for k in keywords]
+    + ["Full-time", "part time", "Contract", "Internship", "intern", "Remote", "hybrid",
+       "entry level", "0-2 years", "3 to 5 years", "6+ years", "8 years", "Senior",
+       "Lead", "mid-level", "JavaScript", "PostgreSQL", "GitHub", "R&D"]
+)
+
+
+def make_descriptions(n_rows, seed=42):
+    rng = random.Random(seed)
+    descs = []
+    for _ in range(n_rows):
+        if rng.random() < 0.01:
+            descs.append(None)
+            continue
+        words = [rng.choice(FILLER) for _ in range(rng.randint(80, 400))]
+        for _ in range(rng.randint(0, 15)):
+            phrase = rng.choice(PHRASES)
+            phrase = phrase.upper() if rng.random() < 0.2 else phrase
+            words.insert(rng.randrange(len(words) + 1), phrase)
+        descs.append(" ".join(words))
+    return pd.Series(descs, dtype=object)
+
+
+def run(n_rows):
+    descs = make_descriptions(n_rows)
+
+    start = time.perf_counter()
+    legacy = descs.apply(legacy_parse_description)
+    legacy.columns = DESCRIPTION_COLUMNS
+    legacy_sec = time.perf_counter() - start
+
+    start = time.perf_counter()
+    current = parse_descriptions(descs)
+    current_sec = time.perf_counter() - start
+
+    identical = legacy.astype(object).equals(current.astype(object))
+
+    print(f"rows           : {n_rows}")
+    print(f"legacy         : {legacy_sec:.3f}s ({n_rows / legacy_sec:,.0f} rows/sec)")
+    print(f"single-scan    : {current_sec:.3f}s ({n_rows / current_sec:,.0f} rows/sec)")
+    print(f"speedup        : {legacy_sec / current_sec:.1f}x")
+    print(f"identical      : {identical}")
+    return identical
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=20000)
+    args = parser.parse_args()
+    run(args.rows)
@@ -0,0 +1,303 @@
+"""
+Benchmark end-to-end pipeline produk & recruitment dengan data sintetis.
+
+Setiap kombinasi (pipeline, jumlah row) dijalankan di proses terpisah supaya
+peak RSS tidak tercampur antar ukuran. Per stage (dan sub-step di dalam
+transform/load, lihat common/instrumentation.py) dicatat wall time, peak RSS
+dan rows/sec; hasil ditulis ke <out-dir>/<label>.json dan .csv.
+
+Jalankan dari root repo:
+    python -m benchmarks.bench_pipelines --rows 1000 10000 100000
+    python -m benchmarks.bench_pipelines --pipeline products --rows 1000000 --output parquet
+    python -m benchmarks.bench_pipelines --rows 10000000 --chunksize 200000   # mode streaming
+    python -m benchmarks.bench_pipelines --rows 100000 --compare benchmarks/results/base.json
+
+--compare membandingkan dengan file hasil sebelumnya dan exit code 1 kalau
+ada stage yang lebih lambat dari --threshold (default 25%).
+"""
+import argparse
+import csv
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.generators import write_csv
+from common.instrumentation import instrument, stage
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PIPELINES = ["products", "recruitment"]
+CSV_FIELDS = [
+    "pipeline", "rows", "mode", "repeat", "stage", "calls", "seconds", "rows_in", "rows_out",
+    "rows_per_sec", "rss_start_mb", "peak_rss_mb", "peak_delta_mb",
+]
+
+
+def run_products(path, rows, backends, excel_rows, chunksize, workers=None, partition_rows=None):
+    from data_products.extract import extract_product
+    from data_products.data_profiling import inspect_data
+    from data_products.transform import transform_product, demographi
+    from data_products.load import load_product
+    from data_products.streaming import run_stream
+
+    if chunksize:
+        with stage("stream", rows_in=rows):
+            run_stream(path, chunksize, filename="bench_products", backends=backends, excel_rows=excel_rows,
+                       workers=workers, partition_rows=partition_rows)
+        return
+
+    with stage("extract") as r:
+        df = extract_product(path)
+        r["rows_out"] = len(df)
+    with stage("inspect_data", rows_in=len(df)):
+        inspect_data(df)
+    with stage("transform", rows_in=len(df)) as r:
+        df = transform_product(df, workers=workers, partition_rows=partition_rows)
+        r["rows_out"] = len(df)
+    with stage("demographi", rows_in=len(df)):
+        report = demographi(df)
+    with stage("load", rows_in=len(df)):
+        load_product(df, demographi_report=report, filename="bench_products",
+                     backends=backends, excel_rows=excel_rows)
+
+
+def run_recruitment(path, rows, backends, excel_rows, chunksize, workers=None, partition_rows=None):
+    from data_recruitment.extract import extract_recruitment
+    from data_recruitment.data_profiling import inspect_data
+    from data_recruitment.transform import transform, demographi
+    from data_recruitment.load import load
+    from data_recruitment.company import CompanyDimension
+    from data_recruitment.streaming import run_stream
+
+    if chunksize:
+        with stage("stream", rows_in=rows):
+            run_stream(path, chunksize, filename="bench_recruitment", backends=backends, excel_rows=excel_rows,
+                       workers=workers, partition_rows=partition_rows)
+        return
+
+    with stage("extract") as r:
+        df = extract_recruitment(path)
+        r["rows_out"] = len(df)
+    with stage("inspect_data", rows_in=len(df)):
+        inspect_data(df)
+    companies = CompanyDimension()
+    with stage("transform", rows_in=len(df)) as r:
+        df = transform(df, workers=workers, partition_rows=partition_rows, companies=companies)
+        r["rows_out"] = len(df)
+    with stage("demographi", rows_in=len(df)):
+        report = demographi(df, companies=companies)
+    with stage("load", rows_in=len(df)):
+        load(df, demographi_report=report, filename="bench_recruitment",
+             backends=backends, excel_rows=excel_rows, companies=companies)
+
+
+RUNNERS = {"products": run_products, "recruitment": run_recruitment}
+
+
+def mode_label(args):
+    mode = f"stream:{args.chunksize}" if args.chunksize else "memory"
+    return f"{mode}/w{args.workers}" if args.workers is not None else mode
+
+
+def worker(args):
+    # Satu kasus di proses ini; output pipeline (output/...) ditulis di cwd (temp dir)
+    os.makedirs("output", exist_ok=True)
+    labels = {"pipeline": args.pipeline, "rows": args.rows[0],
+              "mode": mode_label(args), "repeat": args.repeat}
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        with instrument(args.pipeline) as run:
+            RUNNERS[args.pipeline](args.csv, args.rows[0], args.output or ["excel"],
+                                   args.excel_rows, args.chunksize, args.workers, args.partition_rows)
+    with open(args.worker_out, "w", encoding="utf-8") as f:
+        json.dump([{**labels, **record} for record in run.records()], f)
+
+
+def run_case(pipeline, rows, csv_path, args, repeat):
+    with tempfile.TemporaryDirectory(prefix="bench_run_") as workdir:
+        result_path = os.path.join(workdir, "result.json")
+        cmd = [
+            sys.executable, "-m", "benchmarks.bench_pipelines", "--worker",
+            "--pipeline", pipeline, "--rows", str(rows), "--csv", csv_path,
+            "--worker-out", result_path, "--repeat", str(repeat),
+        ]
+        for backend in args.output or []:
+            cmd += ["--output", backend]
+        if args.excel_rows is not None:
+            cmd += ["--excel-rows", str(args.excel_rows)]
+        if args.chunksize:
+            cmd += ["--chunksize", str(args.chunksize)]
+        if args.workers is not None:
+            cmd += ["--workers", str(args.workers)]
+        if args.partition_rows:
+            cmd += ["--partition-rows", str(args.partition_rows)]
+
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [REPO_ROOT, os.environ.get("PYTHONPATH")]))}
+        proc = subprocess.run(cmd, cwd=workdir, env=env, capture_output=True, text=True)
+        if proc.returncode != 0:
+            raise RuntimeError(f"Benchmark {pipeline} {rows} row gagal:\n{proc.stderr}")
+        with open(result_path, encoding="utf-8") as f:
+            return json.load(f)
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT,
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def metadata(args, revision):
+    return {
+        "revision": revision,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "seed": args.seed,
+        "output": args.output or ["excel"],
+        "excel_rows": args.excel_rows,
+        "chunksize": args.chunksize,
+        "workers": args.workers,
+        "partition_rows": args.partition_rows,
+    }
+
+
+def write_results(out_dir, label, meta, records):
+    os.makedirs(out_dir, exist_ok=True)
+    json_path = os.path.join(out_dir, f"{label}.json")
+    with open(json_path, "w", encoding="utf-8") as f:
+        json.dump({"meta": meta, "results": records}, f, indent=2)
+
+    csv_path = os.path.join(out_dir, f"{label}.csv")
+    with open(csv_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=CSV_FIELDS, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(records)
+    return json_path, csv_path
+
+
+def best_seconds(records):
+    # Waktu terbaik antar --repeat per (pipeline, rows, mode, stage)
+    best = {}
+    for r in records:
+        key = (r["pipeline"], r["rows"], r["mode"], r["stage"])
+        best[key] = min(best.get(key, float("inf")), r["seconds"])
+    return best
+
+
+def compare(baseline_path, records, threshold, min_seconds=0.05):
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = best_seconds(json.load(f)["results"])
+    current = best_seconds(records)
+
+    regressions = []
+    print(f"\n{'pipeline':<12} {'rows':>10} {'mode':<14} {'stage':<40} {'base s':>9} {'now s':>9} {'ratio':>7}")
+    for key, seconds in current.items():
+        if key not in baseline:
+            continue
+        base = baseline[key]
+        ratio = seconds / base if base > 0 else float("inf")
+        slower = ratio > 1 + threshold and seconds >= min_seconds
+        mark = "  <-- REGRESI" if slower else ""
+        print(f"{key[0]:<12} {key[1]:>10} {key[2]:<14} {key[3]:<40} {base:>9.3f} {seconds:>9.3f} {ratio:>7.2f}{mark}")
+        if slower:
+            regressions.append(key)
+    return regressions
+
+
+def print_summary(records):
+    print(f"\n{'pipeline':<12} {'rows':>10} {'stage':<40} {'seconds':>9} {'rows/sec':>12} {'peak MB':>9} {'Δpeak MB':>9}")
+    for r in records:
+        rps = f"{r['rows_per_sec']:,.0f}" if r["rows_per_sec"] else "-"
+        print(f"{r['pipeline']:<12} {r['rows']:>10} {r['stage']:<40} {r['seconds']:>9.3f} "
+              f"{rps:>12} {r['peak_rss_mb']:>9.1f} {r['peak_delta_mb']:>9.1f}")
+
+
+def main(args):
+    revision = git_revision()
+    label = args.label or f"{revision}_{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+    records = []
+
+    data_dir = args.data_dir or tempfile.mkdtemp(prefix="bench_data_")
+    os.makedirs(data_dir, exist_ok=True)
+    try:
+        for pipeline in args.pipeline:
+            for rows in args.rows:
+                csv_path = os.path.join(data_dir, f"{pipeline}_{rows}_seed{args.seed}.csv")
+                if not os.path.exists(csv_path):
+                    start = time.perf_counter()
+                    write_csv(pipeline, rows, csv_path, seed=args.seed)
+                    print(f"[bench] generate {pipeline} {rows:,} row: {time.perf_counter() - start:.1f}s")
+                for repeat in range(args.repeat):
+                    print(f"[bench] run {pipeline} {rows:,} row (#{repeat + 1})")
+                    records.extend(run_case(pipeline, rows, csv_path, args, repeat))
+    finally:
+        if not args.data_dir:
+            for name in os.listdir(data_dir):
+                os.remove(os.path.join(data_dir, name))
+            os.rmdir(data_dir)
+
+    print_summary(records)
+    json_path, csv_path = write_results(args.out_dir, label, metadata(args, revision), records)
+    print(f"\n[bench] Saved to {json_path} dan {csv_path}")
+
+    if args.compare:
+        regressions = compare(args.compare, records, args.threshold)
+        if regressions:
+            print(f"\n[bench] {len(regressions)} stage lebih lambat > {args.threshold:.0%} dari baseline")
+            return 1
+    return 0
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark pipeline dengan data sintetis")
+    parser.add_argument("--pipeline", nargs="+", choices=PIPELINES, default=PIPELINES)
+    parser.add_argument("--rows", nargs="+", type=int, default=[1_000, 10_000, 100_000],
+                        help="Jumlah row data sintetis (10^3 sampai 10^7)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=1, help="Jumlah run per kasus")
+    parser.add_argument("--output", action="append", choices=["excel", "parquet", "feather", "sqlite"],
+                        help="Backend output stage load (bisa diulang), default: excel")
+    parser.add_argument("--excel-rows", type=int, default=None,
+                        help="Batas row Cleaned_Data di Excel (0 = hanya sheet report)")
+    parser.add_argument("--chunksize", type=int, default=None,
+                        help="Benchmark mode streaming (run_stream) dengan ukuran chunk ini")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Transform paralel dengan N proses (0 = semua core)")
+    parser.add_argument("--partition-rows", type=int, default=None)
+    parser.add_argument("--data-dir", default=None,
+                        help="Simpan & pakai ulang CSV sintetis di folder ini (default: temp, dihapus)")
+    parser.add_argument("--out-dir", default=os.path.join(REPO_ROOT, "benchmarks", "results"))
+    parser.add_argument("--label", default=None, help="Nama file hasil (default: <git rev>_<waktu>)")
+    parser.add_argument("--compare", default=None, help="File JSON hasil sebelumnya sebagai baseline")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="Batas perlambatan relatif sebelum dianggap regresi")
+    # Dipakai internal oleh run_case
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--csv", help=argparse.SUPPRESS)
+    parser.add_argument("--worker-out", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    if args.worker:
+        args.pipeline = args.pipeline[0]
+    return args
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    if args.worker:
+        worker(args)
+    else:
+        sys.exit(main(args))
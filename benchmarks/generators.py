@@ -0,0 +1,252 @@
+"""
+Generator data sintetis (deterministik) dengan schema & keanehan yang sama
+seperti CSV asli, untuk benchmark 10^3 sampai 10^7 row.
+
+Produk (Amazon category dump):
+    harga "₹1,499" (pakai koma ribuan), discount_price/actual_price kadang kosong,
+    ratings kadang "Get", no_of_ratings "3,836" / "FREE Delivery by Amazon" /
+    "GET" / "Only 2 left in stock.", nama produk duplikat, link dengan ASIN.
+Recruitment (job postings):
+    company dengan rating di belakang nama ("Acme 4.2"), salary "$85,000 /yr (est.)"
+    atau "$45.00 /hr (est.)", job description panjang berisi skill/level/benefit,
+    atribut company kadang kosong per row (dites oleh fill per company).
+
+Data dibuat per blok BLOCK_ROWS row; seed blok = (seed, nomor blok), jadi
+isi file sama persis berapa pun ukuran blok yang ditulis sekaligus.
+"""
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.bench_parse_description import make_descriptions
+
+BLOCK_ROWS = 200_000
+
+ALNUM = np.array(list("ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"), dtype="U1")
+IMAGE_CHARS = np.array(list("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+-"), dtype="U1")
+
+BRANDS = [
+    "Kore", "Boldfit", "Strauss", "Nivia", "Cockatoo", "Lifelong", "Aurion", "Vector X",
+    "Amazon Brand - Symactive", "Decathlon", "Reebok", "Adidas", "Fitkit", "PowerMax",
+    "Protoner", "Hashtag Fitness", "Burnlab", "Kobo", "Cosco", "Yonex",
+]
+ADJECTIVES = [
+    "Regular", "Adjustable", "Heavy Duty", "Anti-Slip", "Premium", "Foldable", "Non-Slip",
+    "Professional", "Portable", "Home", "Pro", "Ultra Light", "PVC", "Rubber", "Steel",
+]
+PRODUCTS = [
+    "Gym Bag", "Resistance Tube with Foam Handles", "Yoga Mat", "Skipping Rope", "Dumbbell Set",
+    "Push Up Board", "Hand Grip Strengthener", "Ab Roller Wheel", "Kettlebell", "Gym Gloves",
+    "Exercise Bike", "Treadmill", "Foam Roller", "Pull Up Bar", "Weight Plates", "Tummy Trimmer",
+]
+SUFFIXES = [
+    "", "", "", " for Men & Women", " for Home Workout", ", Black", " (Pack of 2)",
+    " for Exercise & Stretching, Suitable in Home & Gym Workout for Men &...",
+]
+
+COMPANY_WORDS = [
+    "Acme", "Globex", "Initech", "Umbrella", "Hooli", "Stark", "Wayne", "Wonka", "Soylent",
+    "Cyberdyne", "Tyrell", "Aperture", "Vandelay", "Pied Piper", "Massive", "Dynamic",
+]
+COMPANY_SUFFIXES = ["", " Inc", " Corp", " Labs", " Technologies", " Group", " Analytics"]
+LOCATIONS = [
+    "Remote", "New York, NY", "San Francisco, CA", "Austin, TX", "Seattle, WA", "Chicago, IL",
+    "Boston, MA", "Atlanta, GA", "Denver, CO", "United States",
+]
+JOB_TITLES = [
+    "Data Engineer", "Senior Data Engineer", "Data Analyst", "Data Scientist",
+    "Machine Learning Engineer", "Analytics Engineer", "Lead Data Engineer", "Junior Data Analyst",
+]
+COMPANY_SIZES = [
+    "1 to 50 Employees", "51 to 200 Employees", "201 to 500 Employees",
+    "501 to 1000 Employees", "1001 to 5000 Employees", "10000+ Employees",
+]
+COMPANY_TYPES = ["Company - Private", "Company - Public", "Nonprofit Organization", "Government"]
+SECTORS = {
+    "Information Technology": ["Software Development", "Information Technology Support Services"],
+    "Finance": ["Banking & Lending", "Investment & Asset Management"],
+    "Healthcare": ["Health Care Services & Hospitals"],
+    "Retail & Wholesale": ["Department, Clothing & Shoe Stores"],
+}
+REVENUES = [
+    "Less than $1 million (USD)", "$1 to $5 million (USD)", "$25 to $100 million (USD)",
+    "$1 to $5 billion (USD)", "$10+ billion (USD)", "Unknown / Non-Applicable",
+]
+
+
+def _rng(seed, *stream):
+    return np.random.default_rng([seed, *stream])
+
+
+def _random_codes(rng, n, length, chars=ALNUM):
+    # n string acak panjang `length` tanpa loop Python
+    idx = rng.integers(0, len(chars), size=(n, length))
+    return chars[idx].view(f"<U{length}").ravel()
+
+
+def _with_commas(values, prefix=""):
+    return [f"{prefix}{v:,}" for v in values.tolist()]
+
+
+def _mask(rng, n, p):
+    return rng.random(n) < p
+
+
+def product_block(n, seed=42, block=0):
+    rng = _rng(seed, block)
+
+    names = (
+        pd.Series(np.array(BRANDS)[rng.integers(0, len(BRANDS), n)]) + " "
+        + np.array(ADJECTIVES)[rng.integers(0, len(ADJECTIVES), n)] + " "
+        + np.array(PRODUCTS)[rng.integers(0, len(PRODUCTS), n)] + " "
+        + _random_codes(rng, n, 4)
+        + np.array(SUFFIXES)[rng.integers(0, len(SUFFIXES), n)]
+    )
+    # ±1.5% nama duplikat dari row lain di blok yang sama
+    dup = np.flatnonzero(_mask(rng, n, 0.015))
+    if len(dup):
+        names.iloc[dup] = names.iloc[rng.integers(0, n, len(dup))].to_numpy()
+
+    asin = "B0" + pd.Series(_random_codes(rng, n, 8))
+    slug = names.str.slice(0, 60).str.replace(r"[^A-Za-z0-9]+", "-", regex=True).str.strip("-")
+    position = pd.Series(rng.integers(1, 400, n)).astype(str)
+    link = ("https://www.amazon.in/" + slug + "/dp/" + asin + "/ref=sr_1_" + position
+            + "?qid=1679218203&s=sports&sr=1-" + position)
+    image = ("https://m.media-amazon.com/images/I/"
+             + pd.Series(_random_codes(rng, n, 11, IMAGE_CHARS)) + "._AC_UL320_.jpg")
+
+    ratings = pd.Series(np.round(rng.uniform(1.0, 5.0, n), 1)).astype(str).astype(object)
+    n_ratings = pd.Series(_with_commas(np.ceil(rng.lognormal(5, 2, n)).astype(np.int64)), dtype=object)
+    unrated = _mask(rng, n, 0.096)
+    ratings[unrated] = np.nan
+    n_ratings[unrated] = np.nan
+    odd = np.flatnonzero(~unrated & _mask(rng, n, 0.01))
+    ratings.iloc[odd] = "Get"
+    n_ratings.iloc[odd] = rng.choice(
+        ["FREE Delivery by Amazon", "GET", "Only 2 left in stock."], len(odd), p=[0.8, 0.1, 0.1]
+    )
+
+    actual = np.round(rng.lognormal(7, 0.9, n)).astype(np.int64) + 49
+    discount = np.maximum(1, (actual * rng.uniform(0.2, 1.0, n)).astype(np.int64))
+    actual_price = pd.Series(_with_commas(actual, "₹"), dtype=object)
+    discount_price = pd.Series(_with_commas(discount, "₹"), dtype=object)
+    actual_price[_mask(rng, n, 0.006)] = np.nan
+    discount_price[_mask(rng, n, 0.068)] = np.nan
+
+    return pd.DataFrame({
+        "name": names,
+        "main_category": "sports & fitness",
+        "sub_category": "All Exercise & Fitness",
+        "image": image,
+        "link": link,
+        "ratings": ratings,
+        "no_of_ratings": n_ratings,
+        "discount_price": discount_price,
+        "actual_price": actual_price,
+    })
+
+
+def _letter_ids(n):
+    # ID company pakai huruf ("A", "B", ..., "AA"): angka di belakang nama dibuang transform
+    ids = []
+    for i in range(n):
+        code = ""
+        i += 1
+        while i:
+            i, r = divmod(i - 1, 26)
+            code = chr(65 + r) + code
+        ids.append(code)
+    return ids
+
+
+@lru_cache(maxsize=4)
+def _companies(n_companies, seed):
+    # Tabel company tetap (sama untuk semua blok) → atribut konsisten per company
+    rng = _rng(seed, 0, 1)
+    names = (
+        pd.Series(np.array(COMPANY_WORDS)[rng.integers(0, len(COMPANY_WORDS), n_companies)])
+        + np.array(COMPANY_SUFFIXES)[rng.integers(0, len(COMPANY_SUFFIXES), n_companies)]
+        + " " + pd.Series(_letter_ids(n_companies))
+    )
+    sectors = np.array(list(SECTORS))[rng.integers(0, len(SECTORS), n_companies)]
+    industries = [SECTORS[s][i % len(SECTORS[s])] for i, s in enumerate(sectors)]
+    return pd.DataFrame({
+        "company": names,
+        "company_rating": np.round(rng.uniform(2.5, 5.0, n_companies), 1),
+        "company_size": np.array(COMPANY_SIZES)[rng.integers(0, len(COMPANY_SIZES), n_companies)],
+        "company_type": np.array(COMPANY_TYPES)[rng.integers(0, len(COMPANY_TYPES), n_companies)],
+        "company_sector": sectors,
+        "company_industry": industries,
+        "company_founded": rng.integers(1900, 2022, n_companies).astype(float),
+        "company_revenue": np.array(REVENUES)[rng.integers(0, len(REVENUES), n_companies)],
+    })
+
+
+@lru_cache(maxsize=4)
+def _description_pool(size, seed):
+    return make_descriptions(size, seed).to_numpy()
+
+
+def recruitment_block(n, seed=42, block=0, total_rows=None, description_pool=5_000):
+    """
+    total_rows menentukan jumlah company & variasi description supaya
+    kardinalitas tumbuh bersama ukuran file (bukan ukuran blok).
+    """
+    total_rows = total_rows or n
+    rng = _rng(seed, block)
+    companies = _companies(max(20, total_rows // 25), seed)
+    descriptions = _description_pool(min(description_pool, max(100, total_rows)), seed)
+
+    rows = companies.iloc[rng.integers(0, len(companies), n)].reset_index(drop=True)
+    df = pd.DataFrame({"Unnamed: 0": np.arange(block * BLOCK_ROWS, block * BLOCK_ROWS + n)})
+
+    # Nama company kadang membawa rating di belakang ("Acme 12 4.2" / "Acme 12\n4.2")
+    rating_suffix = np.where(_mask(rng, n, 0.5), "\n", " ") + rows["company_rating"].astype(str)
+    df["company"] = rows["company"].where(_mask(rng, n, 0.6), rows["company"] + rating_suffix)
+    df.loc[_mask(rng, n, 0.005), "company"] = np.nan
+    df["company_rating"] = rows["company_rating"].mask(_mask(rng, n, 0.3))
+    df["location"] = np.array(LOCATIONS)[rng.integers(0, len(LOCATIONS), n)]
+    df["job_title"] = np.array(JOB_TITLES)[rng.integers(0, len(JOB_TITLES), n)]
+    df["job_description"] = descriptions[rng.integers(0, len(descriptions), n)]
+
+    hourly = _mask(rng, n, 0.2)
+    yearly = pd.Series(_with_commas(rng.integers(40, 220, n) * 1000), dtype=object)
+    per_hour = pd.Series(np.round(rng.uniform(15, 95, n), 2)).map("{:.2f}".format)
+    salary = ("$" + yearly + " /yr (est.)").where(~hourly, "$" + per_hour + " /hr (est.)")
+    df["salary_estimate"] = salary.mask(_mask(rng, n, 0.2))
+
+    for col in ["company_size", "company_type", "company_sector", "company_industry", "company_revenue"]:
+        df[col] = rows[col].mask(_mask(rng, n, 0.35))
+    df["company_founded"] = rows["company_founded"].mask(_mask(rng, n, 0.4))
+
+    dates = pd.Timestamp("2023-01-01") + pd.to_timedelta(rng.integers(0, 120, n), unit="D")
+    df["dates"] = pd.Series(dates.strftime("%Y-%m-%d"), dtype=object).mask(_mask(rng, n, 0.02))
+    return df
+
+
+GENERATORS = {
+    "products": product_block,
+    "recruitment": recruitment_block,
+}
+
+
+def generate(kind, rows, seed=42):
+    """Seluruh dataset sebagai satu DataFrame (untuk ukuran yang muat di memory)."""
+    return pd.concat(iter_blocks(kind, rows, seed), ignore_index=True)
+
+
+def iter_blocks(kind, rows, seed=42):
+    for block, start in enumerate(range(0, rows, BLOCK_ROWS)):
+        n = min(BLOCK_ROWS, rows - start)
+        if kind == "recruitment":
+            yield recruitment_block(n, seed, block, total_rows=rows)
+        else:
+            yield GENERATORS[kind](n, seed, block)
+
+
+def write_csv(kind, rows, path, seed=42):
+    """Tulis CSV per blok, jadi 10^7 row tidak perlu muat di memory sekaligus."""
+    for block, df in enumerate(iter_blocks(kind, rows, seed)):
+        df.to_csv(path, mode="w" if block == 0 else "a", header=block == 0, index=False)
+    return path
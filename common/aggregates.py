@@ -0,0 +1,283 @@
+"""
+Aggregat parsial yang bisa di-merge antar chunk/partisi.
+Dipakai demographi versi streaming supaya report tidak perlu frame gabungan.
+Setiap class punya update(chunk) untuk menambah data dan merge(other)
+untuk menggabungkan dua aggregat parsial.
+
+Memory state mode exact (tidak dibatasi ukuran chunk, tumbuh dengan jumlah row):
+    FrameProfile : hash row yang sudah terlihat, 8 byte per row unik
+    ColumnStore  : nilai kolom yang disimpan (numerik; teks sebagai kode
+                   categorical), untuk median / quantile / pd.cut exact
+    ValueCounter : satu entry per nilai distinct
+Untuk memory konstan pakai versi approximate (common/sketches.py).
+"""
+import numpy as np
+import pandas as pd
+
+from common.dedup import HashSet
+from common.profiling import memory_usage, categories_memory, hash_rows
+from common.sketches import HyperLogLog
+
+
+def _merge_dtype(a, b):
+    # Meniru dtype frame utuh: numerik → common type, categorical → gabungan
+    # categories (seperti read_csv sekali jalan), selain itu object
+    if a == b:
+        return a
+    if isinstance(a, pd.CategoricalDtype) and isinstance(b, pd.CategoricalDtype):
+        return pd.CategoricalDtype(a.categories.union(b.categories))
+    if pd.api.types.is_numeric_dtype(a) and pd.api.types.is_numeric_dtype(b):
+        try:
+            return np.result_type(a, b)
+        except TypeError:
+            pass
+    return np.dtype(object)
+
+
+def ranked_counts(values, dropna=True, sort=True):
+    """
+    value_counts dengan urutan tie deterministik: count terbanyak dulu, count
+    sama → urut kemunculan pertama (sort stable). value_counts() memakai sort
+    yang tidak stable, jadi urutan tie bisa beda antar dtype (numpy vs
+    pyarrow) dan antar versi pandas. sort=False → urut kemunculan pertama.
+    """
+    codes, uniques = pd.factorize(values, use_na_sentinel=dropna)
+    counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+    counts = pd.Series(counts, index=uniques, name="count", dtype="int64")
+    return counts.sort_values(ascending=False, kind="stable") if sort else counts
+
+
+def _codes_itemsize(n_categories):
+    # Lebar kode Categorical untuk n categories (int8 / int16 / int32 / int64)
+    for dtype in ("int8", "int16", "int32"):
+        if n_categories < np.iinfo(dtype).max:
+            return np.dtype(dtype).itemsize
+    return 8
+
+
+class FrameProfile:
+    """
+    Rows, missing per kolom, duplicate rows (via hash per row), memory, dtypes.
+    approximate=True: duplicate dihitung dari estimasi HyperLogLog (memory
+    konstan) dan basic_info() mendapat kolom Error.
+
+    Memory kolom categorical = kode per row + categories gabungan sekali
+    (seperti memory_usage frame utuh), bukan categories dihitung ulang tiap
+    chunk. Selisih kecil (<0.1%) dengan mode biasa tetap mungkin karena
+    layout buffer Arrow (mis. bitmap null yang dialokasikan atau tidak).
+    exclude: kolom chunk yang tidak diprofil (seperti DataProfile).
+    """
+
+    def __init__(self, approximate=False, exclude=()):
+        self.approximate = approximate
+        self.exclude = list(exclude)
+        self._distinct = HyperLogLog() if approximate else None
+        self.rows = 0
+        self.columns = []
+        self.missing = pd.Series(dtype="int64")
+        self.memory_bytes = 0
+        # Kolom categorical: (jumlah row, byte deep kalau gabungannya ternyata bukan categorical)
+        self.category_bytes = {}
+        self.dtypes = {}
+        self.duplicates = 0
+        self._seen_rows = HashSet()
+
+    def update(self, chunk):
+        self.rows += len(chunk)
+        columns = [c for c in chunk.columns if c not in self.exclude]
+        for col in columns:
+            if col not in self.dtypes:
+                self.columns.append(col)
+                self.dtypes[col] = chunk[col].dtype
+            else:
+                self.dtypes[col] = _merge_dtype(self.dtypes[col], chunk[col].dtype)
+        excluded = [c for c in chunk.columns if c in self.exclude]
+        self.missing = self.missing.add(chunk.isnull().sum().drop(excluded), fill_value=0).astype("int64")
+        memory = memory_usage(chunk).drop(excluded)
+        for col in columns:
+            if isinstance(chunk[col].dtype, pd.CategoricalDtype):
+                rows, deep = self.category_bytes.get(col, (0, 0))
+                self.category_bytes[col] = (rows + len(chunk), deep + int(memory[col]))
+                memory = memory.drop(col)
+        self.memory_bytes += int(memory.sum())
+
+        # Duplicate: row yang hash-nya sudah muncul di chunk ini atau chunk sebelumnya
+        hashes = hash_rows(chunk, columns).view("int64")
+        if self.approximate:
+            self._distinct.update_hashes(hashes)
+            return
+        dup = pd.Index(hashes).duplicated() | self._seen_rows.contains(hashes)
+        self.duplicates += int(dup.sum())
+        self._seen_rows.add(hashes[~dup])
+
+    def merge(self, other):
+        self.rows += other.rows
+        for col in other.columns:
+            if col not in self.dtypes:
+                self.columns.append(col)
+                self.dtypes[col] = other.dtypes[col]
+            else:
+                self.dtypes[col] = _merge_dtype(self.dtypes[col], other.dtypes[col])
+        self.missing = self.missing.add(other.missing, fill_value=0).astype("int64")
+        self.memory_bytes += other.memory_bytes
+        for col, (rows, deep) in other.category_bytes.items():
+            mine = self.category_bytes.get(col, (0, 0))
+            self.category_bytes[col] = (mine[0] + rows, mine[1] + deep)
+        if self.approximate:
+            self._distinct.merge(other._distinct)
+            return self
+        self.duplicates += other.duplicates + int(self._seen_rows.contains(other._seen_rows.keys).sum())
+        self._seen_rows.add(other._seen_rows.keys)
+        return self
+
+    def memory_usage(self):
+        memory = self.memory_bytes
+        for col, (rows, deep) in self.category_bytes.items():
+            categories = getattr(self.dtypes[col], "categories", None)
+            if categories is not None:
+                memory += rows * _codes_itemsize(len(categories)) + categories_memory(categories)
+            else:
+                # Categorical di sebagian chunk saja → kolom gabungan object
+                memory += deep
+        return memory
+
+    def basic_info(self):
+        duplicates, error = self.duplicates, 0
+        if self.approximate:
+            distinct = self._distinct.estimate()
+            duplicates = max(0, self.rows - int(round(distinct)))
+            error = int(np.ceil(self._distinct.error_bound(distinct)))
+        info = pd.DataFrame({
+            "Metric": [
+                "Total Rows", "Total Columns", "Missing Values",
+                "Duplicate Rows", "Memory Usage (KB)"
+            ],
+            "Value": [
+                self.rows,
+                len(self.columns),
+                int(self.missing.sum()),
+                duplicates,
+                round(self.memory_usage() / 1024, 2)
+            ]
+        })
+        if self.approximate:
+            info["Error"] = [0, 0, 0, error, 0]
+        return info
+
+    def data_types(self):
+        # Per nama dtype: setiap CategoricalDtype (kategori berbeda) tetap "category"
+        dtype_counts = pd.Series([str(self.dtypes[c]) for c in self.columns]).value_counts().reset_index()
+        dtype_counts.columns = ["Dtype", "Count"]
+        return dtype_counts
+
+    def missing_by_column(self):
+        miss = self.missing.reindex(self.columns, fill_value=0).reset_index()
+        miss.columns = ["Column", "Missing_Count"]
+        return miss
+
+    def numeric_columns(self):
+        return [c for c in self.columns if pd.api.types.is_numeric_dtype(self.dtypes[c])]
+
+
+class ValueCounter:
+    """
+    ranked_counts yang bisa di-merge. Missing value dihitung dengan key None
+    kalau dropna=False (NaN di to_frame, sama dengan ranked_counts). Urutan
+    sama dengan ranked_counts() frame gabungan: counts disimpan menurut
+    kemunculan pertama (dict urut insert, chunk diproses berurutan) lalu
+    di-sort stable.
+    """
+
+    def __init__(self, dropna=True):
+        self.dropna = dropna
+        self.counts = {}
+
+    def update(self, values):
+        for key, count in ranked_counts(values, self.dropna, sort=False).items():
+            key = None if pd.isna(key) else key
+            self.counts[key] = self.counts.get(key, 0) + int(count)
+
+    def merge(self, other):
+        for key, count in other.counts.items():
+            self.counts[key] = self.counts.get(key, 0) + count
+        return self
+
+    def to_frame(self, columns, n=None):
+        keys = list(self.counts)
+        counts = pd.Series(list(self.counts.values()), dtype="int64").sort_values(ascending=False, kind="stable")
+        if n is not None:
+            counts = counts.head(n)
+        values = [np.nan if keys[i] is None else keys[i] for i in counts.index]
+        return pd.DataFrame({columns[0]: values, columns[1]: counts.to_numpy()})
+
+
+class ColumnStore:
+    """
+    Simpan nilai beberapa kolom untuk statistik exact yang tidak bisa di-merge
+    dari ringkasan: median, quantile, pd.cut, median per group. Memory O(row):
+    kolom numerik disimpan apa adanya, kolom teks sebagai categorical (kode
+    int + nilai unik sekali per chunk) dan dikembalikan ke dtype aslinya di
+    frame().
+    """
+
+    def __init__(self):
+        self.parts = []
+        self.encoded = {}
+
+    def update(self, chunk, columns):
+        part = chunk[columns].reset_index(drop=True)
+        for col in columns:
+            dtype = part[col].dtype
+            if col in self.encoded or not (pd.api.types.is_numeric_dtype(dtype)
+                                           or isinstance(dtype, pd.CategoricalDtype)):
+                self.encoded.setdefault(col, dtype)
+                part[col] = part[col].astype("category")
+        self.parts.append(part)
+
+    def merge(self, other):
+        for col, dtype in other.encoded.items():
+            self.encoded.setdefault(col, dtype)
+        self.parts.extend(other.parts)
+        return self
+
+    def frame(self):
+        if not self.parts:
+            return pd.DataFrame()
+        frame = pd.concat(self.parts, ignore_index=True)
+        for col, dtype in self.encoded.items():
+            if col in frame.columns:
+                frame[col] = frame[col].astype(dtype)
+        return frame
+
+
+class RunningTop:
+    """
+    Row dengan nilai terbesar (idxmax / nlargest) yang di-update per chunk.
+    Tie dimenangkan row yang muncul lebih dulu, sama seperti nlargest(keep="first").
+    """
+
+    def __init__(self, column, n=1, keep_columns=None):
+        self.column = column
+        self.n = n
+        self.keep_columns = keep_columns
+        self.rows = None
+
+    def update(self, chunk):
+        cols = self.keep_columns or list(chunk.columns)
+        top = chunk[chunk[self.column].notna()].nlargest(self.n, self.column)[cols]
+        self._combine(top)
+
+    def merge(self, other):
+        if other.rows is not None:
+            self._combine(other.rows)
+        return self
+
+    def _combine(self, top):
+        if self.rows is None:
+            self.rows = top
+        else:
+            both = pd.concat([self.rows, top], ignore_index=True)
+            self.rows = both.nlargest(self.n, self.column)
+
+    def frame(self):
+        return self.rows
@@ -0,0 +1,281 @@
+"""
+Cache hasil transform per row untuk mode incremental.
+
+Setiap row input di-fingerprint (hash isi row mentah). Hasil transform per row
+disimpan di <cache_dir>/<name>/<version>/ dengan index = hash row, jadi run
+berikutnya hanya men-transform row yang baru/berubah, lalu digabung dengan
+hasil cache sesuai urutan input. Langkah global (dedup, imputasi, fill per
+company) tetap dijalankan ulang oleh pemanggil di frame gabungan.
+
+`version` = hash source code transform (fungsi row + semua modul repo yang
+dipakainya, lihat code_version) + kolom/dtype input; kalau berubah, cache
+lama tidak dipakai dan dihapus.
+
+Eviction: row yang tidak muncul di `keep_runs` run terakhir dibuang, lalu
+kalau masih lebih dari `max_rows`, row yang paling lama tidak terlihat
+dibuang duluan.
+"""
+import ast
+import hashlib
+import inspect
+import json
+import os
+import shutil
+import sys
+
+import numpy as np
+import pandas as pd
+
+from common.instrumentation import stage
+from common.parallel import map_partitions, concat_partitions
+
+_LAST_SEEN = "_last_seen"
+
+# Modul di bawah folder ini (common/, data_*/) ikut di-hash; library tidak
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Nilai global yang dipakai fungsi (pattern regex, list kolom, ...) ikut di-hash
+_CONSTANTS = (str, bytes, int, float, bool, tuple, list, dict, set, frozenset, type(None))
+
+
+def _repo_module(obj):
+    name = obj.__name__ if inspect.ismodule(obj) else getattr(obj, "__module__", None)
+    path = getattr(sys.modules.get(name or ""), "__file__", None)
+    if path and os.path.abspath(path).startswith(REPO_ROOT + os.sep) and "site-packages" not in path:
+        return sys.modules[name]
+    return None
+
+
+def _code_names(code):
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if inspect.iscode(const):
+            names |= _code_names(const)
+    return names
+
+
+def _imports(module):
+    """Nama modul yang di-import module (termasuk `from x import konstanta`)."""
+    for node in ast.walk(ast.parse(inspect.getsource(module))):
+        if isinstance(node, ast.Import):
+            yield from (alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            yield node.module
+            yield from (f"{node.module}.{alias.name}" for alias in node.names)
+
+
+def _add_module(module, modules):
+    """module + semua modul repo yang di-import-nya (rekursif)."""
+    if module.__name__ in modules:
+        return
+    modules[module.__name__] = module
+    for name in _imports(module):
+        dep = sys.modules.get(name)
+        if dep is not None and _repo_module(dep) is not None:
+            _add_module(dep, modules)
+
+
+def _add_function(func, parts, modules, seen):
+    """
+    Source func + nama global yang dipakainya: fungsi di modul yang sama
+    diikuti per fungsi (edit report di modul transform tidak membuang cache
+    row), objek dari modul repo lain → seluruh modul itu beserta importnya.
+    """
+    if func in seen:
+        return
+    seen.add(func)
+    parts.append(inspect.getsource(func))
+    for name in sorted(_code_names(func.__code__)):
+        if name not in func.__globals__:
+            continue
+        value = func.__globals__[name]
+        if isinstance(value, _CONSTANTS):
+            parts.append(f"{name} = {value!r}")
+        elif inspect.isfunction(value) and value.__module__ == func.__module__:
+            _add_function(value, parts, modules, seen)
+        elif inspect.ismodule(value) or inspect.isfunction(value) or inspect.isclass(value):
+            dep = _repo_module(value)
+            if dep is not None:
+                _add_module(dep, modules)
+
+
+def code_modules(*objects):
+    """Nama modul repo yang source-nya ikut di code_version(*objects)."""
+    return sorted(_collect(objects)[1])
+
+
+def _collect(objects):
+    parts, modules, seen = [], {}, set()
+    for obj in objects:
+        if inspect.ismodule(obj):
+            _add_module(obj, modules)
+        else:
+            _add_function(obj, parts, modules, seen)
+    return parts, modules
+
+
+def code_version(*objects):
+    """
+    Hash source code yang menentukan hasil transform: fungsi (beserta fungsi
+    & konstanta di modulnya yang dipakai) dan setiap modul repo yang
+    dipakainya, termasuk import tidak langsung (mis. normalize → common.dates).
+    """
+    parts, modules = _collect(objects)
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+    for name in sorted(modules):
+        digest.update(name.encode("utf-8"))
+        digest.update(inspect.getsource(modules[name]).encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def frame_version(code, df):
+    digest = hashlib.sha256(code.encode("utf-8"))
+    digest.update(json.dumps([[str(c), str(t)] for c, t in df.dtypes.items()]).encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def row_hashes(df):
+    return pd.Series(pd.util.hash_pandas_object(df, index=False).to_numpy(), index=df.index)
+
+
+class RowCache:
+    """
+    rows    : DataFrame hasil transform, index = hash row input, + kolom _last_seen
+    dropped : hash row input yang dibuang transform (mis. company kosong) → run ke-berapa terakhir terlihat
+    """
+
+    def __init__(self, cache_dir, name, keep_runs=3, max_rows=None):
+        self.root = os.path.join(cache_dir, name)
+        self.keep_runs = keep_runs
+        self.max_rows = max_rows
+        self.version = None
+        self.run = 0
+        self.rows = None
+        self.dropped = pd.Series(dtype="int64")
+
+    @property
+    def directory(self):
+        return os.path.join(self.root, self.version)
+
+    def load(self, version):
+        self.version = version
+        meta_path = os.path.join(self.directory, "meta.json")
+        if not os.path.exists(meta_path):
+            return self
+        with open(meta_path, encoding="utf-8") as f:
+            self.run = json.load(f)["run"]
+        self.rows = pd.read_pickle(os.path.join(self.directory, "rows.pkl"))
+        self.dropped = pd.read_pickle(os.path.join(self.directory, "dropped.pkl"))
+        return self
+
+    def save(self):
+        # Versi lain (kode/schema lama) tidak akan dipakai lagi
+        if os.path.isdir(self.root):
+            for entry in os.listdir(self.root):
+                if entry != self.version:
+                    shutil.rmtree(os.path.join(self.root, entry), ignore_errors=True)
+        os.makedirs(self.directory, exist_ok=True)
+        self.evict()
+        if self.rows is not None:
+            self.rows.to_pickle(os.path.join(self.directory, "rows.pkl"))
+        self.dropped.to_pickle(os.path.join(self.directory, "dropped.pkl"))
+        with open(os.path.join(self.directory, "meta.json"), "w", encoding="utf-8") as f:
+            json.dump({"run": self.run, "rows": 0 if self.rows is None else len(self.rows),
+                       "dropped": len(self.dropped)}, f)
+
+    def evict(self):
+        oldest = self.run - self.keep_runs + 1
+        if self.rows is not None:
+            rows = self.rows[self.rows[_LAST_SEEN] >= oldest]
+            if self.max_rows is not None and len(rows) > self.max_rows:
+                rows = rows.sort_values(_LAST_SEEN, kind="stable").iloc[-self.max_rows:]
+            self.rows = rows
+        self.dropped = self.dropped[self.dropped >= oldest]
+
+    def known(self, hashes):
+        cached = self.rows.index if self.rows is not None else pd.Index([], dtype="uint64")
+        return hashes.isin(cached) | hashes.isin(self.dropped.index)
+
+    def update(self, hashes, new_rows, new_dropped):
+        """
+        hashes: hash semua row input run ini. new_rows: hasil transform row
+        baru (index = hash). new_dropped: hash row baru yang dibuang transform.
+        """
+        self.run += 1
+        seen = pd.Index(hashes.unique())
+        if self.rows is not None:
+            self.rows.loc[self.rows.index.isin(seen), _LAST_SEEN] = self.run
+        self.dropped.loc[self.dropped.index.isin(seen)] = self.run
+
+        if len(new_rows):
+            new_rows = new_rows.assign(**{_LAST_SEEN: self.run})
+            self.rows = new_rows if self.rows is None else concat_partitions([self.rows, new_rows])
+        if len(new_dropped):
+            self.dropped = pd.concat([self.dropped, pd.Series(self.run, index=new_dropped, dtype="int64")])
+
+
+def _restore_categories(out, raw):
+    """
+    Categories setelah merge disamakan dengan run penuh: kolom categorical dari
+    input → dtype input; kolom categorical hasil transform → nilai yang ada,
+    diurutkan (sama dengan astype("category")).
+    """
+    for col in out.columns:
+        if not isinstance(out[col].dtype, pd.CategoricalDtype):
+            continue
+        if col in raw.columns and isinstance(raw[col].dtype, pd.CategoricalDtype):
+            out[col] = out[col].astype(raw[col].dtype)
+        else:
+            out[col] = out[col].cat.remove_unused_categories()
+    return out
+
+
+def cached_transform(row_func, df, cache, code, workers=None, partition_rows=None):
+    """
+    row_func(df) hanya untuk row baru/berubah, sisanya dari cache.
+    Hasil: frame yang sama dengan row_func(df) (index, urutan, dtype).
+    """
+    if not df.index.is_unique:
+        raise ValueError("Mode incremental butuh index input yang unik")
+
+    with stage("fingerprint", rows_in=len(df)):
+        hashes = row_hashes(df)
+        cache.load(frame_version(code, df))
+        known = cache.known(hashes)
+
+    delta = df[~known]
+    # row_func boleh mengubah/membuang row delta in-place; simpan index awalnya
+    delta_index = delta.index
+    print(f"[INFO] Incremental: {len(delta)} row baru/berubah, {int(known.sum())} row dari cache")
+    if cache.rows is None or len(delta):
+        with stage("transform_delta", rows_in=len(delta)) as rec:
+            out_delta = map_partitions(row_func, delta, workers, partition_rows)
+            rec["rows_out"] = len(out_delta)
+        new_rows = out_delta.set_axis(hashes.loc[out_delta.index].to_numpy())
+        new_rows = new_rows[~new_rows.index.duplicated()]
+        new_dropped = np.unique(hashes.loc[delta_index.difference(out_delta.index)].to_numpy())
+    else:
+        out_delta = None
+        new_rows = cache.rows.iloc[:0].drop(columns=_LAST_SEEN)
+        new_dropped = np.array([], dtype="uint64")
+
+    if cache.rows is None:
+        # Cache kosong → hasil row_func sudah lengkap
+        out = out_delta
+    else:
+        with stage("merge_cache", rows_in=len(df)) as rec:
+            table = cache.rows.drop(columns=_LAST_SEEN)
+            if len(new_rows):
+                table = concat_partitions([table, new_rows])
+            dropped = cache.dropped.index.append(pd.Index(new_dropped))
+            kept = hashes[~hashes.isin(dropped)]
+            out = table.reindex(kept.to_numpy()).set_axis(kept.index)
+            out = _restore_categories(out, df)
+            rec["rows_out"] = len(out)
+
+    with stage("save_cache"):
+        cache.update(hashes, new_rows, new_dropped)
+        cache.save()
+    return out
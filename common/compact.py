@@ -0,0 +1,74 @@
+"""
+Representasi ringkas untuk kolom string berat.
+
+split_url: URL dipecah jadi bagian yang sama di banyak row (host, path
+gambar, suffix ukuran) sebagai categorical + ID per row yang pendek, mis.
+
+    https://m.media-amazon.com/images/I/715B2hG++tL._AC_UL320_.jpg
+    → base "https://m.media-amazon.com/images/I/", id "715B2hG++tL", suffix "._AC_UL320_.jpg"
+
+Bagian yang tidak ditangkap regex (slug, query ref=/qid= yang berubah tiap
+crawl) dibuang. URL yang tidak cocok pattern disimpan utuh di base dengan id
+NaN, jadi join_url tetap mengembalikan URL aslinya.
+
+dictionary_encode: kolom teks dengan sedikit nilai unik → categorical
+(setiap nilai unik disimpan sekali, row hanya menyimpan kode int).
+"""
+import re
+
+import pandas as pd
+from common.schema import HAS_PYARROW, STRING_DTYPE
+
+
+def extract(values, pattern):
+    """
+    Seperti Series.str.extract (named group → kolom string), tapi memakai
+    regex C++ pyarrow kalau ter-install: untuk jutaan URL unik jauh lebih
+    cepat dari loop regex Python di balik str.extract.
+    """
+    if not HAS_PYARROW:
+        return values.astype("string").str.extract(pattern).astype(STRING_DTYPE)
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    parts = pc.extract_regex(pa.array(values, type=pa.string(), from_pandas=True), pattern)
+    return pd.DataFrame({
+        name: pd.Series(pc.struct_field(parts, name), dtype=STRING_DTYPE, index=values.index)
+        for name in re.compile(pattern).groupindex
+    })
+
+
+def split_url(urls, pattern, base_pattern):
+    """
+    pattern: regex (tidak di-anchor) dengan named group `id` + group opsional
+    lain (mis. `suffix`); base_pattern: regex dengan group `base`. Dua regex
+    sederhana terpisah, bukan satu regex dengan prefix `.*`, supaya tidak ada
+    backtracking. Return DataFrame [base, id, ...]; selain id → categorical.
+    """
+    # Regex hanya dijalankan sekali per URL unik
+    codes, uniques = pd.factorize(urls)
+    uniques = pd.Series(uniques, dtype=STRING_DTYPE)
+    parts = extract(uniques, pattern)
+    parts.insert(0, "base", extract(uniques, base_pattern)["base"])
+    unmatched = parts["id"].isna() & uniques.notna()
+    parts["base"] = parts["base"].mask(unmatched, uniques)
+    out = {
+        col: (parts[col].array if col == "id" else pd.Categorical(parts[col])).take(codes, allow_fill=True)
+        for col in parts.columns
+    }
+    return pd.DataFrame(out, index=urls.index)
+
+
+def join_url(base, ids, sep="", suffix=None):
+    """Kebalikan split_url: base + sep + id + suffix (row tanpa id → base saja)."""
+    base = base.astype("string")
+    url = base + sep + ids.astype("string")
+    if suffix is not None:
+        url = url + suffix.astype("string").fillna("")
+    return url.fillna(base)
+
+
+def dictionary_encode(df, columns):
+    for col in columns:
+        if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype("category")
+    return df
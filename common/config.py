@@ -0,0 +1,26 @@
+"""
+Path file input. Urutan prioritas: environment variable dengan nama yang sama
+(mis. PATH_FILE_PRODUCTS), lalu config/config.py kalau ada, lalu default.
+config/config.py tidak ikut di repo, jadi entry point tetap bisa jalan tanpa
+file itu selama path diberikan lewat env / argumen.
+"""
+import os
+
+DEFAULTS = {
+    "PATH_FILE_PRODUCTS": "dataset/All Exercise and Fitness.csv",
+}
+
+
+def get_path(name):
+    value = os.environ.get(name)
+    if value:
+        return value
+    try:
+        from config import config
+    except ImportError:
+        config = None
+    value = getattr(config, name, None) or DEFAULTS.get(name)
+    if value is None:
+        raise RuntimeError(f"{name} belum diatur: set environment variable {name} "
+                           f"atau buat config/config.py (lihat README)")
+    return value
@@ -0,0 +1,140 @@
+"""
+Runner DAG kecil untuk pipeline: setiap pipeline = kumpulan Task dengan
+dependency, hasil task disimpan di memory dan diberikan ke task berikutnya
+sebagai argumen (tidak ditulis/dibaca ulang dari disk).
+
+    dag = Dag("products")
+    dag.task("extract", lambda: extract_product(path), resource="io")
+    dag.task("transform", lambda extract: transform_product(extract), deps=["extract"])
+
+    run_dags([dag], max_workers=4, limits={"cpu": 2, "io": 2})
+
+Task yang dependency-nya sudah selesai langsung dijalankan di thread pool,
+jadi task independen (mis. profiling & transform) dan pipeline yang berbeda
+berjalan bersamaan. `limits` membatasi jumlah task per resource yang jalan
+bersamaan (mis. cpu=1 supaya dua transform berat tidak berebut core).
+Task yang gagal menghentikan task turunannya saja; pipeline lain tetap jalan.
+"""
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+from common.instrumentation import stage
+
+DONE, FAILED, SKIPPED = "done", "failed", "skipped"
+
+
+class Task:
+
+    def __init__(self, name, func, deps=(), resource="cpu", optional=False):
+        self.name = name
+        self.func = func
+        self.deps = list(deps)
+        self.resource = resource
+        # optional=True: boleh di-skip; task turunan menerima None sebagai hasilnya
+        self.optional = optional
+
+
+class Dag:
+
+    def __init__(self, name):
+        self.name = name
+        self.tasks = {}
+
+    def task(self, name, func, deps=(), resource="cpu", optional=False):
+        missing = [d for d in deps if d not in self.tasks]
+        if missing:
+            raise ValueError(f"{self.name}/{name}: dependency belum didefinisikan: {missing}")
+        self.tasks[name] = Task(name, func, deps, resource, optional)
+        return self.tasks[name]
+
+    def skip(self, names):
+        """Tandai task yang tidak dijalankan; hanya task optional yang boleh di-skip."""
+        for name in names:
+            if name not in self.tasks:
+                continue
+            if not self.tasks[name].optional:
+                raise ValueError(f"Stage {self.name}/{name} tidak bisa di-skip")
+            self.tasks[name].func = None
+        return self
+
+
+def run_dags(dags, max_workers=4, limits=None):
+    """
+    Jalankan semua DAG bersamaan. Return {pipeline: {task: status}} dan
+    {pipeline: {task: hasil}} (hanya hasil task akhir; hasil antara dilepas
+    begitu semua task turunannya sudah mulai). Detail error dicetak ke stdout.
+    """
+    limits = limits or {}
+    semaphores = {resource: threading.Semaphore(n) for resource, n in limits.items()}
+    status = {dag.name: {} for dag in dags}
+    results = {dag.name: {} for dag in dags}
+    pending = {(dag.name, name): task for dag in dags for name, task in dag.tasks.items()}
+
+    def execute(pipeline, task, inputs):
+        semaphore = semaphores.get(task.resource)
+        if semaphore is not None:
+            semaphore.acquire()
+        try:
+            started = time.perf_counter()
+            with stage(f"{pipeline}/{task.name}"):
+                result = task.func(**inputs)
+            print(f"[INFO] {pipeline}/{task.name} selesai ({time.perf_counter() - started:.2f}s)")
+            return result
+        finally:
+            if semaphore is not None:
+                semaphore.release()
+
+    def ready(pipeline, task):
+        states = [status[pipeline].get(d) for d in task.deps]
+        if any(s is None for s in states):
+            return None
+        return all(s in (DONE, SKIPPED) for s in states)
+
+    # Jumlah task yang masih butuh hasil sebuah task; 0 → hasil dilepas dari memory
+    consumers = {(dag.name, name): 0 for dag in dags for name in dag.tasks}
+    for (pipeline, _), task in pending.items():
+        for dep in task.deps:
+            consumers[(pipeline, dep)] += 1
+
+    def release(pipeline, task):
+        for dep in task.deps:
+            consumers[(pipeline, dep)] -= 1
+            if not consumers[(pipeline, dep)]:
+                results[pipeline].pop(dep, None)
+
+    running = {}
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="dag") as pool:
+        while pending or running:
+            for key, task in list(pending.items()):
+                pipeline, name = key
+                ok = ready(pipeline, task)
+                if ok is None:
+                    continue
+                del pending[key]
+                if not ok:
+                    status[pipeline][name] = FAILED
+                    print(f"[WARN] {pipeline}/{name} tidak dijalankan: dependency gagal")
+                    release(pipeline, task)
+                elif task.func is None:
+                    status[pipeline][name] = SKIPPED
+                    results[pipeline][name] = None
+                    release(pipeline, task)
+                else:
+                    inputs = {d: results[pipeline][d] for d in task.deps}
+                    running[pool.submit(execute, pipeline, task, inputs)] = key
+                    release(pipeline, task)
+            if not running:
+                # Status baru dari task skip/gagal bisa membuka task lain; cek ulang
+                continue
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                pipeline, name = running.pop(future)
+                try:
+                    results[pipeline][name] = future.result()
+                    status[pipeline][name] = DONE
+                except Exception:
+                    status[pipeline][name] = FAILED
+                    print(f"[ERROR] {pipeline}/{name} gagal:\n{traceback.format_exc()}")
+    return status, results
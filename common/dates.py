@@ -0,0 +1,73 @@
+"""
+Parsing kolom tanggal tanpa inferensi format per nilai.
+
+DateParser mendeteksi format dari sampel nilai unik (sekali per panggilan
+parse), lalu mem-parse dengan format itu secara eksplisit (jalur cepat C di
+pandas). Nilai yang gagal di-parse memicu deteksi ulang pada sisanya, jadi
+feed dengan format campuran cukup beberapa pass vectorized. Parsing hanya
+dijalankan untuk nilai unik lalu dipetakan balik ke setiap row.
+
+Tidak ada state antar panggilan: hasil parse hanya bergantung pada nilai
+batch itu sendiri, bukan pada batch/chunk/run yang di-parse sebelumnya
+(tanggal ambigu seperti 03/04/2023 tidak bisa berubah arti karena format
+yang kebetulan ter-cache lebih dulu). Deteksi hanya memeriksa `sample` nilai
+unik per format, jadi biayanya kecil dibanding parse-nya.
+"""
+import pandas as pd
+
+# Kandidat format, urut prioritas kalau jumlah nilai yang cocok sama
+DATE_FORMATS = [
+    "%Y-%m-%d",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%dT%H:%M:%S%z",
+    "%Y-%m-%dT%H:%M:%S.%f%z",
+    "%Y/%m/%d",
+    "%m/%d/%Y",
+    "%d/%m/%Y",
+    "%d-%m-%Y",
+    "%b %d, %Y",
+    "%d %b %Y",
+    "%B %d, %Y",
+    "%d %B %Y",
+]
+
+
+def _parse(values, fmt):
+    # Offset timezone → UTC lalu tanpa tz, supaya satu dtype datetime64[ns]
+    return pd.to_datetime(values, format=fmt, errors="coerce", utc=True).dt.tz_localize(None)
+
+
+class DateParser:
+
+    def __init__(self, formats=DATE_FORMATS, sample=500):
+        self.formats = list(formats)
+        self.sample = sample
+
+    def detect(self, values):
+        """Format dengan jumlah nilai cocok terbanyak di sampel; None kalau tidak ada yang cocok."""
+        sample = values.iloc[:self.sample]
+        best, best_count = None, 0
+        for fmt in self.formats:
+            count = _parse(sample, fmt).notna().sum()
+            if count > best_count:
+                best, best_count = fmt, count
+        return best
+
+    def parse(self, values):
+        """Series string → Series datetime64[ns] (NaT kalau tidak cocok format mana pun)."""
+        codes, uniques = pd.factorize(values)
+        uniques = pd.Series(uniques, dtype="string").str.strip()
+        result = pd.Series(pd.NaT, index=uniques.index, dtype="datetime64[ns]")
+        remaining = uniques.notna() & (uniques != "")
+
+        tried = set()
+        while remaining.any():
+            fmt = self.detect(uniques[remaining].drop_duplicates())
+            if fmt is None or fmt in tried:
+                break
+            tried.add(fmt)
+            result[remaining] = _parse(uniques[remaining], fmt)
+            remaining &= result.isna()
+
+        return pd.Series(result.array.take(codes, allow_fill=True), index=values.index, name=values.name)
@@ -0,0 +1,416 @@
+"""
+Dedup berbasis hash yang bisa dijalankan per chunk / per file / antar run.
+
+Setiap rule mengubah row jadi key (mis. nama ternormalisasi, ID produk), key
+di-hash jadi int64, lalu dicek ke HashSet: array int64 terurut (8 byte per
+key, jauh lebih kecil dari set string). Row yang key-nya sudah terlihat di
+chunk sebelumnya atau muncul lebih dulu di chunk yang sama dibuang, jadi
+hasilnya sama dengan drop_duplicates(keep="first") di frame utuh.
+
+Rule dijalankan berurutan; jumlah row yang dibuang dicatat per rule.
+Opsional: near-duplicate dengan MinHash/LSH (MinHashLSH) pada token teks.
+State bisa disimpan ke file .npz dan dipakai lagi di run berikutnya.
+
+Re-run: setiap key di state dicatat bersama run yang menambahkannya
+(run_id, mis. fingerprint file input). Key milik run_id yang sama tidak
+dianggap sudah terlihat, jadi memproses ulang feed yang sama menghasilkan
+row yang sama (state run itu diganti), sedangkan key dari run lain tetap
+membuang duplikatnya. State dibatasi window keep_runs run terakhir dan
+max_keys key per rule (run terlama dibuang duluan).
+"""
+import os
+import uuid
+
+import numpy as np
+import pandas as pd
+
+
+def hash_keys(values):
+    """Series/array → hash 64-bit (int64) per nilai."""
+    return pd.util.hash_array(np.asarray(values, dtype=object)).view("int64")
+
+
+def run_tag(run_id=None):
+    """run_id → tag int64 di state; None → tag unik (setiap run dianggap run baru)."""
+    return int(hash_keys([uuid.uuid4().hex if run_id is None else str(run_id)])[0])
+
+
+def retain(tags, runs, capacity=None):
+    """
+    Mask entry state yang disimpan: run-nya (tags) masih ada di runs (urut
+    terlama → terbaru); kalau lebih dari capacity, entry run terlama dibuang
+    duluan.
+    """
+    keep = np.isin(tags, runs)
+    if capacity is not None and keep.sum() > capacity:
+        rank = pd.Index(runs).get_indexer(tags)
+        order = np.argsort(rank, kind="stable")
+        order = order[keep[order]]
+        keep[order[:len(order) - capacity]] = False
+    return keep
+
+
+def first_seen(keys, seen):
+    """
+    Mask row yang key-nya baru: belum ada di `seen` dan kemunculan pertama
+    di `keys`.
+    """
+    return ~(seen.contains(keys) | pd.Index(keys).duplicated(keep="first"))
+
+
+class HashSet:
+    """Set int64 terurut; contains() pakai binary search (np.searchsorted)."""
+
+    def __init__(self, keys=None):
+        self.keys = np.unique(np.asarray(keys, dtype="int64")) if keys is not None else np.empty(0, "int64")
+
+    def __len__(self):
+        return len(self.keys)
+
+    def contains(self, hashes):
+        hashes = np.asarray(hashes, dtype="int64")
+        if not len(self.keys):
+            return np.zeros(len(hashes), dtype=bool)
+        pos = np.searchsorted(self.keys, hashes).clip(max=len(self.keys) - 1)
+        return self.keys[pos] == hashes
+
+    def add(self, hashes):
+        # Sisipkan key baru ke posisinya (O(n) salin), bukan sort ulang semua key seperti union1d
+        new = np.unique(np.asarray(hashes, dtype="int64"))
+        new = new[~self.contains(new)]
+        self.keys = np.insert(self.keys, np.searchsorted(self.keys, new), new)
+
+
+class MinHashLSH:
+    """
+    Near-duplicate untuk teks pendek (nama produk): shingle = pasangan kata
+    berurutan, signature MinHash `bands * rows` nilai (uint32), dipecah jadi
+    `bands` band. Row yang punya band identik dengan row sebelumnya jadi
+    kandidat, lalu diverifikasi dari signature: duplikat kalau estimasi
+    containment (irisan / shingle teks terpendek) >= threshold dan Jaccard
+    >= jaccard. Containment supaya nama terpotong ("...") tetap cocok dengan
+    nama lengkapnya; Jaccard supaya nama pendek yang hanya jadi bagian dari
+    nama lain (mis. beda merek di depan) tidak ikut dibuang.
+
+    groups (opsional, per row): ID yang sudah diketahui (mis. ASIN, di-hash);
+    dua row dengan group berbeda tidak pernah dianggap duplikat. 0 = tidak
+    diketahui.
+
+    Hanya row yang disimpan (bukan duplikat) yang jadi pemilik band, jadi
+    tidak ada rantai A ← B ← C di mana C dibuang karena mirip B yang sudah
+    dibuang.
+
+    State antar chunk: hash band + id pemilik (bands x 16 byte), signature
+    (bands x rows x 4 byte), group & tag run (8 byte) per row. retain()
+    membuang row duplikat dan row run lain dari state.
+    """
+
+    # Putaran maksimal untuk memilih ulang pemilik band di dalam satu chunk
+    MAX_PASSES = 8
+
+    def __init__(self, bands=20, rows=4, threshold=0.9, jaccard=0.5, seed=1, block_shingles=100_000):
+        self.bands = bands
+        self.rows = rows
+        self.threshold = threshold
+        self.jaccard = jaccard
+        self.block_shingles = block_shingles
+        rng = np.random.default_rng(seed)
+        perms = bands * rows
+        # Hash universal multiply-shift: ((a * x + b) mod 2^64) >> 32, a ganjil
+        self.a = rng.integers(1, 2**63, size=perms, dtype="uint64") | np.uint64(1)
+        self.b = rng.integers(0, 2**63, size=perms, dtype="uint64")
+        self.mix = rng.integers(1, 2**63, size=rows, dtype="uint64") | np.uint64(1)
+        self.salt = rng.integers(0, 2**63, size=bands, dtype="uint64")
+        # Band key terurut → id row pertama yang punya key itu
+        self.keys = np.empty(0, dtype="int64")
+        self.owners = np.empty(0, dtype="int64")
+        self.signatures = np.empty((0, perms), dtype="uint32")
+        self.sizes = np.empty(0, dtype="int64")
+        self.groups = np.empty(0, dtype="int64")
+        # Run yang menambahkan row (lihat Deduplicator) & row yang disimpan (bukan duplikat)
+        self.tag = 0
+        self.tags = np.empty(0, dtype="int64")
+        self.kept = np.empty(0, dtype=bool)
+        self.count = 0
+
+    def _shingles(self, texts):
+        # Token per teks → (posisi row, hash shingle), urut per row
+        tokens = texts.reset_index(drop=True).str.split().explode()
+        tokens = tokens[tokens.notna()]
+        row = tokens.index.to_numpy()
+        words = tokens.to_numpy(dtype=object)
+        if not len(row):
+            return row.astype("int64"), np.empty(0, dtype="uint64")
+        same_row = np.append(row[1:] == row[:-1], False)
+        # Pasangan kata; kata terakhir dipakai sendiri hanya kalau teksnya satu kata
+        single = ~same_row & np.append(True, ~same_row[:-1])
+        keep = same_row | single
+        pairs = np.where(same_row, words + " " + np.append(words[1:], ""), words)
+        return row[keep], hash_keys(pairs[keep]).view("uint64")
+
+    def signature(self, texts):
+        """(signature (n, bands*rows) uint32, jumlah shingle per row); row tanpa token → 0 shingle."""
+        rows, hashes = self._shingles(texts.fillna(""))
+        signature = np.zeros((len(texts), len(self.a)), dtype="uint32")
+        sizes = np.bincount(rows, minlength=len(texts)).astype("int64")
+        if not len(rows):
+            return signature, sizes
+        starts = np.flatnonzero(np.append(True, rows[1:] != rows[:-1]))
+        ends = np.append(starts[1:], len(hashes))
+        # Diproses per blok row supaya matrix (shingle x permutasi) tetap kecil
+        step = max(1, self.block_shingles * len(starts) // len(hashes))
+        for i in range(0, len(starts), step):
+            lo, hi = starts[i], ends[min(i + step, len(starts)) - 1]
+            permuted = (hashes[lo:hi, None] * self.a + self.b) >> np.uint64(32)
+            block = np.minimum.reduceat(permuted, starts[i:i + step] - lo, axis=0)
+            signature[rows[starts[i:i + step]]] = block.astype("uint32")
+        return signature, sizes
+
+    def band_keys(self, signature):
+        bands = signature.reshape(len(signature), self.bands, self.rows).astype("uint64")
+        return ((bands * self.mix).sum(axis=2) ^ self.salt).view("int64")
+
+    def _append(self, signature, sizes, groups):
+        # Kapasitas dilipatgandakan supaya append per chunk tidak menyalin semua state
+        needed = self.count + len(sizes)
+        if needed > len(self.sizes):
+            capacity = max(needed, 2 * len(self.sizes), 1024)
+            self.signatures = np.resize(self.signatures, (capacity, self.signatures.shape[1]))
+            self.sizes = np.resize(self.sizes, capacity)
+            self.groups = np.resize(self.groups, capacity)
+            self.tags = np.resize(self.tags, capacity)
+            self.kept = np.resize(self.kept, capacity)
+        self.signatures[self.count:needed] = signature
+        self.sizes[self.count:needed] = sizes
+        self.groups[self.count:needed] = groups
+        self.tags[self.count:needed] = self.tag
+        self.kept[self.count:needed] = False
+        self.count = needed
+
+    def _verify(self, candidates, ids):
+        """Mask row yang lolos verifikasi dengan salah satu kandidatnya (id row lain, -1 = tidak ada)."""
+        row, band = np.nonzero(candidates >= 0)
+        # Pasangan yang sama dari beberapa band cukup dicek sekali
+        pairs = np.unique(np.stack([ids[row], candidates[row, band]], axis=1), axis=0)
+        this, other = pairs[:, 0], pairs[:, 1]
+        match = (self.signatures[other] == self.signatures[this]).mean(axis=1)
+        # Jaccard → ukuran irisan → containment terhadap teks yang lebih pendek
+        a, b = self.sizes[this], self.sizes[other]
+        shared = match * (a + b) / (1 + match)
+        g, h = self.groups[this], self.groups[other]
+        ok = ((shared / np.minimum(a, b) >= self.threshold) & (match >= self.jaccard)
+              & ((g == 0) | (h == 0) | (g == h)))
+        dup = np.zeros(len(ids), dtype=bool)
+        dup[this[ok] - (self.count - len(ids))] = True
+        return dup
+
+    def mark(self, texts, groups=None):
+        """
+        Mask row near-duplicate dari row sebelumnya yang disimpan (chunk ini
+        atau sebelumnya). groups: hash int64 per row (0 = tidak diketahui).
+        """
+        signature, sizes = self.signature(texts)
+        groups = np.zeros(len(sizes), dtype="int64") if groups is None else np.asarray(groups, dtype="int64")
+        valid = sizes > 0
+        keys = self.band_keys(signature)
+        ids = self.count + np.arange(len(sizes))
+        position = np.arange(len(ids))
+        self._append(signature, sizes, groups)
+
+        # Pemilik key dari chunk sebelumnya selalu row yang disimpan
+        known = np.zeros(keys.shape, dtype=bool)
+        previous = np.full(keys.shape, -1, dtype="int64")
+        codes = np.empty(keys.shape, dtype="int64")
+        for band in range(self.bands):
+            key = keys[:, band]
+            pos = np.searchsorted(self.keys, key).clip(max=max(len(self.keys) - 1, 0))
+            known[:, band] = valid & (self.keys[pos] == key) if len(self.keys) else False
+            previous[:, band] = np.where(known[:, band], self.owners[pos] if len(self.owners) else -1, -1)
+            codes[:, band] = pd.factorize(np.where(valid, key, 0))[0]
+
+        def first_kept(band, dup):
+            # Per key: posisi row pertama di chunk ini yang bukan duplikat
+            eligible = valid & ~known[:, band] & ~dup
+            first = np.full(codes[:, band].max() + 1 if len(ids) else 0, len(ids), dtype="int64")
+            np.minimum.at(first, codes[eligible, band], position[eligible])
+            return first[codes[:, band]]
+
+        # Pemilik di dalam chunk = row pertama dengan key itu yang disimpan.
+        # Menandai duplikat bisa mengganti pemilik, jadi diulang sampai stabil.
+        dup = np.zeros(len(ids), dtype=bool)
+        for _ in range(self.MAX_PASSES):
+            candidates = previous.copy()
+            for band in range(self.bands):
+                first = first_kept(band, dup)
+                inner = valid & ~known[:, band] & (first < position)
+                candidates[inner, band] = ids[first[inner]]
+            marked = self._verify(candidates, ids)
+            if np.array_equal(marked, dup):
+                break
+            dup = marked
+
+        new_keys, new_owners = [], []
+        for band in range(self.bands):
+            fresh = valid & ~known[:, band] & ~dup & (first_kept(band, dup) == position)
+            new_keys.append(keys[fresh, band])
+            new_owners.append(ids[fresh])
+        keys = np.concatenate([self.keys, *new_keys])
+        order = np.argsort(keys, kind="stable")
+        self.keys = keys[order]
+        self.owners = np.concatenate([self.owners, *new_owners])[order]
+        self.kept[ids[~dup]] = True
+        return dup
+
+    def retain(self, select):
+        """
+        Simpan hanya row yang bukan duplikat dan select(tags) = True; id row
+        disusun ulang dan pemilik band dihitung ulang dari signature (row
+        pertama yang disimpan dengan key itu, sama seperti di mark()).
+        """
+        rows = np.flatnonzero(self.kept[:self.count])
+        rows = rows[select(self.tags[rows])]
+        self.signatures, self.sizes = self.signatures[rows], self.sizes[rows]
+        self.groups, self.tags = self.groups[rows], self.tags[rows]
+        self.kept = np.ones(len(rows), dtype=bool)
+        self.count = len(rows)
+
+        valid = np.flatnonzero(self.sizes > 0)
+        keys = self.band_keys(self.signatures[valid])
+        new_keys, new_owners = [], []
+        for band in range(self.bands):
+            key, first = np.unique(keys[:, band], return_index=True)
+            new_keys.append(key)
+            new_owners.append(valid[first])
+        keys = np.concatenate(new_keys)
+        order = np.argsort(keys, kind="stable")
+        self.keys = keys[order]
+        self.owners = np.concatenate(new_owners)[order]
+
+    def state(self, name):
+        return {
+            f"{name}_keys": self.keys, f"{name}_owners": self.owners,
+            f"{name}_signatures": self.signatures[:self.count], f"{name}_sizes": self.sizes[:self.count],
+            f"{name}_groups": self.groups[:self.count], f"{name}_tags": self.tags[:self.count],
+            f"{name}_kept": self.kept[:self.count],
+        }
+
+    def load_state(self, state, name):
+        if f"{name}_keys" not in state:
+            return
+        self.keys, self.owners = state[f"{name}_keys"], state[f"{name}_owners"]
+        self.signatures, self.sizes = state[f"{name}_signatures"], state[f"{name}_sizes"]
+        self.count = len(self.sizes)
+        # State lama tanpa group: semua row dianggap tidak diketahui
+        self.groups = state.get(f"{name}_groups", np.zeros(self.count, dtype="int64"))
+        # State lama tanpa tag run: run 0; row yang disimpan = pemilik band
+        self.tags = state.get(f"{name}_tags", np.zeros(self.count, dtype="int64"))
+        kept = np.zeros(self.count, dtype=bool)
+        kept[self.owners] = True
+        self.kept = state.get(f"{name}_kept", kept)
+
+
+class Deduplicator:
+    """
+    rules: [(nama rule, key_func(df) → Series key)]; row dengan key NaN
+           tidak pernah dianggap duplikat oleh rule itu.
+    near : (nama rule, text_func(df) → Series teks, MinHashLSH[, group_func(df)
+           → Series ID]) atau None. Row dengan ID berbeda (keduanya tidak
+           NaN) tidak pernah dianggap near-duplicate.
+    state_path: file .npz; kalau ada, key dari run sebelumnya ikut dianggap
+           sudah terlihat, dan save() menyimpan state gabungan.
+    run_id: identitas run di state (mis. fingerprint input). Key yang dulu
+           ditambahkan run_id yang sama tidak dianggap terlihat dan diganti
+           key run ini, jadi re-run feed yang sama tidak membuang row-nya
+           sendiri. None = run baru.
+    keep_runs / max_keys: batas state saat save(): key dari keep_runs run
+           terakhir saja, maksimal max_keys key per rule (row untuk near);
+           None = tanpa batas.
+    """
+
+    def __init__(self, rules, near=None, state_path=None, run_id=None, keep_runs=None, max_keys=None):
+        self.rules = list(rules)
+        self.near = near
+        self.state_path = state_path
+        self.run = run_tag(run_id)
+        self.keep_runs = keep_runs
+        self.max_keys = max_keys
+        # Run di state (terlama → terbaru) & key yang dimuat dari run lain + tag run-nya
+        self.runs = np.empty(0, dtype="int64")
+        self.loaded = {name: (np.empty(0, "int64"), np.empty(0, "int64")) for name, _ in self.rules}
+        self.seen = {name: HashSet() for name, _ in self.rules}
+        self.removed = {name: 0 for name, _ in self.rules}
+        if near is not None:
+            self.removed[near[0]] = 0
+            near[2].tag = self.run
+        self.rows_in = 0
+        if state_path and os.path.exists(state_path):
+            with np.load(state_path) as state:
+                # State lama tanpa run: semua key milik run 0
+                self.runs = state["_runs"] if "_runs" in state else np.zeros(1, dtype="int64")
+                for name in self.seen:
+                    if name in state:
+                        keys = state[name]
+                        tags = state[f"{name}_runs"] if f"{name}_runs" in state else np.zeros(len(keys), "int64")
+                        other = tags != self.run
+                        self.loaded[name] = (keys[other], tags[other])
+                        self.seen[name] = HashSet(keys[other])
+                if near is not None:
+                    near[2].load_state(state, near[0])
+                    near[2].retain(lambda tags: tags != self.run)
+
+    def apply(self, df):
+        """Buang duplikat dari df (chunk); state diperbarui."""
+        self.rows_in += len(df)
+        for name, key_func in self.rules:
+            key = key_func(df)
+            valid = key.notna().to_numpy()
+            keys = hash_keys(key)
+            keep = first_seen(keys, self.seen[name]) | ~valid
+            self.removed[name] += int((~keep).sum())
+            df = df[keep]
+            self.seen[name].add(keys[keep & valid])
+        if self.near is not None:
+            name, text_func, lsh, *group_func = self.near
+            groups = None
+            if group_func:
+                group = group_func[0](df)
+                groups = np.where(group.notna().to_numpy(), hash_keys(group), 0)
+            dup = lsh.mark(text_func(df), groups)
+            self.removed[name] += int(dup.sum())
+            df = df[~dup]
+        return df
+
+    def summary(self):
+        rows = [{"Rule": name, "Removed": count} for name, count in self.removed.items()]
+        rows.append({"Rule": "total", "Removed": sum(self.removed.values())})
+        return pd.DataFrame(rows, columns=["Rule", "Removed"])
+
+    def _tags(self, name):
+        # Tag run per key di seen: dari state kalau key dimuat, selain itu run ini
+        keys = self.seen[name].keys
+        loaded, tags = self.loaded[name]
+        if not len(loaded):
+            return np.full(len(keys), self.run, dtype="int64")
+        pos = np.searchsorted(loaded, keys).clip(max=len(loaded) - 1)
+        return np.where(loaded[pos] == keys, tags[pos], self.run)
+
+    def save(self):
+        if not self.state_path:
+            return
+        runs = np.append(self.runs[self.runs != self.run], self.run)
+        if self.keep_runs is not None:
+            runs = runs[-self.keep_runs:]
+        state = {"_runs": runs}
+        for name, seen in self.seen.items():
+            tags = self._tags(name)
+            keep = retain(tags, runs, self.max_keys)
+            state[name], state[f"{name}_runs"] = seen.keys[keep], tags[keep]
+        if self.near is not None:
+            lsh = self.near[2]
+            lsh.retain(lambda tags: retain(tags, runs, self.max_keys))
+            state.update(lsh.state(self.near[0]))
+        directory = os.path.dirname(self.state_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.state_path, "wb") as f:
+            np.savez_compressed(f, **state)
@@ -0,0 +1,37 @@
+"""
+Helper tulis Excel dengan workbook write-only openpyxl.
+Row ditulis langsung ke file sementara openpyxl, jadi memory tidak ikut
+bertambah seiring jumlah row (dipakai load versi streaming).
+"""
+import numbers
+
+import numpy as np
+import pandas as pd
+
+
+def cell_value(val):
+    if val is None:
+        return None
+    if isinstance(val, (str, bool)):
+        return val
+    if isinstance(val, np.generic):
+        val = val.item()
+    if isinstance(val, numbers.Number):
+        return None if pd.isna(val) else val
+    if pd.api.types.is_scalar(val) and pd.isna(val):
+        return None
+    if isinstance(val, pd.Timestamp):
+        return val.tz_localize(None).to_pydatetime() if val.tz is not None else val.to_pydatetime()
+    return str(val)
+
+
+def append_frame(ws, df, header=True):
+    if header:
+        ws.append([str(c) for c in df.columns])
+    for row in df.itertuples(index=False, name=None):
+        ws.append([cell_value(v) for v in row])
+
+
+def open_workbook():
+    from openpyxl import Workbook
+    return Workbook(write_only=True)
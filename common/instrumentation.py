@@ -0,0 +1,307 @@
+"""
+Instrumentasi ringan per stage pipeline: durasi, peak memory (RSS), row
+masuk/keluar, plus profiler opsional (cProfile / pyinstrument).
+
+Pemakaian di dalam kode pipeline:
+
+    with stage("parse_description", rows_in=len(df)) as rec:
+        ...
+        rec["rows_out"] = len(df)
+
+Selama tidak ada run yang aktif (instrument() tidak dipanggil), stage()
+hanya mengembalikan context manager kosong yang sama, jadi overhead-nya
+satu pengecekan global. Stage bisa nested ("transform/parse_description");
+stage yang dipanggil berkali-kali (per chunk) digabung jadi satu baris
+dengan jumlah calls.
+"""
+import json
+import os
+import platform
+import sys
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from datetime import datetime, timezone
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+PROFILERS = ["cprofile", "pyinstrument"]
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+_ACTIVE = None
+
+
+def current_rss():
+    """RSS proses sekarang dalam byte, None kalau tidak bisa dibaca."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except OSError:
+        pass
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        pass
+    if resource is not None:
+        # Fallback: ru_maxrss = peak sejak proses mulai (KB di Linux, byte di macOS)
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+    return None
+
+
+class _NullStage:
+    __slots__ = ()
+
+    def __enter__(self):
+        return _NULL_RECORD
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_STAGE = _NullStage()
+_NULL_RECORD = {}
+
+
+def stage(name, rows_in=None):
+    """Context manager satu stage; no-op kalau instrumentasi tidak aktif."""
+    if _ACTIVE is None:
+        return _NULL_STAGE
+    return _ACTIVE.stage(name, rows_in)
+
+
+def iter_stage(name, iterable):
+    """
+    Bungkus iterator (mis. chunk dari read_csv) supaya waktu setiap next()
+    tercatat sebagai stage `name`, rows_out = len(item).
+    """
+    if _ACTIVE is None:
+        yield from iterable
+        return
+    it = iter(iterable)
+    while True:
+        with stage(name) as rec:
+            try:
+                item = next(it)
+            except StopIteration:
+                return
+            rec["rows_out"] = len(item)
+        yield item
+
+
+def enabled():
+    return _ACTIVE is not None
+
+
+class _Frame:
+    # Stage yang sedang terbuka; dibandingkan per identitas (bukan nilai) saat dihapus
+    __slots__ = ("peak",)
+
+    def __init__(self, peak):
+        self.peak = peak
+
+
+class RunRecorder:
+    """
+    Kumpulan hasil stage satu run. Peak RSS diambil dari thread sampler yang
+    memperbarui peak semua stage yang sedang terbuka.
+    """
+
+    def __init__(self, name, interval=0.005):
+        self.name = name
+        self.interval = interval
+        self.stages = {}
+        self.started_at = datetime.now(timezone.utc)
+        self.start = time.perf_counter()
+        self.rss_start = current_rss() or 0
+        self.peak = self.rss_start
+        self.seconds = None
+        self._local = threading.local()
+        self._open = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample_loop, daemon=True)
+        self._thread.start()
+
+    def _sample_loop(self):
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def sample(self):
+        rss = current_rss() or 0
+        with self._lock:
+            if rss > self.peak:
+                self.peak = rss
+            for frame in self._open:
+                if rss > frame.peak:
+                    frame.peak = rss
+        return rss
+
+    def _stack(self):
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    @contextmanager
+    def stage(self, name, rows_in=None):
+        stack = self._stack()
+        path = "/".join([*stack, name])
+        rec = {"rows_in": rows_in, "rows_out": None}
+        rss = self.sample()
+        frame = _Frame(rss)
+        with self._lock:
+            self._open.append(frame)
+            # Urutan report = urutan stage pertama kali dibuka (parent sebelum child)
+            self.stages.setdefault(path, {
+                "stage": path, "calls": 0, "seconds": 0.0, "rows_in": None, "rows_out": None,
+                "rss_start": rss, "peak": rss,
+            })
+        stack.append(name)
+        start = time.perf_counter()
+        try:
+            yield rec
+        finally:
+            seconds = time.perf_counter() - start
+            stack.pop()
+            self.sample()
+            with self._lock:
+                self._open.remove(frame)
+                agg = self.stages[path]
+                agg["calls"] += 1
+                agg["seconds"] += seconds
+                for key in ("rows_in", "rows_out"):
+                    if rec[key] is not None:
+                        agg[key] = (agg[key] or 0) + rec[key]
+                agg["peak"] = max(agg["peak"], frame.peak)
+
+    def close(self):
+        if self.seconds is None:
+            self._stop.set()
+            self._thread.join()
+            self.sample()
+            self.seconds = time.perf_counter() - self.start
+        return self
+
+    def records(self):
+        out = []
+        for agg in self.stages.values():
+            rows = agg["rows_in"] if agg["rows_in"] is not None else agg["rows_out"]
+            seconds = agg["seconds"]
+            out.append({
+                "stage": agg["stage"],
+                "calls": agg["calls"],
+                "seconds": round(seconds, 6),
+                "rows_in": agg["rows_in"],
+                "rows_out": agg["rows_out"],
+                "rows_per_sec": round(rows / seconds, 1) if rows and seconds > 0 else None,
+                "rss_start_mb": round(agg["rss_start"] / 2**20, 2),
+                "peak_rss_mb": round(agg["peak"] / 2**20, 2),
+                "peak_delta_mb": round((agg["peak"] - agg["rss_start"]) / 2**20, 2),
+            })
+        return out
+
+    def report(self):
+        return {
+            "run": self.name,
+            "started_at": self.started_at.isoformat(),
+            "seconds": round(self.seconds, 6) if self.seconds is not None else None,
+            "peak_rss_mb": round(self.peak / 2**20, 2),
+            "argv": sys.argv,
+            "python": platform.python_version(),
+            "pid": os.getpid(),
+            "stages": self.records(),
+        }
+
+    def write(self, path, **extra):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({**self.report(), **extra}, f, indent=2, default=str)
+        return path
+
+
+class _Profiler:
+    """cProfile (deterministik) atau pyinstrument (sampling, kalau ter-install)."""
+
+    def __init__(self, kind, prefix):
+        self.kind = kind
+        self.prefix = prefix
+        if kind == "cprofile":
+            import cProfile
+            self.profiler = cProfile.Profile()
+        elif kind == "pyinstrument":
+            try:
+                from pyinstrument import Profiler
+            except ImportError as e:
+                raise ImportError("--profile pyinstrument butuh pyinstrument: pip install pyinstrument") from e
+            self.profiler = Profiler()
+        else:
+            raise ValueError(f"Profiler tidak dikenal: {kind}")
+
+    def start(self):
+        if self.kind == "cprofile":
+            self.profiler.enable()
+        else:
+            self.profiler.start()
+
+    def stop(self):
+        os.makedirs(os.path.dirname(self.prefix) or ".", exist_ok=True)
+        if self.kind == "cprofile":
+            import pstats
+            self.profiler.disable()
+            stats_path = f"{self.prefix}.prof"
+            self.profiler.dump_stats(stats_path)
+            text_path = f"{self.prefix}_profile.txt"
+            with open(text_path, "w", encoding="utf-8") as f:
+                pstats.Stats(self.profiler, stream=f).sort_stats("cumulative").print_stats(40)
+            return [stats_path, text_path]
+
+        self.profiler.stop()
+        html_path = f"{self.prefix}_profile.html"
+        with open(html_path, "w", encoding="utf-8") as f:
+            f.write(self.profiler.output_html())
+        return [html_path]
+
+
+@contextmanager
+def instrument(name, report_path=None, profile=None, output_dir="output"):
+    """
+    Aktifkan instrumentasi selama blok with. Report JSON ditulis ke
+    report_path (kalau ada); profil ke <output_dir>/<name>.prof (+ ringkasan
+    txt) atau <name>_profile.html untuk pyinstrument.
+    """
+    global _ACTIVE
+    previous = _ACTIVE
+    run = RunRecorder(name)
+    profiler = _Profiler(profile, os.path.join(output_dir, name)) if profile else None
+    _ACTIVE = run
+    if profiler:
+        profiler.start()
+    try:
+        yield run
+    finally:
+        profile_files = profiler.stop() if profiler else []
+        _ACTIVE = previous
+        run.close()
+        if report_path:
+            run.write(report_path, profile=profile_files)
+            print(f"[INFO] Run report saved to {report_path}")
+
+
+def add_arguments(parser):
+    parser.add_argument("--report", nargs="?", const="", default=None, metavar="PATH",
+                        help="Tulis run report JSON per stage (default: output/run_report_<pipeline>.json)")
+    parser.add_argument("--profile", choices=PROFILERS, default=None,
+                        help="Rekam profil seluruh run (cProfile atau pyinstrument)")
+
+
+def run_context(name, args, output_dir="output"):
+    """instrument() dari argumen CLI; nullcontext kalau --report/--profile tidak dipakai."""
+    if args.report is None and args.profile is None:
+        return nullcontext()
+    report_path = args.report or os.path.join(output_dir, f"run_report_{name}.json")
+    return instrument(name, report_path=report_path, profile=args.profile, output_dir=output_dir)
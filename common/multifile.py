@@ -0,0 +1,92 @@
+"""
+Extract banyak file CSV sekaligus (mis. dump Amazon: satu CSV per sub-kategori).
+
+Input bisa file, folder (semua *.csv di dalamnya) atau pola glob. File dibaca
+paralel di thread pool (parser CSV melepas GIL selama parsing), setiap row
+ditandai nama file asalnya (kolom source_file), dan file yang gagal dibaca (korup, kosong, schema
+berbeda) dicatat tanpa menghentikan file lain.
+"""
+import glob
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+from common.parallel import concat_partitions
+
+SOURCE_COLUMN = "source_file"
+
+
+def resolve_paths(path):
+    """File → [file]; folder → semua *.csv (urut nama); selain itu dianggap glob."""
+    if os.path.isdir(path):
+        return sorted(glob.glob(os.path.join(path, "*.csv")))
+    if glob.has_magic(path):
+        return sorted(glob.glob(path))
+    return [path]
+
+
+def source_fingerprint(path, block_size=1 << 20):
+    """Hash isi semua file input (urut resolve_paths): input identik → fingerprint sama."""
+    digest = hashlib.sha256()
+    for file in resolve_paths(path):
+        with open(file, "rb") as f:
+            for block in iter(lambda: f.read(block_size), b""):
+                digest.update(block)
+        digest.update(b"\0")
+    return digest.hexdigest()[:16]
+
+
+def is_multi(path):
+    return os.path.isdir(path) or glob.has_magic(path)
+
+
+def source_name(path):
+    # "data/All Exercise and Fitness.csv" → "All Exercise and Fitness"
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+def read_files(paths, read_func, workers=None):
+    """
+    read_func(path) → DataFrame, dijalankan di `workers` thread (default:
+    min(8, jumlah file)). Return (frames, failed):
+        frames: {nama sumber: DataFrame + kolom source_file}, urut sesuai paths
+                (nama sumber = nama file tanpa ekstensi)
+        failed: {nama sumber: pesan error}
+    """
+    frames, failed = {}, {}
+    if not paths:
+        return frames, failed
+    workers = workers or min(8, len(paths))
+
+    names = []
+    for path in paths:
+        name = source_name(path)
+        # Nama file sama di folder berbeda (glob rekursif) → beri nomor
+        if name in names:
+            name = f"{name}_{len(names)}"
+        names.append(name)
+
+    def read(path, name):
+        df = read_func(path)
+        df[SOURCE_COLUMN] = name
+        return df
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [(path, name, pool.submit(read, path, name)) for path, name in zip(paths, names)]
+        for path, name, future in futures:
+            try:
+                frames[name] = future.result()
+            except Exception as e:
+                failed[name] = f"{type(e).__name__}: {e}"
+                print(f"[WARN] Gagal membaca {path}: {failed[name]}")
+    return frames, failed
+
+
+def concat_sources(frames):
+    """Gabung frame per file; source_file jadi categorical (urut file)."""
+    df = concat_partitions(list(frames.values())).reset_index(drop=True)
+    sources = list(dict.fromkeys(df[SOURCE_COLUMN]))
+    df[SOURCE_COLUMN] = pd.Categorical(df[SOURCE_COLUMN], categories=sources)
+    return df
@@ -0,0 +1,142 @@
+"""
+Eksekusi transform per partisi row di process pool.
+
+map_partitions(func, df) memotong df per posisi row, menjalankan func di
+setiap partisi secara paralel, lalu menggabungkan hasilnya sesuai urutan
+awal. func harus hanya bergantung pada row itu sendiri (tidak ada median,
+fill per group, dedup, dsb.); langkah global dijalankan setelah merge.
+
+Kolom categorical yang dibuat di dalam partisi (astype("category")) punya
+categories berbeda per partisi; saat merge categories digabung dan diurutkan
+supaya sama dengan hasil astype("category") di frame utuh. Kolom Arrow
+(string[pyarrow]) yang jadi satu chunk per partisi digabung jadi satu chunk,
+seperti hasil serial.
+
+Pool dibuat dengan start method forkserver (spawn kalau tidak tersedia):
+worker tidak mewarisi thread/lock proses induk (mis. DAG yang menjalankan
+task di thread), jadi aman dipanggil dari thread mana pun.
+"""
+import atexit
+import math
+import multiprocessing
+import os
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+MIN_PARTITION_ROWS = 1_000
+
+# workers → ProcessPoolExecutor; beberapa ukuran pool bisa dipakai bersamaan
+_POOLS = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def resolve_workers(workers):
+    # None/1 → serial, 0 atau negatif → semua core
+    if workers is None:
+        return 1
+    if workers <= 0:
+        return os.cpu_count() or 1
+    return workers
+
+
+def _init_worker():
+    # Instrumentasi & profiler milik proses induk tidak dipakai di worker
+    from common import instrumentation
+    instrumentation._ACTIVE = None
+    sys.setprofile(None)
+
+
+def _mp_context():
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+def get_pool(workers):
+    """
+    Process pool per jumlah worker, dipakai ulang antar panggilan (mis. per
+    chunk streaming). Pool untuk jumlah worker lain tidak di-shutdown, jadi
+    pemanggil lain (thread lain) yang masih memakainya tidak terganggu.
+    """
+    with _POOLS_LOCK:
+        pool = _POOLS.get(workers)
+        if pool is None:
+            pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, mp_context=_mp_context())
+            _POOLS[workers] = pool
+        return pool
+
+
+def shutdown_pool():
+    with _POOLS_LOCK:
+        pools = list(_POOLS.values())
+        _POOLS.clear()
+    for pool in pools:
+        pool.shutdown()
+
+
+atexit.register(shutdown_pool)
+
+
+def split_frame(df, partition_rows):
+    return [df.iloc[start:start + partition_rows] for start in range(0, len(df), partition_rows)]
+
+
+def _combine_chunks(values):
+    # pd.concat kolom Arrow → ChunkedArray dengan satu chunk per partisi
+    chunked = values.array.__arrow_array__() if hasattr(values.array, "__arrow_array__") else None
+    if getattr(chunked, "num_chunks", 1) <= 1:
+        return values
+    import pyarrow as pa
+    combined = type(values.array)(pa.chunked_array([chunked.combine_chunks()]))
+    return pd.Series(combined, index=values.index, name=values.name)
+
+
+def concat_partitions(parts):
+    """
+    pd.concat yang menjaga dtype categorical: kalau categories antar partisi
+    berbeda, digabung dengan union_categoricals (categories diurutkan).
+    """
+    if len(parts) == 1:
+        return parts[0]
+
+    categorical = [
+        col for col in parts[0].columns
+        if any(isinstance(p[col].dtype, pd.CategoricalDtype) for p in parts)
+        and any(p[col].dtype != parts[0][col].dtype for p in parts)
+    ]
+    merged = pd.concat(parts)
+    for col in categorical:
+        values = [
+            p[col] if isinstance(p[col].dtype, pd.CategoricalDtype) else p[col].astype("category")
+            for p in parts
+        ]
+        # Partisi yang semuanya NaN punya categories kosong dengan dtype lain
+        filled = [v.cat.categories.dtype for v in values if len(v.cat.categories)]
+        if filled:
+            empty = pd.CategoricalDtype(pd.Index([], dtype=filled[0]))
+            values = [v if len(v.cat.categories) else v.astype(empty) for v in values]
+        merged[col] = pd.Series(union_categoricals(values, sort_categories=True), index=merged.index)
+    for col in merged.columns:
+        if col not in categorical:
+            merged[col] = _combine_chunks(merged[col])
+    return merged
+
+
+def map_partitions(func, df, workers=None, partition_rows=None):
+    """
+    Jalankan func(partisi) di `workers` proses. workers=None/1 → func(df)
+    langsung (path serial). partition_rows default: len(df) / (workers * 4),
+    minimal MIN_PARTITION_ROWS, supaya beban antar worker rata.
+    """
+    workers = resolve_workers(workers)
+    if partition_rows is None:
+        partition_rows = max(MIN_PARTITION_ROWS, math.ceil(len(df) / (workers * 4)))
+    if workers <= 1 or len(df) <= partition_rows:
+        return func(df)
+
+    parts = split_frame(df, partition_rows)
+    results = list(get_pool(workers).map(func, parts))
+    return concat_partitions(results)
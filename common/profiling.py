@@ -0,0 +1,275 @@
+"""
+Engine profiling bersama untuk inspect_data (txt) dan sheet teknis demographi
+(Basic_Info, Data_Types, Numeric_Stats, Missing_By_Column).
+
+Profil per kolom dihitung sekali per frame: count, null, distinct, dtype,
+statistik numerik (mean/std/min/quantile/max) atau top/freq untuk kolom
+non-numerik, plus hash per row untuk hitung duplicate. Hasilnya di-cache per
+isi frame (kolom, dtype, index + hash per row yang memang dibutuhkan profil),
+jadi frame yang diubah in-place (mis. df["salary_estimate"] = ...) atau frame
+baru dengan id() yang dipakai ulang selalu diprofil ulang.
+"""
+import hashlib
+import os
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+NUMERIC_INDEX = ["count", "mean", "std", "min", "25%", "50%", "75%", "max"]
+CATEGORICAL_INDEX = ["count", "unique", "top", "freq"]
+
+# Profil terakhir per fingerprint isi frame; hanya profil (bukan frame) yang disimpan
+_CACHE = OrderedDict()
+CACHE_SIZE = 4
+
+
+def _frame_version(df):
+    return (df.shape, tuple(df.columns), tuple(str(t) for t in df.dtypes))
+
+
+def _index_memory(index, deep):
+    # Index baru dari array yang sama: cache hash table (engine) yang dibuat
+    # pandas setelah lookup tidak ikut dihitung
+    if isinstance(index, (pd.RangeIndex, pd.MultiIndex)):
+        return int(index.memory_usage(deep=deep))
+    return int(pd.Index(index.array, copy=False).memory_usage(deep=deep))
+
+
+def categories_memory(categories, deep=True):
+    return _index_memory(categories, deep)
+
+
+def memory_usage(df, deep=True):
+    """
+    df.memory_usage per kolom (+ "Index"), tanpa cache hash table index &
+    categories. Cache itu dibuat pandas saat ada lookup, jadi angkanya
+    bergantung pada operasi sebelumnya (serial vs paralel vs streaming).
+    """
+    usage = df.memory_usage(deep=deep)
+    usage["Index"] = _index_memory(df.index, deep)
+    for i, col in enumerate(df.columns):
+        values = df.iloc[:, i]
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            usage[col] = values.array.codes.nbytes + categories_memory(values.dtype.categories, deep)
+    return usage
+
+
+def hash_rows(df, columns=None):
+    """
+    Hash 64-bit per row dari `columns` (default semua kolom) tanpa membuat
+    frame subset. Semua kolom → sama dengan hash_pandas_object(df).
+    """
+    if columns is None or list(columns) == list(df.columns):
+        if len(df.columns) == 0:
+            return np.zeros(len(df), dtype="uint64")
+        return pd.util.hash_pandas_object(df, index=False).to_numpy()
+    hashes = np.zeros(len(df), dtype="uint64")
+    for col in columns:
+        hashes = hashes * np.uint64(1_000_003) ^ pd.util.hash_pandas_object(df[col], index=False).to_numpy()
+    return hashes
+
+
+def _kind(s):
+    # Urutan pengecekan sama dengan DataFrame.describe
+    if pd.api.types.is_bool_dtype(s.dtype):
+        return "categorical"
+    if pd.api.types.is_numeric_dtype(s.dtype):
+        return "numeric"
+    if pd.api.types.is_datetime64_any_dtype(s.dtype):
+        return "datetime"
+    return "categorical"
+
+
+def _describe_numeric(s, count):
+    stats = [count, s.mean(), s.std(), s.min(), *s.quantile([0.25, 0.5, 0.75]).tolist(), s.max()]
+    dtype = "Float64" if pd.api.types.is_extension_array_dtype(s.dtype) else "float64"
+    return pd.Series(stats, index=NUMERIC_INDEX, name=s.name, dtype=dtype)
+
+
+def _describe_categorical(s, count):
+    counts = s.value_counts()
+    counts = counts[counts != 0]
+    if len(counts):
+        top, freq = counts.index[0], counts.iloc[0]
+    else:
+        top, freq = np.nan, np.nan
+    desc = pd.Series([count, len(counts), top, freq], index=CATEGORICAL_INDEX, name=s.name, dtype="object")
+    return desc, len(counts)
+
+
+class DataProfile:
+    """
+    exclude: kolom df yang tidak diprofil (mis. kolom yang hanya untuk key load).
+    row_hashes: hash_rows(df, kolom profil) kalau sudah dihitung (get_profile).
+    """
+
+    def __init__(self, df, exclude=(), row_hashes=None):
+        self.rows = len(df)
+        self.columns = [c for c in df.columns if c not in exclude]
+        self.dtypes = df.dtypes[self.columns].copy()
+        self.index_summary = _index_summary(df.index)
+        excluded = [c for c in df.columns if c in exclude]
+        self.memory_shallow = int(memory_usage(df, deep=False).drop(excluded).sum())
+        self.memory_deep = int(memory_usage(df).drop(excluded).sum())
+
+        nulls = {}
+        distinct = {}
+        self.kinds = {}
+        self.stats = {}
+        for col in self.columns:
+            s = df[col]
+            n_null = int(s.isna().sum())
+            count = self.rows - n_null
+            kind = _kind(s)
+            if kind == "numeric":
+                self.stats[col] = _describe_numeric(s, count)
+                distinct[col] = int(s.nunique())
+            elif kind == "datetime":
+                self.stats[col] = s.describe()
+                distinct[col] = int(s.nunique())
+            else:
+                self.stats[col], distinct[col] = _describe_categorical(s, count)
+            nulls[col] = n_null
+            self.kinds[col] = kind
+
+        self.nulls = pd.Series(nulls, index=self.columns, dtype="int64")
+        self.distinct = pd.Series(distinct, index=self.columns, dtype="int64")
+
+        # Hash per row → jumlah duplicate tanpa df.duplicated() berulang
+        self.row_hashes = hash_rows(df, self.columns) if row_hashes is None else row_hashes
+        self.duplicates = int(pd.Series(self.row_hashes).duplicated().sum())
+
+    def describe(self, include=None, columns=None):
+        """
+        Sama dengan df[columns].describe(include=...).
+        include=None → numeric (+ datetime), include="all" → semua kolom.
+        """
+        columns = self.columns if columns is None else list(columns)
+        if include == "all":
+            selected = columns
+        else:
+            selected = [c for c in columns if self.kinds[c] in ("numeric", "datetime")]
+        ldesc = [self.stats[c] for c in selected]
+
+        # Urutan index seperti pandas: index describe terpendek duluan
+        names = []
+        for idx in sorted((d.index for d in ldesc), key=len):
+            for name in idx:
+                if name not in names:
+                    names.append(name)
+        return pd.concat([d.reindex(names) for d in ldesc], axis=1, sort=False)
+
+    def numeric_columns(self, dtypes=None):
+        if dtypes is None:
+            return [c for c in self.columns if self.kinds[c] == "numeric"]
+        return [c for c in self.columns if str(self.dtypes[c]) in dtypes]
+
+    def basic_info(self):
+        return pd.DataFrame({
+            "Metric": [
+                "Total Rows", "Total Columns", "Missing Values",
+                "Duplicate Rows", "Memory Usage (KB)"
+            ],
+            "Value": [
+                self.rows,
+                len(self.columns),
+                int(self.nulls.sum()),
+                self.duplicates,
+                round(self.memory_deep / 1024, 2)
+            ]
+        })
+
+    def data_types(self):
+        # Per nama dtype: setiap CategoricalDtype (kategori berbeda) tetap "category"
+        dtype_counts = self.dtypes.astype(str).value_counts().reset_index()
+        dtype_counts.columns = ["Dtype", "Count"]
+        return dtype_counts
+
+    def numeric_stats(self, columns=None):
+        num_desc = self.describe(columns=columns).T.reset_index()
+        num_desc.rename(columns={"index": "Column"}, inplace=True)
+        return num_desc
+
+    def missing_by_column(self):
+        miss = self.nulls.reset_index()
+        miss.columns = ["Column", "Missing_Count"]
+        return miss
+
+    def info_text(self):
+        # Format mengikuti DataFrame.info()
+        lines = ["<class 'pandas.core.frame.DataFrame'>", self.index_summary,
+                 f"Data columns (total {len(self.columns)} columns):"]
+        names = [str(c) for c in self.columns]
+        non_null = [f"{self.rows - self.nulls[c]} non-null" for c in self.columns]
+        w_name = max([len("Column")] + [len(n) for n in names])
+        w_null = max([len("Non-Null Count")] + [len(n) for n in non_null])
+        lines.append(f" #   {'Column':<{w_name}}  {'Non-Null Count':<{w_null}}  Distinct  Dtype")
+        lines.append(f"---  {'-' * w_name}  {'-' * w_null}  --------  -----")
+        for i, col in enumerate(self.columns):
+            lines.append(f" {i:<3} {names[i]:<{w_name}}  {non_null[i]:<{w_null}}  "
+                         f"{self.distinct[col]:<8}  {self.dtypes[col]}")
+        counts = self.dtypes.astype(str).value_counts().sort_index()
+        lines.append("dtypes: " + ", ".join(f"{k}({v})" for k, v in counts.items()))
+        lines.append(f"memory usage: {self.memory_shallow / 1024:.1f} KB (deep: {self.memory_deep / 1024:.1f} KB)")
+        return "\n".join(lines)
+
+
+def _index_summary(index):
+    if len(index) == 0:
+        return f"{type(index).__name__}: 0 entries"
+    return f"{type(index).__name__}: {len(index)} entries, {index[0]} to {index[-1]}"
+
+
+def _fingerprint(df, columns):
+    """Hash per row (dipakai ulang oleh DataProfile) + digest isi frame & index."""
+    hashes = hash_rows(df, columns)
+    digest = hashlib.sha256(hashes.tobytes())
+    digest.update(pd.util.hash_pandas_object(df.index).to_numpy().tobytes())
+    return hashes, digest.hexdigest()
+
+
+def get_profile(df, exclude=()):
+    """
+    Profil df dari cache kalau isi frame sama dengan frame yang sudah diprofil,
+    kalau tidak dihitung ulang. Fingerprint = hash per row yang juga dipakai
+    untuk hitung duplicate, jadi cache miss tidak menghash dua kali.
+    """
+    columns = [c for c in df.columns if c not in exclude]
+    hashes, digest = _fingerprint(df, columns)
+    key = (_frame_version(df), tuple(exclude), digest)
+    if key in _CACHE:
+        _CACHE.move_to_end(key)
+        return _CACHE[key]
+
+    prof = DataProfile(df, exclude, row_hashes=hashes)
+    _CACHE[key] = prof
+    while len(_CACHE) > CACHE_SIZE:
+        _CACHE.popitem(last=False)
+    return prof
+
+
+def write_inspect_report(df, filepath):
+    prof = get_profile(df)
+
+    with open(filepath, "w", encoding="utf-8") as f:
+        f.write("=== INFO ===\n")
+        f.write(prof.info_text())
+
+        f.write("\n\n=== HEAD ===\n")
+        f.write(df.head().to_string())
+
+        f.write("\n\n=== DESCRIBE ===\n")
+        f.write(prof.describe(include="all").to_string())
+
+        f.write("\n\n=== NULL VALUES ===\n")
+        f.write(prof.nulls.to_string())
+
+        f.write("\n\n=== DUPLICATES ===\n")
+        f.write(str(prof.duplicates))
+
+    print(f"Inspect data saved to: {filepath}")
+
+
+def inspect_data(df, filename, output_dir="output"):
+    write_inspect_report(df, os.path.join(output_dir, filename))
@@ -0,0 +1,84 @@
+"""
+Registry section report demographi yang dievaluasi lazy.
+
+Setiap section didaftarkan dengan nama + dependency (intermediate) yang
+dibutuhkan:
+
+    REPORT = ReportRegistry()
+
+    @REPORT.intermediate("salary_by_unit")
+    def salary_by_unit(df): ...
+
+    @REPORT.section("Business_Summary", requires=["salary_by_unit"])
+    def business_summary(df, salary_by_unit): ...
+
+REPORT.build(df, sections=["Business_Summary"]) hanya menjalankan section
+yang diminta; intermediate dihitung sekali per build lalu dipakai ulang oleh
+semua section yang membutuhkannya. Section yang return None tidak masuk
+report (mis. tidak ada data salary). Urutan sheet = urutan pendaftaran.
+"""
+from common.instrumentation import stage
+
+
+def wanted(sections, name):
+    """True kalau section `name` diminta (sections=None → semua)."""
+    return sections is None or name in sections
+
+
+def select(report, sections):
+    """
+    Subset report yang sudah jadi (report dari accumulator streaming/sketch,
+    yang state-nya memang dikumpulkan untuk semua section).
+    """
+    return {name: value for name, value in report.items() if wanted(sections, name)}
+
+
+class ReportRegistry:
+
+    def __init__(self):
+        self.sections = {}
+        self.intermediates = {}
+
+    def _register(self, table, name, requires):
+        def decorator(func):
+            missing = [r for r in requires if r not in self.intermediates]
+            if missing:
+                raise ValueError(f"{name}: intermediate belum terdaftar: {missing}")
+            table[name] = (func, list(requires))
+            return func
+        return decorator
+
+    def intermediate(self, name, requires=()):
+        return self._register(self.intermediates, name, requires)
+
+    def section(self, name, requires=()):
+        return self._register(self.sections, name, requires)
+
+    def names(self):
+        return list(self.sections)
+
+    def build(self, source, sections=None, **given):
+        """
+        sections: list nama section (None = semua). Nama yang tidak dikenal
+        diabaikan di sini supaya pemanggil bisa meminta section tambahan milik
+        pipeline (mis. Dedup_Summary) dengan list yang sama.
+        given: intermediate yang sudah dimiliki pemanggil (nama → nilai),
+        fungsi intermediate-nya tidak dijalankan.
+        """
+        memo = dict(given)
+
+        def resolve(name):
+            if name not in memo:
+                func, requires = self.intermediates[name]
+                memo[name] = func(source, **{r: resolve(r) for r in requires})
+            return memo[name]
+
+        report = {}
+        for name, (func, requires) in self.sections.items():
+            if not wanted(sections, name):
+                continue
+            with stage(name):
+                value = func(source, **{r: resolve(r) for r in requires})
+            if value is not None:
+                report[name] = value
+        return report
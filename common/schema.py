@@ -0,0 +1,50 @@
+"""
+Schema CSV per dataset: kolom yang dibaca + dtype per kolom.
+Schema ditulis sebagai dict {kolom: dtype}; dtype "string" otomatis memakai
+string Arrow-backed kalau pyarrow ter-install.
+"""
+import importlib.util
+
+import pandas as pd
+
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+STRING_DTYPE = "string[pyarrow]" if HAS_PYARROW else "string"
+
+
+class SchemaError(ValueError):
+    pass
+
+
+def resolve_dtypes(schema, usecols):
+    return {
+        col: (STRING_DTYPE if dtype == "string" else dtype)
+        for col, dtype in schema.items()
+        if col in usecols
+    }
+
+
+def check_schema(path, schema, usecols):
+    """
+    Baca header saja dan gagal di awal kalau kolom CSV tidak sesuai schema:
+    kolom yang dibutuhkan hilang atau ada kolom baru yang tidak dikenal.
+    """
+    header = pd.read_csv(path, nrows=0, index_col=False).columns.tolist()
+    missing = [c for c in usecols if c not in header]
+    unknown = [c for c in header if c not in schema]
+    if missing or unknown:
+        raise SchemaError(
+            f"Schema drift di {path}: kolom hilang={missing}, kolom tidak dikenal={unknown}"
+        )
+
+
+def read_csv_typed(path, schema, usecols, chunksize=None, engine=None):
+    """
+    read_csv dengan usecols + dtype dari schema.
+    engine="pyarrow" lebih cepat untuk file besar (tidak bisa dipakai bersama chunksize).
+    """
+    check_schema(path, schema, usecols)
+
+    kwargs = {"usecols": usecols, "dtype": resolve_dtypes(schema, usecols)}
+    if engine == "pyarrow" and HAS_PYARROW and chunksize is None:
+        return pd.read_csv(path, engine="pyarrow", **kwargs)
+    return pd.read_csv(path, index_col=False, chunksize=chunksize, **kwargs)
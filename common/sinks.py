@@ -0,0 +1,385 @@
+"""
+Backend output untuk load: Excel (write-only), file kolumnar (Parquet/Feather)
+dan database SQLite lokal.
+
+Semua backend punya interface yang sama:
+    write_chunk(df)        → tambah row Cleaned_Data
+    write_report(sheets)   → tulis tabel demographi [(nama, DataFrame), ...]
+    close()                → finalisasi file, return list path yang ditulis
+Jadi load biasa dan load streaming memakai kode yang sama.
+"""
+import json
+import os
+import sqlite3
+from datetime import datetime, timezone
+
+import pandas as pd
+from common.excel import open_workbook, append_frame
+from common.dedup import HashSet, first_seen
+from common.instrumentation import stage
+
+# Batas Excel: 1,048,576 row termasuk header
+EXCEL_MAX_ROWS = 1_048_575
+
+COLUMNAR_FORMATS = {
+    "parquet": {"ext": "parquet", "compression": "zstd"},
+    "feather": {"ext": "feather", "compression": "lz4"},
+}
+
+
+# Hasil infer_dtype untuk kolom object yang isinya sudah primitif semua
+_PRIMITIVE_TYPES = {"string", "empty", "integer", "floating", "boolean", "mixed-integer-float"}
+
+
+def _arrow_safe(df):
+    # Nilai non-primitif (Interval, dtype numpy, dsb.) disimpan sebagai string
+    df = df.copy()
+    for col in df.columns:
+        if isinstance(df[col].dtype, pd.CategoricalDtype):
+            if not pd.api.types.is_string_dtype(df[col].cat.categories):
+                df[col] = df[col].astype(str).where(df[col].notna(), None)
+        elif df[col].dtype == object and pd.api.types.infer_dtype(df[col], skipna=True) not in _PRIMITIVE_TYPES:
+            df[col] = df[col].map(
+                lambda v: v if v is None or isinstance(v, (str, bool, int, float)) else str(v)
+            )
+    df.columns = [str(c) for c in df.columns]
+    return df.reset_index(drop=True)
+
+
+def _normalize_schema(schema):
+    """
+    Schema Cleaned_Data dari chunk pertama dibuat lebih longgar supaya chunk
+    berikutnya bisa di-cast: kolom yang semuanya null → string, index
+    dictionary (categorical) → int32.
+    """
+    import pyarrow as pa
+    fields = []
+    for field in schema:
+        if pa.types.is_null(field.type):
+            field = field.with_type(pa.string())
+        elif pa.types.is_dictionary(field.type):
+            field = field.with_type(pa.dictionary(pa.int32(), field.type.value_type))
+        fields.append(field)
+    return pa.schema(fields, metadata=schema.metadata)
+
+
+class ExcelSink:
+    """
+    Workbook write-only openpyxl. Cleaned_Data dibatasi `max_rows` row
+    (sampel pertama); max_rows=0 → hanya sheet report.
+    """
+
+    def __init__(self, path, max_rows=None):
+        self.path = path
+        self.max_rows = EXCEL_MAX_ROWS if max_rows is None else min(max_rows, EXCEL_MAX_ROWS)
+        self.rows_written = 0
+        self.total_rows = 0
+        self.wb = open_workbook()
+        self.ws = self.wb.create_sheet("Cleaned_Data") if self.max_rows > 0 else None
+
+    def write_chunk(self, df):
+        self.total_rows += len(df)
+        remaining = self.max_rows - self.rows_written
+        if self.ws is None or remaining <= 0:
+            return
+        part = df.iloc[:remaining]
+        append_frame(self.ws, part, header=self.rows_written == 0)
+        self.rows_written += len(part)
+
+    def write_report(self, sheets):
+        for sheet, data in sheets:
+            append_frame(self.wb.create_sheet(sheet), data)
+
+    def close(self):
+        if self.total_rows > self.rows_written and self.ws is not None:
+            print(f"[INFO] Cleaned_Data di Excel hanya {self.rows_written} dari {self.total_rows} row")
+        try:
+            self.wb.save(self.path)
+        except Exception:
+            # Tutup writer sheet (file temp openpyxl) supaya tidak error lagi saat di-garbage-collect
+            for ws in self.wb.worksheets:
+                ws.close()
+            raise
+        return [self.path]
+
+
+class ColumnarSink:
+    """
+    Cleaned_Data + setiap tabel report sebagai file Parquet/Feather terkompresi
+    di satu folder, plus manifest.json (file, jumlah row, kolom & dtype).
+    Cleaned_Data ditulis incremental per chunk.
+    """
+
+    def __init__(self, directory, fmt="parquet", compression=None):
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError as e:
+            raise ImportError(f"Output {fmt} butuh pyarrow: pip install pyarrow") from e
+
+        self.directory = directory
+        self.fmt = fmt
+        self.ext = COLUMNAR_FORMATS[fmt]["ext"]
+        self.compression = compression or COLUMNAR_FORMATS[fmt]["compression"]
+        self.writer = None
+        self.schema = None
+        self.files = {}
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, name):
+        return os.path.join(self.directory, f"{name}.{self.ext}")
+
+    def _open_writer(self, path, schema):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        if self.fmt == "parquet":
+            return pq.ParquetWriter(path, schema, compression=self.compression)
+        options = pa.ipc.IpcWriteOptions(compression=self.compression)
+        return pa.ipc.new_file(path, schema, options=options)
+
+    def write_chunk(self, df):
+        import pyarrow as pa
+        table = pa.Table.from_pandas(_arrow_safe(df), preserve_index=False)
+        if self.writer is None:
+            self.schema = _normalize_schema(table.schema)
+            self.writer = self._open_writer(self._path("Cleaned_Data"), self.schema)
+            self.files["Cleaned_Data"] = {"rows": 0, "columns": {f.name: str(f.type) for f in self.schema}}
+        # Dictionary/categorical antar chunk bisa beda; samakan ke schema chunk pertama
+        table = table.cast(self.schema)
+        self.writer.write_table(table)
+        self.files["Cleaned_Data"]["rows"] += table.num_rows
+
+    def write_report(self, sheets):
+        import pyarrow as pa
+        for sheet, data in sheets:
+            table = pa.Table.from_pandas(_arrow_safe(data), preserve_index=False)
+            with self._open_writer(self._path(sheet), table.schema) as writer:
+                writer.write_table(table)
+            self.files[sheet] = {"rows": table.num_rows, "columns": {f.name: str(f.type) for f in table.schema}}
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+
+        manifest = {
+            "format": self.fmt,
+            "compression": self.compression,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "tables": {
+                name: {"file": os.path.basename(self._path(name)), **info}
+                for name, info in self.files.items()
+            },
+        }
+        manifest_path = os.path.join(self.directory, "manifest.json")
+        with open(manifest_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+        return [self.directory]
+
+
+def _sql_type(dtype):
+    if isinstance(dtype, pd.CategoricalDtype):
+        dtype = dtype.categories.dtype
+    if pd.api.types.is_bool_dtype(dtype) or pd.api.types.is_integer_dtype(dtype):
+        return "INTEGER"
+    if pd.api.types.is_float_dtype(dtype):
+        return "REAL"
+    return "TEXT"
+
+
+def _sql_frame(df):
+    """
+    Frame dengan nilai yang bisa langsung di-bind sqlite3: datetime → ISO
+    string, nilai non-primitif → string (seperti _arrow_safe).
+    """
+    df = _arrow_safe(df)
+    for col in df.columns:
+        if pd.api.types.is_datetime64_any_dtype(df[col]):
+            df[col] = df[col].dt.strftime("%Y-%m-%d").where(df[col].notna(), None)
+    return df
+
+
+def _sql_rows(df):
+    # NaN/NA → NULL, numpy scalar → python scalar
+    return df.astype(object).where(df.notna(), None).itertuples(index=False, name=None)
+
+
+def _quote(name):
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+class RowKeyCollision(ValueError):
+    """Dua row dengan keys berbeda mendapat row_key (hash 64-bit) yang sama."""
+
+
+class SqliteSink:
+    """
+    Cleaned_Data dan setiap tabel report ke satu file SQLite.
+
+    table: {"table": nama tabel data, "keys": kolom identitas row,
+            "key_only": kolom yang hanya untuk key (tidak ditulis backend lain,
+                        lihat write_outputs), "indexes": kolom yang di-index,
+            "dimensions": {nama sheet: {"keys": ..., "indexes": ...}}}
+    Row data di-upsert per batch dalam satu transaksi: identitas row = hash
+    kolom keys, disimpan sebagai INTEGER PRIMARY KEY row_key, jadi load ulang
+    file yang sama meng-update row lama alih-alih menduplikasi. Tanpa keys,
+    row hanya di-append. Update hanya terjadi kalau kolom keys row lama sama
+    persis; row_key sama dengan keys berbeda (hash collision) tidak pernah
+    menimpa row lama: batch itu di-rollback dan RowKeyCollision di-raise.
+    Row dengan keys yang sama dalam satu load (row terakhir yang tersimpan)
+    dihitung di self.collisions dan dilaporkan saat close(). Sheet yang
+    terdaftar di dimensions (mis. Dim_Company di star schema) di-upsert dengan
+    cara yang sama; tabel report lain diganti setiap load. Index sekunder
+    dibuat di close() supaya load pertama tidak meng-update index per row.
+    """
+
+    def __init__(self, path, table=None, batch_rows=50_000):
+        table = table or {}
+        self.path = path
+        self.table = table.get("table", "Cleaned_Data")
+        self.specs = {self.table: {"keys": list(table.get("keys", [])), "indexes": list(table.get("indexes", []))}}
+        for name, spec in table.get("dimensions", {}).items():
+            self.specs[name] = {"keys": list(spec.get("keys", [])), "indexes": list(spec.get("indexes", []))}
+        self.batch_rows = batch_rows
+        self.columns = {}
+        # Per tabel: row_key yang sudah ditulis di load ini + jumlah key ganda
+        self.seen = {}
+        self.collisions = {}
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+
+    def _ensure_table(self, name, df):
+        keys = self.specs[name]["keys"]
+        existing = [row[1] for row in self.conn.execute(f"PRAGMA table_info({_quote(name)})")]
+        if not existing:
+            columns = [f"{_quote(c)} {_sql_type(t)}" for c, t in df.dtypes.items()]
+            if keys:
+                columns.insert(0, "row_key INTEGER PRIMARY KEY")
+            self.conn.execute(f"CREATE TABLE {_quote(name)} ({', '.join(columns)})")
+        else:
+            # Kolom baru (schema berubah) ditambahkan, kolom lama dibiarkan
+            for col, dtype in df.dtypes.items():
+                if col not in existing:
+                    self.conn.execute(f"ALTER TABLE {_quote(name)} ADD COLUMN {_quote(col)} {_sql_type(dtype)}")
+        self.columns[name] = list(df.columns)
+
+    def _insert_sql(self, name):
+        keys = self.specs[name]["keys"]
+        cols = (["row_key"] if keys else []) + self.columns[name]
+        sql = (f"INSERT INTO {_quote(name)} ({', '.join(_quote(c) for c in cols)}) "
+               f"VALUES ({', '.join('?' * len(cols))})")
+        if keys:
+            updates = ", ".join(f"{_quote(c)} = excluded.{_quote(c)}" for c in self.columns[name])
+            same = " AND ".join(f"{_quote(k)} IS excluded.{_quote(k)}" for k in keys if k in self.columns[name])
+            sql += f" ON CONFLICT(row_key) DO UPDATE SET {updates} WHERE {same}"
+        return sql
+
+    def _upsert(self, name, df):
+        keys = self.specs[name]["keys"]
+        df = _sql_frame(df)
+        if name not in self.columns:
+            self._ensure_table(name, df)
+        df = df.reindex(columns=self.columns[name])
+        if keys:
+            hashed = pd.util.hash_pandas_object(df[[k for k in keys if k in df.columns]].astype(object),
+                                                index=False)
+            df.insert(0, "row_key", hashed.to_numpy().view("int64"))
+            # Urut rowid → insert ke B-tree berurutan, bukan acak
+            df = df.sort_values("row_key", kind="stable")
+            counts = self.collisions.setdefault(name, {"duplicate_keys": 0})
+            seen = self.seen.setdefault(name, HashSet())
+            row_keys = df["row_key"].to_numpy()
+            counts["duplicate_keys"] += int((~first_seen(row_keys, seen)).sum())
+            seen.add(row_keys)
+        sql = self._insert_sql(name)
+        for start in range(0, len(df), self.batch_rows):
+            batch = df.iloc[start:start + self.batch_rows]
+            before = self.conn.total_changes
+            with self.conn:
+                self.conn.executemany(sql, _sql_rows(batch))
+                # Conflict yang tidak di-update (keys berbeda) tidak menambah total_changes;
+                # raise di dalam transaksi → batch di-rollback
+                skipped = len(batch) - (self.conn.total_changes - before)
+                if keys and skipped:
+                    raise RowKeyCollision(f"{self.path} {name}: {skipped} row punya row_key sama dengan row "
+                                          f"lain tapi keys berbeda (hash collision); batch tidak ditulis")
+
+    def write_chunk(self, df):
+        self._upsert(self.table, df)
+
+    def write_report(self, sheets):
+        with self.conn:
+            for sheet, data in sheets:
+                if sheet in self.specs:
+                    continue
+                data = _sql_frame(data)
+                columns = ", ".join(f"{_quote(c)} {_sql_type(t)}" for c, t in data.dtypes.items())
+                self.conn.execute(f"DROP TABLE IF EXISTS {_quote(sheet)}")
+                self.conn.execute(f"CREATE TABLE {_quote(sheet)} ({columns})")
+                self.conn.executemany(
+                    f"INSERT INTO {_quote(sheet)} VALUES ({', '.join('?' * len(data.columns))})",
+                    _sql_rows(data),
+                )
+        for sheet, data in sheets:
+            if sheet in self.specs:
+                self._upsert(sheet, data)
+
+    def close(self):
+        with self.conn:
+            for name, columns in self.columns.items():
+                for col in self.specs[name]["indexes"]:
+                    if col in columns:
+                        self.conn.execute(
+                            f"CREATE INDEX IF NOT EXISTS {_quote(f'idx_{name}_{col}')} "
+                            f"ON {_quote(name)} ({_quote(col)})"
+                        )
+        self.conn.close()
+        for name, counts in self.collisions.items():
+            if counts["duplicate_keys"]:
+                print(f"[WARN] {self.path} {name}: {counts['duplicate_keys']} row punya keys yang sama dengan "
+                      f"row lain di load ini, row terakhir yang tersimpan")
+        return [self.path]
+
+
+def open_sinks(filename, backends=("excel",), excel_rows=None, output_dir="output", table=None):
+    """
+    backends: kombinasi "excel", "parquet", "feather", "sqlite".
+    Excel → output/<filename>.xlsx; kolumnar → output/<filename>_<format>/;
+    SQLite → output/<filename>.sqlite (table: lihat SqliteSink)
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    sinks = []
+    for backend in backends:
+        if backend == "excel":
+            sinks.append(ExcelSink(os.path.join(output_dir, f"{filename}.xlsx"), max_rows=excel_rows))
+        elif backend in COLUMNAR_FORMATS:
+            sinks.append(ColumnarSink(os.path.join(output_dir, f"{filename}_{backend}"), fmt=backend))
+        elif backend == "sqlite":
+            sinks.append(SqliteSink(os.path.join(output_dir, f"{filename}.sqlite"), table=table))
+        else:
+            raise ValueError(f"Backend output tidak dikenal: {backend}")
+    return sinks
+
+
+def write_outputs(chunks, get_sheets, filename, backends=("excel",), excel_rows=None, table=None):
+    """
+    Tulis Cleaned_Data (iterable DataFrame) lalu sheet report ke semua backend.
+    get_sheets dipanggil setelah semua chunk habis. Kolom table["key_only"]
+    hanya ditulis ke SQLite (bagian row_key).
+    """
+    sinks = open_sinks(filename, backends, excel_rows, table=table)
+    key_only = list((table or {}).get("key_only", []))
+    for chunk in chunks:
+        with stage("write_chunk", rows_in=len(chunk)):
+            hidden = [c for c in key_only if c in chunk.columns]
+            public = chunk.drop(columns=hidden) if hidden else chunk
+            for sink in sinks:
+                sink.write_chunk(chunk if isinstance(sink, SqliteSink) else public)
+
+    with stage("report"):
+        sheets = list(get_sheets())
+    paths = []
+    with stage("write_report"):
+        for sink in sinks:
+            sink.write_report(sheets)
+            paths.extend(sink.close())
+    return paths
@@ -0,0 +1,466 @@
+"""
+Sketch mergeable untuk report demographi approximate (memory konstan).
+
+    QuantileSketch  : quantile dengan error relatif (bucket log, ala DDSketch)
+    HeavyHitters    : top-N value_counts (Misra-Gries), count under-estimate ≤ error
+    HyperLogLog     : estimasi jumlah nilai/row distinct
+    FixedHistogram  : histogram bin log tetap, bisa di-rebin ke bin report (pd.cut)
+    NumericSummary  : count/mean/std/min/max exact + quartile dari QuantileSketch
+
+Semua punya update(values) dan merge(other), dan state-nya bisa di-pickle,
+jadi sketch dari beberapa partisi / hari bisa digabung. Setiap hasil
+dikembalikan bersama batas error-nya.
+
+State file (save_state / load_state / accumulate_state) adalah pickle: hanya
+load file yang dibuat sendiri oleh pipeline ini. Pickle dari sumber yang
+tidak dipercaya bisa menjalankan kode arbitrer saat di-load.
+"""
+import math
+import os
+import pickle
+
+import numpy as np
+import pandas as pd
+
+
+def _float_values(values):
+    v = pd.to_numeric(pd.Series(values), errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+    return v[~np.isnan(v)]
+
+
+class QuantileSketch:
+    """
+    Nilai di-bucket dengan batas geometris gamma = (1+a)/(1-a); quantile yang
+    dikembalikan berjarak relatif ≤ a dari order statistic yang sebenarnya,
+    kecuali quantile yang jatuh di bucket hasil _collapse (lihat error_bound).
+    """
+
+    # Key bucket terbesar yang pernah digabung _collapse per sisi (None = belum
+    # pernah). Class attribute supaya state pickle lama tetap bisa di-load.
+    collapsed_positive = None
+    collapsed_negative = None
+
+    def __init__(self, relative_accuracy=0.01, max_buckets=4096):
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.log_gamma = math.log(self.gamma)
+        self.max_buckets = max_buckets
+        self.positive = {}
+        self.negative = {}
+        self.zero = 0
+        self.count = 0
+
+    def _add(self, store, values):
+        keys, counts = np.unique(np.ceil(np.log(values) / self.log_gamma).astype(np.int64), return_counts=True)
+        for key, count in zip(keys.tolist(), counts.tolist()):
+            store[key] = store.get(key, 0) + count
+
+    def update(self, values):
+        v = _float_values(values)
+        if not len(v):
+            return
+        self.count += len(v)
+        self.zero += int((v == 0).sum())
+        if (v > 0).any():
+            self._add(self.positive, v[v > 0])
+        if (v < 0).any():
+            self._add(self.negative, -v[v < 0])
+        self._collapse()
+
+    def _collapse(self):
+        # Bucket terkecil (|x| paling dekat 0) digabung supaya jumlah bucket tetap
+        # terbatas: akurasi quantile di bucket gabungan dikorbankan dan dicatat
+        for side, store in (("positive", self.positive), ("negative", self.negative)):
+            if len(store) > self.max_buckets:
+                keys = sorted(store)
+                cut = keys[len(keys) - self.max_buckets]
+                merged = sum(store.pop(k) for k in keys if k <= cut)
+                store[cut] = merged
+                self._mark_collapsed(side, cut)
+
+    def _mark_collapsed(self, side, key):
+        attr = f"collapsed_{side}"
+        current = getattr(self, attr)
+        if key is not None and (current is None or key > current):
+            setattr(self, attr, key)
+
+    def merge(self, other):
+        if other.gamma != self.gamma:
+            raise ValueError("QuantileSketch dengan relative_accuracy berbeda tidak bisa di-merge")
+        for mine, theirs in ((self.positive, other.positive), (self.negative, other.negative)):
+            for key, count in theirs.items():
+                mine[key] = mine.get(key, 0) + count
+        self.zero += other.zero
+        self.count += other.count
+        self._mark_collapsed("positive", other.collapsed_positive)
+        self._mark_collapsed("negative", other.collapsed_negative)
+        self._collapse()
+        return self
+
+    def _value(self, key):
+        return 2 * self.gamma ** key / (self.gamma + 1)
+
+    def quantile(self, q):
+        if self.count == 0:
+            return np.nan
+        rank = q * (self.count - 1)
+        seen = 0
+        for key in sorted(self.negative, reverse=True):
+            seen += self.negative[key]
+            if seen > rank:
+                return -self._value(key)
+        seen += self.zero
+        if seen > rank:
+            return 0.0
+        for key in sorted(self.positive):
+            seen += self.positive[key]
+            if seen > rank:
+                return self._value(key)
+        return self._value(max(self.positive)) if self.positive else 0.0
+
+    def _collapsed_limit(self, value):
+        # gamma^cut kalau value jatuh di bucket gabungan _collapse (0 < |x| ≤ gamma^cut)
+        cut = self.collapsed_positive if value > 0 else self.collapsed_negative if value < 0 else None
+        if cut is not None and abs(value) <= self.gamma ** cut:
+            return self.gamma ** cut
+        return None
+
+    def error_bound(self, value):
+        """
+        Batas error absolut untuk quantile `value`: |x - value| ≤ a·|x| dengan
+        |x| ≤ |value| / (1 - a). Quantile di bucket gabungan _collapse tidak
+        punya batas relatif; batasnya gamma^cut (lebar seluruh bucket itu).
+        """
+        limit = self._collapsed_limit(value)
+        if limit is not None:
+            return limit
+        return abs(value) * self.relative_accuracy / (1 - self.relative_accuracy)
+
+    def relative_error(self, value):
+        """relative_accuracy, atau error_bound / |value| kalau value di bucket gabungan."""
+        if self._collapsed_limit(value) is None:
+            return self.relative_accuracy
+        return self.error_bound(value) / abs(value)
+
+
+class NumericSummary:
+    """
+    Ringkasan describe() yang mergeable: count, mean, std, min, max exact
+    (momen dengan merge Chan et al.), quartile dari QuantileSketch.
+    """
+
+    def __init__(self, relative_accuracy=0.01):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.total = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+        self.sketch = QuantileSketch(relative_accuracy)
+
+    def _combine(self, count, mean, m2, total, vmin, vmax):
+        if count == 0:
+            return
+        n = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / n
+        self.m2 += m2 + delta ** 2 * self.count * count / n
+        self.count = n
+        self.total += total
+        self.min = min(self.min, vmin)
+        self.max = max(self.max, vmax)
+
+    def update(self, values):
+        v = _float_values(values)
+        if not len(v):
+            return
+        mean = v.mean()
+        self._combine(len(v), mean, float(((v - mean) ** 2).sum()), float(v.sum()), v.min(), v.max())
+        self.sketch.update(v)
+
+    def merge(self, other):
+        self._combine(other.count, other.mean, other.m2, other.total, other.min, other.max)
+        self.sketch.merge(other.sketch)
+        return self
+
+    def quantile(self, q):
+        # Ujung distribusi exact
+        if q <= 0:
+            return self.min if self.count else np.nan
+        if q >= 1:
+            return self.max if self.count else np.nan
+        value = self.sketch.quantile(q)
+        return float(np.clip(value, self.min, self.max)) if self.count else np.nan
+
+    def describe(self):
+        """Stat, Value, Error: sama urutannya dengan Series.describe()."""
+        std = math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else np.nan
+        stats = [
+            ("count", float(self.count), 0.0),
+            ("mean", self.mean if self.count else np.nan, 0.0),
+            ("std", std, 0.0),
+            ("min", self.min if self.count else np.nan, 0.0),
+        ]
+        for label, q in (("25%", 0.25), ("50%", 0.5), ("75%", 0.75)):
+            value = self.quantile(q)
+            stats.append((label, value, self.sketch.error_bound(value)))
+        stats.append(("max", self.max if self.count else np.nan, 0.0))
+        return pd.DataFrame(stats, columns=["Stat", "Value", "Error"])
+
+
+class HeavyHitters:
+    """
+    Misra-Gries dengan `capacity` counter. Count setiap item adalah
+    under-estimate: count asli ada di [count, count + error].
+    """
+
+    def __init__(self, capacity=256):
+        self.capacity = capacity
+        self.counts = {}
+        self.total = 0
+        self.error = 0
+
+    def update(self, values):
+        vc = pd.Series(values).value_counts(sort=False)
+        for key, count in vc.items():
+            self.counts[key] = self.counts.get(key, 0) + int(count)
+        self.total += int(vc.sum())
+        self._prune()
+
+    def _prune(self):
+        if len(self.counts) <= self.capacity:
+            return
+        cut = sorted(self.counts.values(), reverse=True)[self.capacity]
+        self.counts = {k: c - cut for k, c in self.counts.items() if c > cut}
+        self.error += cut
+
+    def merge(self, other):
+        for key, count in other.counts.items():
+            self.counts[key] = self.counts.get(key, 0) + count
+        self.total += other.total
+        self.error += other.error
+        self._prune()
+        return self
+
+    def top(self, n=None):
+        items = sorted(self.counts.items(), key=lambda kv: -kv[1])
+        return items if n is None else items[:n]
+
+    def to_frame(self, columns, n=None):
+        frame = pd.DataFrame(self.top(n), columns=columns)
+        frame["Count_Error"] = self.error
+        return frame
+
+
+def _hll_sigma(x):
+    if x == 1:
+        return math.inf
+    y, z = 1.0, x
+    while True:
+        x *= x
+        previous = z
+        z += x * y
+        y *= 2
+        if z == previous:
+            return z
+
+
+def _hll_tau(x):
+    if x in (0, 1):
+        return 0.0
+    y, z = 1.0, 1 - x
+    while True:
+        x = math.sqrt(x)
+        previous = z
+        y *= 0.5
+        z -= (1 - x) ** 2 * y
+        if z == previous:
+            return z / 3
+
+
+class HyperLogLog:
+    """
+    Estimasi cardinality dengan 2^p register. Error standar relatif
+    1.04 / sqrt(2^p) (p=14 → ±0.81%); error_bound() = 2 × error standar (~95%).
+    """
+
+    def __init__(self, p=14):
+        self.p = p
+        self.m = 1 << p
+        self.registers = np.zeros(self.m, dtype=np.uint8)
+
+    def update_hashes(self, hashes):
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        if not len(hashes):
+            return
+        idx = (hashes >> np.uint64(64 - self.p)).astype(np.int64)
+        # Bit sisanya (+ sentinel supaya tidak nol) → posisi bit 1 pertama
+        w = (hashes << np.uint64(self.p)) | np.uint64(1 << (self.p - 1))
+        hi = (w >> np.uint64(32)).astype(np.float64)
+        lo = (w & np.uint64(0xFFFFFFFF)).astype(np.float64)
+        with np.errstate(divide="ignore"):
+            rho = np.where(hi > 0, 32 - np.floor(np.log2(hi)), 64 - np.floor(np.log2(lo))).astype(np.uint8)
+        best = pd.Series(rho).groupby(idx).max()
+        keys = best.index.to_numpy()
+        self.registers[keys] = np.maximum(self.registers[keys], best.to_numpy())
+
+    def update(self, values):
+        values = pd.Series(values).dropna()
+        self.update_hashes(pd.util.hash_pandas_object(values, index=False).to_numpy())
+
+    def merge(self, other):
+        if other.p != self.p:
+            raise ValueError("HyperLogLog dengan p berbeda tidak bisa di-merge")
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def estimate(self):
+        # Estimator "improved" Ertl (2017): tanpa peralihan linear counting / raw
+        # estimate, jadi tidak ada bias di sekitar 2.5m .. 5m distinct
+        q = 64 - self.p
+        counts = np.bincount(self.registers, minlength=q + 2).astype(np.float64)
+        z = self.m * _hll_tau(1 - counts[q + 1] / self.m)
+        for k in range(q, 0, -1):
+            z = 0.5 * (z + counts[k])
+        z += self.m * _hll_sigma(counts[0] / self.m)
+        return float(self.m ** 2 / (2 * math.log(2)) / z) if math.isfinite(z) else 0.0
+
+    def error_bound(self, estimate=None):
+        estimate = self.estimate() if estimate is None else estimate
+        return 2 * 1.04 / math.sqrt(self.m) * estimate
+
+
+class FixedHistogram:
+    """
+    Histogram dengan bin log tetap (default 10^-2 .. 10^10, 500 bin per
+    dekade, lebar relatif ±0.5%). Karena bin tidak bergantung data,
+    histogram dari partisi / hari berbeda bisa dijumlah. Nilai di luar
+    rentang (termasuk ≤ 0) masuk counter underflow / overflow.
+    """
+
+    def __init__(self, lo=1e-2, hi=1e10, bins_per_decade=500):
+        decades = math.log10(hi) - math.log10(lo)
+        self.edges = np.logspace(math.log10(lo), math.log10(hi), int(round(decades * bins_per_decade)) + 1)
+        self.counts = np.zeros(len(self.edges) - 1, dtype=np.int64)
+        self.under = 0
+        self.over = 0
+        self.min = np.inf
+        self.max = -np.inf
+
+    def update(self, values):
+        v = _float_values(values)
+        if not len(v):
+            return
+        self.min = min(self.min, v.min())
+        self.max = max(self.max, v.max())
+        self.under += int((v < self.edges[0]).sum())
+        self.over += int((v > self.edges[-1]).sum())
+        counts, _ = np.histogram(v, bins=self.edges)
+        self.counts += counts
+
+    def merge(self, other):
+        if not np.array_equal(self.edges, other.edges):
+            raise ValueError("FixedHistogram dengan bin berbeda tidak bisa di-merge")
+        self.counts += other.counts
+        self.under += other.under
+        self.over += other.over
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    def _bins(self):
+        # Bin tetap + bin underflow/overflow dengan batas min/max exact
+        lows = list(self.edges[:-1])
+        highs = list(self.edges[1:])
+        counts = list(self.counts)
+        if self.under:
+            lows.insert(0, self.min)
+            highs.insert(0, self.edges[0])
+            counts.insert(0, self.under)
+        if self.over:
+            lows.append(self.edges[-1])
+            highs.append(self.max)
+            counts.append(self.over)
+        # Tidak ada data di luar [min, max] → bin ujung dipotong ke sana
+        lows = np.clip(np.array(lows), self.min, self.max)
+        highs = np.clip(np.array(highs), self.min, self.max)
+        return lows, highs, np.array(counts, dtype=np.float64)
+
+    def rebin(self, breaks):
+        """
+        Jumlah per bin report [breaks[i], breaks[i+1]]. Bin tetap yang
+        terpotong batas report dibagi proporsional; error = jumlah row di bin
+        yang terpotong (batas atas salah hitung).
+        """
+        lows, highs, counts = self._bins()
+        width = np.where(highs > lows, highs - lows, 1.0)
+        estimates, errors = [], []
+        for a, b in zip(breaks[:-1], breaks[1:]):
+            overlap = np.clip(np.minimum(highs, b) - np.maximum(lows, a), 0, None)
+            fraction = np.where(highs > lows, overlap / width, ((lows > a) & (lows <= b)).astype(float))
+            share = counts * fraction
+            partial = (fraction > 0) & (fraction < 1)
+            estimates.append(share.sum())
+            errors.append(counts[partial].sum())
+        return np.array(estimates), np.array(errors)
+
+
+def cut_bins(vmin, vmax, bins=5):
+    """Batas & label interval yang sama dengan pd.cut(x, bins) untuk x dengan min/max ini."""
+    labels, breaks = pd.cut(pd.Series([vmin, vmax], dtype="float64"), bins=bins, retbins=True)
+    return breaks, labels.cat.categories
+
+
+def histogram_frame(hist, columns, bins=5):
+    """
+    Versi approximate dari pd.cut(x, bins).value_counts().reset_index():
+    kolom [range, count] + Count_Error, urut dari count terbesar.
+    """
+    if hist.min > hist.max:
+        return pd.DataFrame(columns=[*columns, "Count_Error"])
+    breaks, intervals = cut_bins(hist.min, hist.max, bins)
+    counts, errors = hist.rebin(breaks)
+    frame = pd.DataFrame({
+        columns[0]: pd.Categorical(intervals, categories=intervals, ordered=True),
+        columns[1]: np.round(counts).astype(np.int64),
+        "Count_Error": np.ceil(errors).astype(np.int64),
+    })
+    return frame.sort_values(columns[1], ascending=False, kind="stable").reset_index(drop=True)
+
+
+def numeric_stats_frame(summaries):
+    """
+    Numeric_Stats approximate: satu row per kolom + Quantile_Rel_Error (error
+    relatif terbesar dari 25%/50%/75%; > relative_accuracy kalau ada quartile
+    di bucket hasil collapse).
+    """
+    rows = []
+    for col, summary in summaries.items():
+        desc = summary.describe().set_index("Stat")["Value"]
+        quartiles = [desc[q] for q in ("25%", "50%", "75%") if not pd.isna(desc[q])]
+        error = max(map(summary.sketch.relative_error, quartiles), default=summary.sketch.relative_accuracy)
+        rows.append({"Column": col, **desc.to_dict(), "Quantile_Rel_Error": error})
+    return pd.DataFrame(rows)
+
+
+def accumulate_state(acc, path):
+    """
+    Gabungkan acc dengan state run sebelumnya di `path` (kalau ada), lalu
+    simpan state gabungan. Report dari acc mencakup semua run yang tersimpan.
+    `path` di-unpickle: harus file state dari pipeline ini sendiri (terpercaya).
+    """
+    if path:
+        if os.path.exists(path):
+            acc.merge(load_state(path))
+        save_state(acc, path)
+    return acc
+
+
+def save_state(obj, path):
+    with open(path, "wb") as f:
+        pickle.dump(obj, f)
+
+
+def load_state(path):
+    with open(path, "rb") as f:
+        return pickle.load(f)
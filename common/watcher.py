@@ -0,0 +1,157 @@
+"""
+Watch folder untuk service pipeline: file yang masuk ke <root>/<route>/
+diproses handler(route, path) oleh sejumlah worker thread tetap.
+
+Alur per file:
+    <route>/x.csv  --(ukuran & mtime stabil 1 scan)-->  <route>/processing/x.csv
+                   --(handler sukses)-->  <route>/done/x.csv
+                   --(handler error) -->  <route>/failed/x.csv + x.csv.error.txt
+
+Antrian dibatasi `queue_size`: kalau penuh, scanner menunggu dan file tetap
+di folder masuk (backpressure). Polling (tanpa dependency tambahan), jadi
+jalan sama di Linux/Mac/Windows dan di network share.
+"""
+import glob
+import os
+import queue
+import shutil
+import signal
+import threading
+import time
+import traceback
+from datetime import datetime
+
+PROCESSING, DONE, FAILED = "processing", "done", "failed"
+
+
+def _move(path, directory):
+    os.makedirs(directory, exist_ok=True)
+    target = os.path.join(directory, os.path.basename(path))
+    if os.path.exists(target):
+        stem, ext = os.path.splitext(os.path.basename(path))
+        target = os.path.join(directory, f"{stem}_{datetime.now():%Y%m%d%H%M%S%f}{ext}")
+    shutil.move(path, target)
+    return target
+
+
+class FolderWatcher:
+
+    def __init__(self, root, routes, handler, concurrency=2, queue_size=100, interval=1.0, pattern="*.csv"):
+        self.root = root
+        self.routes = list(routes)
+        self.handler = handler
+        self.concurrency = concurrency
+        self.interval = interval
+        self.pattern = pattern
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.stop_event = threading.Event()
+        self.stats = {"done": 0, "failed": 0}
+        self._lock = threading.Lock()
+        self._sizes = {}
+        self._threads = []
+        for route in self.routes:
+            os.makedirs(os.path.join(root, route), exist_ok=True)
+
+    def _route_dir(self, route, *sub):
+        return os.path.join(self.root, route, *sub)
+
+    def recover(self):
+        # File yang tertinggal di processing/ (service mati di tengah jalan) diproses ulang
+        for route in self.routes:
+            for path in sorted(glob.glob(os.path.join(self._route_dir(route, PROCESSING), self.pattern))):
+                self.queue.put((route, path))
+
+    def scan(self, settle=True):
+        """
+        Masukkan file baru ke antrian. settle=True: file baru diambil kalau
+        ukuran & mtime-nya sama dengan scan sebelumnya (sudah selesai ditulis).
+        """
+        seen = {}
+        for route in self.routes:
+            for path in sorted(glob.glob(os.path.join(self._route_dir(route), self.pattern))):
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                signature = (stat.st_size, stat.st_mtime_ns)
+                if settle and self._sizes.get(path) != signature:
+                    seen[path] = signature
+                    continue
+                # Backpressure: file baru di-claim setelah antrian punya tempat,
+                # jadi selama menunggu file tetap di folder masuk
+                if not self._wait_for_room():
+                    self._sizes = seen
+                    return
+                claimed = _move(path, self._route_dir(route, PROCESSING))
+                # Hanya scanner yang mengisi antrian, jadi tempatnya tidak diambil thread lain
+                self.queue.put_nowait((route, claimed))
+        self._sizes = seen
+
+    def _wait_for_room(self):
+        """False kalau service di-stop sebelum antrian punya tempat."""
+        while self.queue.full():
+            if self.stop_event.wait(0.05):
+                return False
+        return True
+
+    def _work(self):
+        while True:
+            item = self.queue.get()
+            if item is None:
+                self.queue.task_done()
+                return
+            route, path = item
+            started = time.perf_counter()
+            try:
+                self.handler(route, path)
+            except Exception:
+                target = _move(path, self._route_dir(route, FAILED))
+                with open(target + ".error.txt", "w", encoding="utf-8") as f:
+                    f.write(traceback.format_exc())
+                status = "failed"
+                print(f"[ERROR] {route}: {os.path.basename(path)} gagal, lihat {target}.error.txt")
+            else:
+                _move(path, self._route_dir(route, DONE))
+                status = "done"
+                print(f"[INFO] {route}: {os.path.basename(path)} selesai "
+                      f"({time.perf_counter() - started:.2f}s)")
+            with self._lock:
+                self.stats[status] += 1
+            self.queue.task_done()
+
+    def start(self):
+        for i in range(self.concurrency):
+            thread = threading.Thread(target=self._work, name=f"pipeline-worker-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self):
+        # Tunggu file yang sudah di antrian selesai, lalu hentikan worker
+        self.stop_event.set()
+        for _ in self._threads:
+            self.queue.put(None)
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+    def run(self, once=False):
+        """
+        once=True: proses file yang sudah ada lalu selesai.
+        Selain itu scan setiap `interval` detik sampai stop() / SIGINT / SIGTERM.
+        """
+        if threading.current_thread() is threading.main_thread():
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                signal.signal(sig, lambda *_: self.stop_event.set())
+        self.start()
+        self.recover()
+        try:
+            if once:
+                self.scan(settle=False)
+            else:
+                while not self.stop_event.wait(self.interval):
+                    self.scan()
+        finally:
+            if self.stop_event.is_set():
+                print("[INFO] Berhenti, menunggu file di antrian selesai...")
+            self.stop()
+        return self.stats
@@ -0,0 +1 @@
+# Ada di root supaya pytest menambahkan root repo ke sys.path (import common, data_*)
@@ -0,0 +1,138 @@
+"""
+Mode batch pipeline produk: input berupa folder / glob berisi CSV per
+kategori (dataset Amazon: satu file per sub-kategori).
+
+File dibaca paralel (thread pool), lalu di-transform sebagai satu frame
+gabungan (dedup nama/ASIN lintas kategori) atau per kategori di process pool
+(per_category=True, dedup dalam kategori saja). Hasilnya satu report
+gabungan + satu report per kategori. File / kategori yang gagal (baca,
+transform, report, atau tulis output) dicatat di sheet Batch_Summary tanpa
+menghentikan kategori lain.
+"""
+import pandas as pd
+from common.instrumentation import stage
+from common.reports import select, wanted
+from common.multifile import concat_sources, SOURCE_COLUMN
+from common.parallel import get_pool, resolve_workers
+from data_products.extract import extract_product_files
+from data_products.transform import transform_product, demographi
+from data_products.dedup import product_deduplicator
+from data_products.load import load_product
+from data_products.data_profiling import inspect_data
+from data_products.streaming import approximate_demographi
+
+COMBINED_FILENAME = "All Categories"
+
+
+def _error(e):
+    return f"{type(e).__name__}: {e}"
+
+
+def _transform_category(df, near_duplicates=False):
+    # Deduplicator dibuat di worker; jumlah row yang dibuang dikirim balik
+    dedup = product_deduplicator(near_duplicates)
+    return transform_product(df, dedup=dedup), dedup.summary()
+
+
+def transform_categories(frames, workers=None, near_duplicates=False):
+    """
+    transform_product per kategori, paralel antar kategori.
+    Return (hasil, Dedup_Summary per kategori, failed).
+    """
+    workers = resolve_workers(workers)
+    results, summaries, failed = {}, {}, {}
+    if workers <= 1:
+        for name, df in frames.items():
+            try:
+                results[name], summaries[name] = _transform_category(df, near_duplicates)
+            except Exception as e:
+                failed[name] = _error(e)
+    else:
+        pool = get_pool(workers)
+        futures = [(name, pool.submit(_transform_category, df, near_duplicates)) for name, df in frames.items()]
+        for name, future in futures:
+            try:
+                results[name], summaries[name] = future.result()
+            except Exception as e:
+                failed[name] = _error(e)
+    for name, error in failed.items():
+        print(f"[WARN] Transform kategori {name} gagal: {error}")
+    return results, summaries, failed
+
+
+def batch_summary(raw_rows, cleaned, failed):
+    rows = []
+    for name in dict.fromkeys([*raw_rows, *failed]):
+        rows.append({
+            "Category": name,
+            "Raw_Rows": raw_rows.get(name, 0),
+            "Clean_Rows": len(cleaned[name]) if name in cleaned else 0,
+            "Status": failed.get(name, "ok"),
+        })
+    return pd.DataFrame(rows, columns=["Category", "Raw_Rows", "Clean_Rows", "Status"])
+
+
+def run_batch(path, backends=("excel",), excel_rows=None, workers=None, partition_rows=None,
+              read_workers=None, per_category=False, cache=None, approximate=False, state_path=None,
+              near_duplicates=False, dedup_state=None, sections=None):
+    with stage("extract") as rec:
+        frames, failed = extract_product_files(path, workers=read_workers)
+        raw_rows = {name: len(df) for name, df in frames.items()}
+        rec["rows_out"] = sum(raw_rows.values())
+    if not frames:
+        raise ValueError(f"Tidak ada file produk yang bisa dibaca dari {path}")
+    print(f"[INFO] {len(frames)} file terbaca, {len(failed)} gagal")
+
+    with stage("inspect_data", rows_in=sum(raw_rows.values())):
+        inspect_data(concat_sources(frames))
+
+    with stage("transform", rows_in=sum(raw_rows.values())) as rec:
+        if per_category:
+            cleaned, dedup_summaries, transform_failed = transform_categories(frames, workers, near_duplicates)
+            failed.update(transform_failed)
+            if not cleaned:
+                raise ValueError("Semua kategori gagal di-transform")
+            df = concat_sources(cleaned)
+            dedup_summary = (pd.concat(dedup_summaries.values()).groupby("Rule", sort=False, as_index=False)
+                             .sum())
+        else:
+            dedup = product_deduplicator(near_duplicates, dedup_state, source=path)
+            df = transform_product(concat_sources(frames), workers=workers,
+                                   partition_rows=partition_rows, cache=cache, dedup=dedup)
+            dedup.save()
+            dedup_summary = dedup.summary()
+            dedup_summaries = {}
+            cleaned = {name: sub for name, sub in df.groupby(SOURCE_COLUMN, observed=True, sort=False)}
+        rec["rows_out"] = len(df)
+
+    def report(sub):
+        return select(approximate_demographi(sub), sections) if approximate else demographi(sub, sections)
+
+    with stage("demographi", rows_in=len(df)):
+        reports = {}
+        for name, sub in cleaned.items():
+            try:
+                reports[name] = report(sub)
+                if name in dedup_summaries and wanted(sections, "Dedup_Summary"):
+                    reports[name]["Dedup_Summary"] = dedup_summaries[name]
+            except Exception as e:
+                failed[name] = _error(e)
+                print(f"[WARN] Report kategori {name} gagal: {failed[name]}")
+        combined = select(approximate_demographi(df, state_path), sections) if approximate else demographi(df, sections)
+        if wanted(sections, "Dedup_Summary"):
+            combined["Dedup_Summary"] = dedup_summary
+
+    with stage("load", rows_in=len(df)):
+        # Output per kategori ditulis dulu supaya kegagalannya masuk Batch_Summary report gabungan
+        for name, sub_report in reports.items():
+            try:
+                load_product(cleaned[name], demographi_report=sub_report, filename=name,
+                             backends=backends, excel_rows=excel_rows)
+            except Exception as e:
+                failed[name] = _error(e)
+                print(f"[WARN] Output kategori {name} gagal ditulis: {failed[name]}")
+        if wanted(sections, "Batch_Summary"):
+            combined["Batch_Summary"] = batch_summary(raw_rows, cleaned, failed)
+        load_product(df, demographi_report=combined, filename=COMBINED_FILENAME,
+                     backends=backends, excel_rows=excel_rows)
+    return df
@@ -0,0 +1,50 @@
+"""
+Kolom produk versi ringkas (lihat common/compact.py):
+    link  → asin + link_base (host, categorical); link kanonik = <base>/dp/<asin>
+    image → image_id + image_base & image_suffix (categorical)
+    main_category, sub_category → categorical
+URL lengkap hanya dibangun ulang di writer sink saat load (expand_urls);
+report & profil memakai frame ringkas.
+
+name tetap string Arrow (satu buffer, tanpa object per row): nama hampir
+selalu unik, jadi categorical justru lebih besar (dictionary + kode).
+"""
+from common.compact import split_url, join_url, dictionary_encode
+
+# (pattern ID, pattern base) per kolom URL, lihat split_url
+LINK_PATTERNS = (r"/(?:dp|gp/product)/(?P<id>[A-Z0-9]{10})", r"^(?P<base>https?://[^/?#]+)")
+IMAGE_PATTERNS = (r"/(?P<id>[^/.]+)(?P<suffix>\.[^/]*)$", r"^(?P<base>(?:[^/?#]*/)+)")
+TEXT_COLUMNS = ["main_category", "sub_category"]
+
+# Urutan kolom URL di output (menggantikan kolom ringkas)
+URL_COLUMNS = {
+    "image": ["image_base", "image_id", "image_suffix"],
+    "link": ["link_base"],
+}
+
+
+def compact_columns(df):
+    if "link" in df.columns:
+        parts = split_url(df["link"], *LINK_PATTERNS)
+        df.insert(df.columns.get_loc("link"), "asin", parts["id"])
+        df.insert(df.columns.get_loc("link"), "link_base", parts["base"])
+        df.drop(columns="link", inplace=True)
+    if "image" in df.columns:
+        parts = split_url(df["image"], *IMAGE_PATTERNS)
+        for col in ["base", "id", "suffix"]:
+            df.insert(df.columns.get_loc("image"), f"image_{col}", parts[col])
+        df.drop(columns="image", inplace=True)
+    return dictionary_encode(df, TEXT_COLUMNS)
+
+
+def expand_urls(df):
+    """Frame ringkas → frame dengan kolom link & image lengkap (untuk output)."""
+    if "link_base" not in df.columns and "image_base" not in df.columns:
+        return df
+    df = df.copy(deep=False)
+    if "link_base" in df.columns:
+        df.insert(df.columns.get_loc("link_base"), "link", join_url(df["link_base"], df["asin"], sep="/dp/"))
+    if "image_base" in df.columns:
+        df.insert(df.columns.get_loc("image_base"), "image",
+                  join_url(df["image_base"], df["image_id"], suffix=df["image_suffix"]))
+    return df.drop(columns=[c for cols in URL_COLUMNS.values() for c in cols if c in df.columns])
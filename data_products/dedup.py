@@ -0,0 +1,52 @@
+"""
+Rule dedup produk (lihat common/dedup.py):
+    name : nama ternormalisasi (huruf kecil, tanpa tanda baca & "..." di akhir)
+    asin : ID produk Amazon dari link (/dp/<ASIN>), jadi listing yang sama
+           dengan nama terpotong / query ref= berbeda tetap terdeteksi
+    near_name (opsional): MinHash/LSH pada nama ternormalisasi; dua produk
+           dengan ASIN berbeda tidak pernah dianggap near-duplicate
+
+Dengan state (--dedup-state) run diidentifikasi dari isi file input: re-run
+input yang sama mengganti key run itu, bukan membuang semua row-nya.
+"""
+import pandas as pd
+from common.dedup import Deduplicator, MinHashLSH
+from common.multifile import source_fingerprint
+
+TRUNCATED_SUFFIX = r"(\.\.\.|…)\s*$"
+ASIN_PATTERN = r"/(?:dp|gp/product)/([A-Z0-9]{10})"
+
+# Batas state dedup: produk dari STATE_KEEP_RUNS run terakhir, maksimal
+# STATE_MAX_KEYS key per rule (8 byte per key)
+STATE_KEEP_RUNS = 30
+STATE_MAX_KEYS = 10_000_000
+
+
+def normalize_name(names):
+    # Regex hanya dijalankan sekali per nama unik
+    codes, uniques = pd.factorize(names)
+    cleaned = (pd.Series(uniques, dtype="string").str.lower()
+               .str.replace(TRUNCATED_SUFFIX, "", regex=True)
+               .str.replace(r"[^\w\s]", " ", regex=True)
+               .str.split().str.join(" ")
+               .replace("", pd.NA))
+    return pd.Series(cleaned.array.take(codes, allow_fill=True), index=names.index)
+
+
+def product_asin(df):
+    if "asin" in df.columns:
+        return df["asin"]
+    if "link" not in df.columns:
+        return pd.Series(pd.NA, index=df.index, dtype="string")
+    return df["link"].astype("string").str.extract(ASIN_PATTERN, expand=False)
+
+
+def product_deduplicator(near_duplicates=False, state_path=None, source=None):
+    """source: path input (file/folder/glob) untuk run_id state; None = setiap run dianggap baru."""
+    near = ("near_name", lambda df: normalize_name(df["name"]), MinHashLSH(), product_asin) if near_duplicates else None
+    run_id = source_fingerprint(source) if state_path and source is not None else None
+    return Deduplicator(
+        [("name", lambda df: normalize_name(df["name"])), ("asin", product_asin)],
+        near=near, state_path=state_path, run_id=run_id,
+        keep_runs=STATE_KEEP_RUNS, max_keys=STATE_MAX_KEYS,
+    )
@@ -1,4 +1,12 @@
-import pandas as pd
+from common.schema import read_csv_typed
+from common.multifile import read_files, resolve_paths
+from data_products.schema import PRODUCT_SCHEMA, PRODUCT_USECOLS
 
-def extract_product(PATH_FILE_PRODUCT):
-    return pd.read_csv(PATH_FILE_PRODUCT, index_col=False)
\ No newline at end of file
+def extract_product(PATH_FILE_PRODUCT, chunksize=None, usecols=PRODUCT_USECOLS, engine=None):
+    # chunksize → iterator DataFrame per chunk (mode streaming)
+    # engine="pyarrow" → parser CSV lebih cepat (kalau pyarrow ter-install)
+    return read_csv_typed(PATH_FILE_PRODUCT, PRODUCT_SCHEMA, usecols, chunksize=chunksize, engine=engine)
+
+def extract_product_files(path, workers=None, engine=None):
+    # path: folder / glob berisi CSV per kategori → ({kategori: DataFrame}, {kategori: error})
+    return read_files(resolve_paths(path), lambda p: extract_product(p, engine=engine), workers)
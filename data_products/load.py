@@ -1,27 +1,43 @@
 import pandas as pd
-import os
+from common.sinks import write_outputs
+from data_products.schema import PRODUCT_TABLE
+from data_products.compact import expand_urls
 
-def load_product(df, demographi_report, filename):
-    os.makedirs("output", exist_ok=True)
-    path = f"output/{filename}.xlsx"
+# URL dibangun ulang per potongan row ini, bukan satu frame utuh sekaligus
+EXPAND_ROWS = 50_000
 
-    with pd.ExcelWriter(path, engine="openpyxl") as writer:
-        # Sheet utama
-        df.to_excel(writer, sheet_name="Cleaned_Data", index=False)
+def report_sheets(demographi_report):
+    # Ubah report demographi jadi pasangan (nama sheet, DataFrame)
+    if isinstance(demographi_report, dict):
+        for sheet, data in demographi_report.items():
+            if isinstance(data, pd.DataFrame):
+                yield sheet[:31], data
+            elif isinstance(data, dict):
+                yield sheet[:31], pd.DataFrame(list(data.items()), columns=["Metric", "Value"])
+            else:
+                yield sheet[:31], pd.DataFrame([data], columns=["Value"])
+    else:
+        yield "Demographi", pd.DataFrame(demographi_report.split("\n"), columns=["Demographi"])
 
-        # Sheet demographi
-        if isinstance(demographi_report, dict):
-            for sheet, data in demographi_report.items():
-                if isinstance(data, pd.DataFrame):
-                    data.to_excel(writer, sheet_name=sheet[:31], index=False)
-                elif isinstance(data, dict):
-                    pd.DataFrame(list(data.items()), columns=["Metric", "Value"]) \
-                        .to_excel(writer, sheet_name=sheet[:31], index=False)
-                else:
-                    pd.DataFrame([data], columns=["Value"]) \
-                        .to_excel(writer, sheet_name=sheet[:31], index=False)
-        else:
-            pd.DataFrame(demographi_report.split("\n"), columns=["Demographi"]) \
-                .to_excel(writer, sheet_name="Demographi", index=False)
+def load_product(df, demographi_report, filename, backends=("excel",), excel_rows=None):
+    """
+    Simpan Cleaned_Data + report demographi.
+    backends: "excel", "parquet", "feather", "sqlite" (bisa lebih dari satu).
+    excel_rows: batas row Cleaned_Data di Excel (0 = hanya sheet report).
+    """
+    load_product_stream([df], lambda: demographi_report, filename, backends, excel_rows)
 
-    print(f"Saved to {path}")
+def load_product_stream(chunks, get_report, filename, backends=("excel",), excel_rows=None):
+    """
+    Versi streaming: Cleaned_Data ditulis per chunk.
+    get_report dipanggil setelah semua chunk habis (report baru lengkap saat itu).
+    URL link & image dibangun ulang dari kolom ringkas saat ditulis, per
+    potongan EXPAND_ROWS row, jadi frame dengan URL lengkap tidak pernah ada
+    utuh di memory.
+    """
+    chunks = (expand_urls(chunk.iloc[start:start + EXPAND_ROWS])
+              for chunk in chunks for start in range(0, max(len(chunk), 1), EXPAND_ROWS))
+    paths = write_outputs(chunks, lambda: report_sheets(get_report()), filename, backends, excel_rows,
+                          table=PRODUCT_TABLE)
+    for path in paths:
+        print(f"Saved to {path}")
@@ -0,0 +1,78 @@
+"""
+Pipeline produk untuk satu file CSV dengan frame utuh di memory:
+extract → inspect_data → transform → demographi → load.
+Dipakai main_products.py dan service (main_service.py); build_dag() untuk
+runner DAG (main_pipelines.py).
+"""
+from common.instrumentation import stage
+from common.dag import Dag
+from common.reports import select, wanted
+from data_products.extract import extract_product
+from data_products.transform import transform_product, demographi
+from data_products.dedup import product_deduplicator
+from data_products.load import load_product
+from data_products.data_profiling import inspect_data
+from data_products.streaming import approximate_demographi
+
+
+def build_report(df, dedup, approximate=False, state_path=None, sections=None):
+    if approximate:
+        report = select(approximate_demographi(df, state_path=state_path), sections)
+    else:
+        report = demographi(df, sections)
+    if wanted(sections, "Dedup_Summary"):
+        report["Dedup_Summary"] = dedup.summary()
+    return report
+
+
+def run_pipeline(path, filename, backends=("excel",), excel_rows=None, workers=None, partition_rows=None,
+                 cache=None, approximate=False, state_path=None, inspect_filename="inspect_data_product.txt",
+                 near_duplicates=False, dedup_state=None, sections=None):
+    dedup = product_deduplicator(near_duplicates, dedup_state, source=path)
+    with stage("extract") as rec:
+        df = extract_product(path)
+        rec["rows_out"] = len(df)
+    with stage("inspect_data", rows_in=len(df)):
+        inspect_data(df, inspect_filename)
+    with stage("transform", rows_in=len(df)) as rec:
+        df = transform_product(df, workers=workers, partition_rows=partition_rows, cache=cache, dedup=dedup)
+        dedup.save()
+        rec["rows_out"] = len(df)
+    with stage("demographi", rows_in=len(df)):
+        df_demo = build_report(df, dedup, approximate, state_path, sections)
+    with stage("load", rows_in=len(df)):
+        load_product(df, demographi_report=df_demo, filename=filename,
+                     backends=backends, excel_rows=excel_rows)
+    return df
+
+
+def build_dag(path, filename, backends=("excel",), excel_rows=None, workers=None, partition_rows=None,
+              cache=None, approximate=False, state_path=None, inspect_filename="inspect_data_product.txt",
+              near_duplicates=False, dedup_state=None, sections=None):
+    """
+    Stage yang sama dengan run_pipeline sebagai DAG: profile & transform
+    jalan bersamaan setelah extract. profile/report/load boleh di-skip
+    (Dag.skip); load tanpa report hanya menulis Cleaned_Data.
+    """
+    dedup = product_deduplicator(near_duplicates, dedup_state, source=path)
+
+    def transform(extract):
+        # Shallow copy: transform hanya mengganti kolom, frame extract tetap utuh untuk profile
+        df = transform_product(extract.copy(deep=False), workers=workers, partition_rows=partition_rows,
+                               cache=cache, dedup=dedup)
+        dedup.save()
+        return df
+
+    def load(transform, report):
+        load_product(transform, demographi_report=report or {}, filename=filename,
+                     backends=backends, excel_rows=excel_rows)
+
+    dag = Dag("products")
+    dag.task("extract", lambda: extract_product(path), resource="io")
+    dag.task("profile", lambda extract: inspect_data(extract, inspect_filename), deps=["extract"],
+             optional=True)
+    dag.task("transform", transform, deps=["extract"])
+    dag.task("report", lambda transform: build_report(transform, dedup, approximate, state_path, sections),
+             deps=["transform"], optional=True)
+    dag.task("load", load, deps=["transform", "report"], resource="io", optional=True)
+    return dag
@@ -0,0 +1,29 @@
+# Schema CSV produk (Amazon category dump)
+# ratings & no_of_ratings tetap string: ada nilai seperti "Get" / "FREE Delivery by Amazon"
+# yang dibersihkan di transform_product.
+PRODUCT_SCHEMA = {
+    "name": "string",
+    "main_category": "category",
+    "sub_category": "category",
+    "image": "string",
+    "link": "string",
+    "ratings": "string",
+    "no_of_ratings": "string",
+    "discount_price": "string",
+    "actual_price": "string",
+}
+
+# Kolom yang dibaca; image & link diringkas di transform (ID + base URL,
+# lihat compact.py), link dipakai untuk dedup per ASIN
+PRODUCT_USECOLS = [
+    "name", "main_category", "sub_category", "image", "link", "ratings",
+    "no_of_ratings", "discount_price", "actual_price",
+]
+
+# Tabel Cleaned_Data di backend sqlite: upsert per produk (name + link),
+# index untuk filter per kategori
+PRODUCT_TABLE = {
+    "table": "products",
+    "keys": ["name", "link"],
+    "indexes": ["main_category", "sub_category"],
+}
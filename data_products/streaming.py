@@ -0,0 +1,224 @@
+"""
+Mode streaming pipeline produk: CSV dibaca per chunk, setiap chunk di-transform,
+masuk ke aggregat parsial demographi, lalu langsung ditulis ke Excel.
+Memory = ukuran chunk + state lintas chunk yang tumbuh dengan jumlah row:
+hash nama/ASIN yang sudah terlihat untuk dedup (8 byte per key), hash per row
+untuk Duplicate Rows, dan nilai kolom numerik untuk median/quantile/pd.cut.
+approximate=True mengganti dua yang terakhir dengan sketch (memory konstan).
+"""
+import pandas as pd
+from common.aggregates import FrameProfile, ColumnStore, RunningTop
+from common.sketches import (NumericSummary, FixedHistogram, histogram_frame, numeric_stats_frame,
+                             accumulate_state)
+from common.instrumentation import stage, iter_stage
+from common.reports import select, wanted
+from data_products.extract import extract_product
+from data_products.transform import transform_product
+from data_products.dedup import product_deduplicator
+from data_products.load import load_product_stream
+from data_products.data_profiling import inspect_data
+
+
+class DemographiAccumulator:
+    """
+    Versi incremental dari transform.demographi. Report yang dihasilkan punya
+    sheet dan kolom yang sama.
+    """
+
+    def __init__(self):
+        self.profile = FrameProfile()
+        self.numeric = ColumnStore()
+        self.max_discount = RunningTop("discount_percentage")
+        self.best_selling = RunningTop("no_of_ratings")
+        self.top_revenue = RunningTop("potential_revenue", n=5, keep_columns=["name", "potential_revenue"])
+
+    def update(self, chunk):
+        self.profile.update(chunk)
+        self.numeric.update(chunk, chunk.select_dtypes(include="number").columns.tolist())
+        self.max_discount.update(chunk)
+        self.best_selling.update(chunk)
+        self.top_revenue.update(chunk)
+
+    def merge(self, other):
+        self.profile.merge(other.profile)
+        self.numeric.merge(other.numeric)
+        self.max_discount.merge(other.max_discount)
+        self.best_selling.merge(other.best_selling)
+        self.top_revenue.merge(other.top_revenue)
+        return self
+
+    def report(self):
+        report = {}
+        num = self.numeric.frame()
+        num = num[[c for c in self.profile.numeric_columns() if c in num.columns]]
+
+        # Teknis
+        report["Basic_Info"] = self.profile.basic_info()
+        report["Data_Types"] = self.profile.data_types()
+
+        num_desc = num.describe().T.reset_index()
+        num_desc.rename(columns={"index": "Column"}, inplace=True)
+        report["Numeric_Stats"] = num_desc
+
+        report["Missing_By_Column"] = self.profile.missing_by_column()
+
+        # Bisnis
+        biz = {
+            "Avg Price": num["actual_price"].mean(),
+            "Median Price": num["actual_price"].median(),
+            "Avg Discount %": num["discount_percentage"].mean(),
+            "Total Potential Revenue": num["potential_revenue"].sum(),
+            "Total Potential Loss (Discount)": num["potential_loss_from_discount"].sum(),
+        }
+        report["Business_Summary"] = pd.DataFrame(list(biz.items()), columns=["Metric", "Value"])
+
+        max_disc = self.max_discount.frame().iloc[0]
+        report["Max_Discount_Product"] = pd.DataFrame({
+            "Name": [max_disc["name"]],
+            "Discount%": [max_disc["discount_percentage"]],
+            "Price": [max_disc["actual_price"]]
+        })
+
+        best = self.best_selling.frame().iloc[0]
+        report["Best_Selling"] = pd.DataFrame({
+            "Name": [best["name"]],
+            "Ratings": [best["no_of_ratings"]],
+            "Avg_Rating": [best["ratings"]]
+        })
+
+        report["Top5_Revenue"] = self.top_revenue.frame()
+
+        report["Price_Distribution"] = pd.cut(num["actual_price"], bins=5).value_counts().reset_index()
+        report["Price_Distribution"].columns = ["Price_Range", "Count"]
+
+        return report
+
+
+class ApproxDemographiAccumulator:
+    """
+    Versi approximate dengan memory konstan: median/quartile dari quantile
+    sketch, distribusi harga dari histogram bin tetap, duplicate dari
+    HyperLogLog. Sheet sama dengan report exact, ditambah kolom Error
+    (batas error absolut) di sheet yang nilainya estimasi. State bisa
+    di-merge antar partisi dan disimpan untuk digabung dengan hari berikutnya.
+    """
+
+    def __init__(self, relative_accuracy=0.01):
+        self.relative_accuracy = relative_accuracy
+        self.profile = FrameProfile(approximate=True)
+        self.numeric = {}
+        self.price_hist = FixedHistogram()
+        self.max_discount = RunningTop("discount_percentage")
+        self.best_selling = RunningTop("no_of_ratings")
+        self.top_revenue = RunningTop("potential_revenue", n=5, keep_columns=["name", "potential_revenue"])
+
+    def update(self, chunk):
+        self.profile.update(chunk)
+        for col in chunk.select_dtypes(include="number").columns:
+            self.numeric.setdefault(col, NumericSummary(self.relative_accuracy)).update(chunk[col])
+        self.price_hist.update(chunk["actual_price"])
+        self.max_discount.update(chunk)
+        self.best_selling.update(chunk)
+        self.top_revenue.update(chunk)
+
+    def merge(self, other):
+        self.profile.merge(other.profile)
+        for col, summary in other.numeric.items():
+            if col in self.numeric:
+                self.numeric[col].merge(summary)
+            else:
+                self.numeric[col] = summary
+        self.price_hist.merge(other.price_hist)
+        self.max_discount.merge(other.max_discount)
+        self.best_selling.merge(other.best_selling)
+        self.top_revenue.merge(other.top_revenue)
+        return self
+
+    def report(self):
+        report = {}
+        num = {c: self.numeric[c] for c in self.profile.numeric_columns() if c in self.numeric}
+
+        report["Basic_Info"] = self.profile.basic_info()
+        report["Data_Types"] = self.profile.data_types()
+        report["Numeric_Stats"] = numeric_stats_frame(num)
+        report["Missing_By_Column"] = self.profile.missing_by_column()
+
+        price = num["actual_price"]
+        median_price = price.quantile(0.5)
+        biz = [
+            ("Avg Price", price.mean, 0.0),
+            ("Median Price", median_price, price.sketch.error_bound(median_price)),
+            ("Avg Discount %", num["discount_percentage"].mean, 0.0),
+            ("Total Potential Revenue", num["potential_revenue"].total, 0.0),
+            ("Total Potential Loss (Discount)", num["potential_loss_from_discount"].total, 0.0),
+        ]
+        report["Business_Summary"] = pd.DataFrame(biz, columns=["Metric", "Value", "Error"])
+
+        max_disc = self.max_discount.frame().iloc[0]
+        report["Max_Discount_Product"] = pd.DataFrame({
+            "Name": [max_disc["name"]],
+            "Discount%": [max_disc["discount_percentage"]],
+            "Price": [max_disc["actual_price"]]
+        })
+
+        best = self.best_selling.frame().iloc[0]
+        report["Best_Selling"] = pd.DataFrame({
+            "Name": [best["name"]],
+            "Ratings": [best["no_of_ratings"]],
+            "Avg_Rating": [best["ratings"]]
+        })
+
+        report["Top5_Revenue"] = self.top_revenue.frame()
+        report["Price_Distribution"] = histogram_frame(self.price_hist, ["Price_Range", "Count"])
+        return report
+
+
+def approximate_demographi(df, state_path=None):
+    """
+    Report demographi approximate untuk frame utuh. state_path: sketch
+    run sebelumnya (kalau ada) digabung, lalu state gabungan disimpan lagi.
+    """
+    demo = ApproxDemographiAccumulator()
+    demo.update(df)
+    return accumulate_state(demo, state_path).report()
+
+
+def run_stream(path, chunksize, filename, backends=("excel",), excel_rows=None,
+               workers=None, partition_rows=None, approximate=False, state_path=None,
+               near_duplicates=False, dedup_state=None, sections=None):
+    demo = ApproxDemographiAccumulator() if approximate else DemographiAccumulator()
+    # Satu deduplicator untuk semua chunk → dedup berlaku lintas chunk
+    dedup = product_deduplicator(near_duplicates, dedup_state, source=path)
+    chunks = _inspect_first(iter_stage("extract", extract_product(path, chunksize=chunksize)))
+
+    def cleaned():
+        for chunk in chunks:
+            chunk = _transform(chunk, workers, partition_rows, dedup)
+            with stage("demographi_update", rows_in=len(chunk)):
+                demo.update(chunk)
+            yield chunk
+
+    def report():
+        report = select(accumulate_state(demo, state_path).report() if approximate else demo.report(), sections)
+        if wanted(sections, "Dedup_Summary"):
+            report["Dedup_Summary"] = dedup.summary()
+        dedup.save()
+        return report
+
+    load_product_stream(cleaned(), report, filename, backends, excel_rows)
+
+
+def _transform(chunk, workers=None, partition_rows=None, dedup=None):
+    with stage("transform", rows_in=len(chunk)) as rec:
+        chunk = transform_product(chunk, workers=workers, partition_rows=partition_rows, dedup=dedup)
+        rec["rows_out"] = len(chunk)
+    return chunk
+
+
+def _inspect_first(chunks):
+    # Profiling raw data hanya dari chunk pertama (sampel), bukan seluruh file
+    for i, chunk in enumerate(chunks):
+        if i == 0:
+            with stage("inspect_data", rows_in=len(chunk)):
+                inspect_data(chunk)
+        yield chunk
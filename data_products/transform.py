@@ -1,80 +1,120 @@
 import pandas as pd
 import numpy as np
-import re
-
-def transform_product(df):
-    # Fix ratings: convert to numeric (keep NaN for missing data)
-    df["ratings"] = pd.to_numeric(df["ratings"], errors="coerce")
-    
-    # Fix no_of_ratings: remove commas and convert to numeric
-    df["no_of_ratings"] = df["no_of_ratings"].astype(str).str.replace(",", "", regex=False)
-    df["no_of_ratings"] = pd.to_numeric(
-        df["no_of_ratings"].replace({"GET": np.nan, "FREE Delivery by Amazon": np.nan}),
-        errors="coerce"
-    )
-
-    def split_currency(val):
-        if pd.isna(val): 
-            return (np.nan, np.nan)
-        m = re.match(r"([^\d]+)([\d.,]+)", str(val))
-        return (m.group(1).strip() if m else np.nan,
-                float(m.group(2).replace(",", "")) if m else np.nan)
-    
-    df[["type_currency", "actual_price"]] = df["actual_price"].apply(lambda x: pd.Series(split_currency(x)))
-    _, df["discount_price"] = zip(*df["discount_price"].apply(split_currency))
-
-    df["discount_price"] = df.apply(
-        lambda x: x["actual_price"] if pd.isna(x["discount_price"]) else x["discount_price"], axis=1
-    )
-    df["actual_price"] = df.apply(
-        lambda x: x["discount_price"] if pd.isna(x["actual_price"]) else x["actual_price"], axis=1
-    )
-
-    df.dropna(subset=["actual_price", "discount_price"], how="all", inplace=True)
-
-    df["discount_percentage"] = ((df["actual_price"] - df["discount_price"]) / df["actual_price"] * 100).round(2).fillna(0)
-    df["potential_revenue"] = df["discount_price"] * df["no_of_ratings"]
-    df["potential_loss_from_discount"] = (df["actual_price"] - df["discount_price"]) * df["no_of_ratings"]
-
-    # Hapus duplikat berdasarkan nama produk
-    df.drop_duplicates(subset=["name"], keep="first", inplace=True)
+from common.profiling import get_profile
+from common.instrumentation import stage
+from common.parallel import map_partitions
+from common.cache import cached_transform, code_version
+from common.reports import ReportRegistry
+from data_products.dedup import product_deduplicator
+from data_products.compact import compact_columns
+
+PRICE_PATTERN = r"^([^\d]+)([\d.,]+)"
+
+def split_currency(prices):
+    """
+    Pisahkan simbol currency (apa saja: ₹, $, Rs., dsb.) dan nominal harga.
+    Return (currency, amount) sebagai Series; NaN kalau format tidak cocok.
+    """
+    parts = prices.astype(str).str.extract(PRICE_PATTERN)
+    currency = parts[0].str.strip().astype("category")
+    amount = pd.to_numeric(parts[1].str.replace(",", "", regex=False), errors="coerce").astype("float64")
+    return currency, amount
+
+def transform_product(df, workers=None, partition_rows=None, cache=None, dedup=None):
+    """
+    workers > 1 (0 = semua core): langkah per row dijalankan paralel per
+    partisi (lihat common/parallel.py); dedup tetap setelah merge.
+    cache (RowCache): mode incremental, hanya row baru/berubah yang di-transform.
+    dedup (Deduplicator): dipakai ulang antar chunk/file supaya dedup berlaku
+    lintas chunk; default dedup nama + ASIN di frame ini saja.
+    """
+    if cache is None:
+        df = map_partitions(transform_product_rows, df, workers, partition_rows)
+    else:
+        # Termasuk modul yang dipakai transform_product_rows (compact, common.compact, ...)
+        code = code_version(transform_product_rows)
+        df = cached_transform(transform_product_rows, df, cache, code, workers, partition_rows)
+
+    with stage("dedup", rows_in=len(df)) as rec:
+        # Hapus duplikat berdasarkan nama ternormalisasi & ASIN (lihat dedup.py)
+        df = (dedup or product_deduplicator()).apply(df)
+        rec["rows_out"] = len(df)
 
     return df
 
-def demographi(df):
-    report = {}
-
-    # Teknis
-    report["Basic_Info"] = pd.DataFrame({
-        "Metric": [
-            "Total Rows", "Total Columns", "Missing Values",
-            "Duplicate Rows", "Memory Usage (KB)"
-        ],
-        "Value": [
-            len(df),
-            df.shape[1],
-            df.isnull().sum().sum(),
-            df.duplicated().sum(),
-            round(df.memory_usage().sum() / 1024, 2)
-        ]
-    })
+def transform_product_rows(df):
+    """
+    Langkah transform yang hanya butuh row itu sendiri (aman per partisi).
+    """
+    with stage("compact_columns", rows_in=len(df)):
+        # URL → ID + base bersama, kategori → categorical (lihat compact.py)
+        df = compact_columns(df)
+
+    with stage("parse_ratings", rows_in=len(df)):
+        # Fix ratings: convert to numeric (keep NaN for missing data)
+        df["ratings"] = pd.to_numeric(df["ratings"], errors="coerce").astype("float64")
+
+        # Fix no_of_ratings: remove commas and convert to numeric
+        df["no_of_ratings"] = df["no_of_ratings"].astype(str).str.replace(",", "", regex=False)
+        df["no_of_ratings"] = pd.to_numeric(
+            df["no_of_ratings"].replace({"GET": np.nan, "FREE Delivery by Amazon": np.nan}),
+            errors="coerce"
+        ).astype("float64")
+
+    with stage("split_currency", rows_in=len(df)) as rec:
+        # Parsing harga (currency + nominal) secara column-wise
+        df["type_currency"], df["actual_price"] = split_currency(df["actual_price"])
+        _, df["discount_price"] = split_currency(df["discount_price"])
+
+        # Saling isi kalau salah satu harga kosong
+        df["discount_price"] = df["discount_price"].fillna(df["actual_price"])
+        df["actual_price"] = df["actual_price"].fillna(df["discount_price"])
+
+        df.dropna(subset=["actual_price", "discount_price"], how="all", inplace=True)
+        rec["rows_out"] = len(df)
+
+    with stage("derive_metrics", rows_in=len(df)):
+        df["discount_percentage"] = ((df["actual_price"] - df["discount_price"]) / df["actual_price"] * 100).round(2).fillna(0)
+        df["potential_revenue"] = df["discount_price"] * df["no_of_ratings"]
+        df["potential_loss_from_discount"] = (df["actual_price"] - df["discount_price"]) * df["no_of_ratings"]
+
+    return df
+
+REPORT = ReportRegistry()
+
+
+@REPORT.intermediate("profile")
+def _profile(df):
+    # Profil dihitung sekali per frame (lihat common/profiling.py) dari frame
+    # ringkas: URL lengkap hanya dibangun di writer sink, per chunk
+    return get_profile(df)
+
+
+# Teknis
+@REPORT.section("Basic_Info", requires=["profile"])
+def basic_info(df, profile):
+    return profile.basic_info()
+
 
-    # Data type counts
-    dtype_counts = df.dtypes.value_counts().reset_index()
-    dtype_counts.columns = ["Dtype", "Count"]
-    report["Data_Types"] = dtype_counts
+@REPORT.section("Data_Types", requires=["profile"])
+def data_types(df, profile):
+    return profile.data_types()
 
+
+@REPORT.section("Numeric_Stats", requires=["profile"])
+def numeric_stats(df, profile):
     # Descriptive stats untuk numeric
-    num_desc = df.describe().T.reset_index()
-    num_desc.rename(columns={"index": "Column"}, inplace=True)
-    report["Numeric_Stats"] = num_desc
+    return profile.numeric_stats()
+
 
-    # Missing values detail
-    miss = df.isnull().sum().reset_index()
-    miss.columns = ["Column", "Missing_Count"]
-    report["Missing_By_Column"] = miss
+@REPORT.section("Missing_By_Column", requires=["profile"])
+def missing_by_column(df, profile):
+    return profile.missing_by_column()
 
-    # Bisnis
+
+# Bisnis
+@REPORT.section("Business_Summary")
+def business_summary(df):
     biz = {
         "Avg Price": df["actual_price"].mean(),
         "Median Price": df["actual_price"].median(),
@@ -82,29 +122,47 @@ def demographi(df):
         "Total Potential Revenue": df["potential_revenue"].sum(),
         "Total Potential Loss (Discount)": df["potential_loss_from_discount"].sum(),
     }
-    report["Business_Summary"] = pd.DataFrame(list(biz.items()), columns=["Metric", "Value"])
+    return pd.DataFrame(list(biz.items()), columns=["Metric", "Value"])
+
 
+@REPORT.section("Max_Discount_Product")
+def max_discount_product(df):
     # Produk dengan diskon tertinggi
     max_disc = df.loc[df["discount_percentage"].idxmax()]
-    report["Max_Discount_Product"] = pd.DataFrame({
+    return pd.DataFrame({
         "Name": [max_disc["name"]],
         "Discount%": [max_disc["discount_percentage"]],
         "Price": [max_disc["actual_price"]]
     })
 
+
+@REPORT.section("Best_Selling")
+def best_selling(df):
     # Produk paling banyak terjual
     best = df.loc[df["no_of_ratings"].idxmax()]
-    report["Best_Selling"] = pd.DataFrame({
+    return pd.DataFrame({
         "Name": [best["name"]],
         "Ratings": [best["no_of_ratings"]],
         "Avg_Rating": [best["ratings"]]
     })
 
-    # Top 5 revenue
-    report["Top5_Revenue"] = df.nlargest(5, "potential_revenue")[["name", "potential_revenue"]]
 
+@REPORT.section("Top5_Revenue")
+def top5_revenue(df):
+    return df.nlargest(5, "potential_revenue")[["name", "potential_revenue"]]
+
+
+@REPORT.section("Price_Distribution")
+def price_distribution(df):
     # Distribusi harga (binning)
-    report["Price_Distribution"] = pd.cut(df["actual_price"], bins=5).value_counts().reset_index()
-    report["Price_Distribution"].columns = ["Price_Range", "Count"]
+    dist = pd.cut(df["actual_price"], bins=5).value_counts().reset_index()
+    dist.columns = ["Price_Range", "Count"]
+    return dist
+
 
-    return report
\ No newline at end of file
+def demographi(df, sections=None):
+    """
+    Report demographi {nama sheet: DataFrame}. sections: subset nama di
+    REPORT.names() (default semua); section lain tidak dihitung.
+    """
+    return REPORT.build(df, sections)
@@ -0,0 +1,220 @@
+"""
+Company: normalisasi nama dan dimensi company untuk postings.
+
+transform() mengganti company + atributnya di frame postings dengan
+company_id (lihat CompanyDimension.split), jadi frame di memory (imputasi,
+report, profiling) hanya membawa satu integer per posting; nama & atribut
+disimpan sekali per company di Dim_Company. Output biasa membangun ulang
+kolom lebar per potongan row di writer sink (join); star schema menulis fact
+(company_id) + Dim_Company.
+
+company_id = surrogate key integer kecil (1, 2, 3, ... urut kemunculan
+pertama). Dengan state_path, mapping nama → id disimpan di file (default
+.cache/company_ids.csv) dan dipakai lagi di run berikutnya, jadi id stabil
+antar chunk dan antar run (aman untuk upsert SQLite & mode streaming), dan
+tetap exact di Excel.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+from common.profiling import memory_usage
+
+# Rating yang menempel di belakang nama company, mis. "Acme Labs 4.5"
+RATING_SUFFIX = r"\s*\d+(\.\d+)?$"
+
+COMPANY_IDS_PATH = os.path.join(".cache", "company_ids.csv")
+
+DIMENSION_COLUMNS = [
+    "company_rating", "company_size", "company_type", "company_sector",
+    "company_industry", "company_founded", "company_revenue",
+]
+
+# Dtype kolom yang masuk Numeric_Stats (sama dengan mode frame lebar)
+NUMERIC_DTYPES = ["int64", "float64", "Int64"]
+
+
+def normalize_company(names):
+    """
+    Hapus rating di belakang nama + strip. Regex hanya dijalankan sekali per
+    nama unik, lalu dipetakan balik ke setiap row.
+    """
+    codes, uniques = pd.factorize(names)
+    cleaned = pd.Series(uniques, dtype=names.dtype).str.replace(RATING_SUFFIX, "", regex=True).str.strip()
+    return pd.Series(cleaned.array.take(codes, allow_fill=True), index=names.index, dtype=names.dtype)
+
+
+def _align_categories(a, b):
+    # Categorical dengan categories berbeda (per chunk) → categories gabungan di keduanya
+    for col in a.columns:
+        x, y = a[col].dtype, b[col].dtype
+        if isinstance(x, pd.CategoricalDtype) and isinstance(y, pd.CategoricalDtype) and x != y:
+            dtype = pd.CategoricalDtype(x.categories.union(y.categories))
+            a[col], b[col] = a[col].astype(dtype), b[col].astype(dtype)
+    return a, b
+
+
+def _combine(table, other):
+    """
+    Company baru dari other ditambahkan; company yang sudah ada tetap memakai
+    nilainya, hanya NaN yang diisi dari other (nilai valid pertama per kolom).
+    """
+    table, other = _align_categories(table.copy(), other.copy())
+    new = other[~other.index.isin(table.index)]
+    if len(new):
+        table = pd.concat([table, new])
+    for col in table.columns:
+        gaps = table[col].isna()
+        if gaps.any():
+            table[col] = table[col].fillna(other[col].reindex(table.index))
+    return table
+
+
+class CompanyDimension:
+    """
+    split(chunk) → fact chunk (company & atribut diganti company_id), sambil
+    mengumpulkan Dim_Company: nilai valid pertama per atribut per company
+    (fill vectorized; setiap posting company itu mendapat nilai yang sama).
+    Bisa dipanggil per chunk (mode streaming). state_path: file mapping
+    company → company_id; dibaca di awal dan ditulis ulang di save().
+
+    lookup(ids, col) memetakan company_id balik ke nilai kolom dimensi per
+    posting (untuk report); join(chunk) membangun ulang frame lebar dengan
+    urutan kolom aslinya (untuk output).
+    """
+
+    def __init__(self, columns=DIMENSION_COLUMNS, state_path=None):
+        self.columns = columns
+        self.state_path = state_path
+        self.table = None
+        # Urutan kolom frame lebar saat split pertama, untuk join()
+        self.layout = None
+        # Posisi nama di index + 1 = company_id
+        self.names = pd.Index([], dtype=object)
+        if state_path and os.path.exists(state_path):
+            ids = pd.read_csv(state_path, dtype={"company_id": "int64", "company": object}, keep_default_na=False)
+            if not ids["company_id"].equals(pd.Series(np.arange(1, len(ids) + 1), name="company_id")):
+                raise ValueError(f"{state_path}: company_id harus urut 1..n")
+            self.names = pd.Index(ids["company"])
+
+    def ids(self, names):
+        """Series nama company → Series company_id (Int64); nama baru dapat id berikutnya."""
+        codes, uniques = pd.factorize(names)
+        uniques = pd.Index(np.asarray(uniques, dtype=object))
+        pos = self.names.get_indexer(uniques)
+        new = pos < 0
+        if new.any():
+            pos[new] = len(self.names) + np.arange(new.sum())
+            self.names = self.names.append(uniques[new])
+        ids = pd.array(np.append(pos + 1, 0)[codes], dtype="Int64")
+        ids[codes < 0] = pd.NA
+        return pd.Series(ids, index=names.index, name="company_id")
+
+    def split(self, chunk):
+        if self.layout is None:
+            self.layout = list(chunk.columns)
+        ids = self.ids(chunk["company"])
+        columns = [c for c in self.columns if c in chunk.columns]
+        first = chunk[["company", *columns]].groupby(ids, sort=False).first()
+        # Company yang sudah ada: nilai lama dipertahankan, NaN diisi dari chunk ini
+        self.table = first if self.table is None else _combine(self.table, first)
+
+        facts = chunk.drop(columns=["company", *columns])
+        facts.insert(0, "company_id", ids)
+        return facts
+
+    def dimension_columns(self):
+        return [] if self.table is None else list(self.table.columns)
+
+    def lookup(self, ids, col):
+        """Series company_id → Series nilai kolom dimensi per row (NaN kalau id tidak dikenal)."""
+        if self.table is None:
+            return pd.Series(pd.NA, index=ids.index, name=col, dtype=object)
+        pos = self.table.index.get_indexer(ids.to_numpy(dtype="int64", na_value=0))
+        return pd.Series(self.table[col].array.take(pos, allow_fill=True), index=ids.index, name=col)
+
+    def attach(self, chunk, columns):
+        """chunk (fact) + kolom dimensi hasil lookup; chunk asli tidak diubah."""
+        return chunk.assign(**{col: self.lookup(chunk["company_id"], col) for col in columns})
+
+    def join(self, chunk):
+        """Fact chunk → frame lebar (company & atribut per posting) dengan urutan kolom aslinya."""
+        if "company_id" not in chunk.columns:
+            return chunk
+        wide = self.attach(chunk, self.dimension_columns()).drop(columns="company_id")
+        return wide[[c for c in self.layout if c in wide.columns]]
+
+    def missing(self, ids):
+        """Jumlah posting dengan nilai kosong per kolom dimensi (seperti isna().sum() di frame lebar)."""
+        return pd.Series({col: int(self.lookup(ids, col).isna().sum()) for col in self.dimension_columns()},
+                         dtype="int64")
+
+    def memory_usage(self):
+        return 0 if self.table is None else int(memory_usage(self.table).sum())
+
+    def frame(self):
+        if self.table is None:
+            return pd.DataFrame(columns=["company_id", "company", *self.columns])
+        table = self.table.rename_axis("company_id").reset_index()
+        return table.sort_values("company", kind="stable", ignore_index=True)
+
+    def save(self):
+        if not self.state_path:
+            return
+        directory = os.path.dirname(self.state_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        ids = pd.DataFrame({"company_id": np.arange(1, len(self.names) + 1), "company": self.names})
+        tmp = self.state_path + ".tmp"
+        ids.to_csv(tmp, index=False)
+        os.replace(tmp, self.state_path)
+
+
+def company_dimension(star_schema=False):
+    """CompanyDimension untuk satu run; star schema memakai mapping id tersimpan (stabil antar run)."""
+    return CompanyDimension(state_path=COMPANY_IDS_PATH if star_schema else None)
+
+
+def posting_columns(profile, companies):
+    """
+    {kolom: dtype} postings seperti frame lebar: kolom fact (tanpa
+    company_id) + kolom dimensi, urut kolom aslinya. profile: DataProfile
+    atau FrameProfile dari fact frame.
+    """
+    dtypes = {c: profile.dtypes[c] for c in profile.columns if c != "company_id"}
+    for col in companies.dimension_columns():
+        dtypes[col] = companies.table[col].dtype
+    order = companies.layout or list(dtypes)
+    return {c: dtypes[c] for c in order if c in dtypes}
+
+
+def numeric_columns(profile, companies, exclude=("salary_estimate",)):
+    return [c for c, t in posting_columns(profile, companies).items()
+            if str(t) in NUMERIC_DTYPES and c not in exclude]
+
+
+def profile_sheets(profile, companies, missing):
+    """
+    Basic_Info, Data_Types, Missing_By_Column postings dari profil fact frame
+    + Dim_Company. Kolom & missing sama dengan frame lebar (missing atribut
+    dihitung per posting, lihat CompanyDimension.missing); memory = fact +
+    Dim_Company, yaitu yang benar-benar ada di memory.
+    """
+    columns = posting_columns(profile, companies)
+    fact_missing = profile.missing_by_column().set_index("Column")["Missing_Count"]
+    missing = pd.Series({c: int(missing[c]) if c in missing.index else int(fact_missing[c]) for c in columns},
+                        dtype="int64")
+
+    info = profile.basic_info().copy()
+    values = info.set_index("Metric")["Value"]
+    values["Total Columns"] = len(columns)
+    values["Missing Values"] = int(missing.sum())
+    values["Memory Usage (KB)"] = round(values["Memory Usage (KB)"] + companies.memory_usage() / 1024, 2)
+    info["Value"] = values.to_numpy()
+
+    types = pd.Series([str(t) for t in columns.values()]).value_counts().reset_index()
+    types.columns = ["Dtype", "Count"]
+
+    miss = missing.reset_index()
+    miss.columns = ["Column", "Missing_Count"]
+    return info, types, miss
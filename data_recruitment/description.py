@@ -0,0 +1,147 @@
+import re
+import pandas as pd
+
+# --- Skills (case-insensitive, whole-word)
+SKILLS_KEYWORDS = [
+    "Python", "SQL", "Spark", "Snowflake", "AWS", "Java", "JavaScript", "Scala",
+    "Tableau", "ETL", "Talend", "Informatica", "BigQuery", "PowerBI", "Looker",
+    "Redshift", "DBT", "Airflow", "HIVE", "Azure", "GCP", "Docker", "Kubernetes",
+    "Kafka", "MongoDB", "PostgreSQL", "MySQL", "Oracle", "Cassandra", "Redis",
+    "Terraform", "Jenkins", "Git", "Linux", "Hadoop", "Pandas", "NumPy",
+    "TensorFlow", "PyTorch", "Scikit-learn", "R", "SAS", "SPSS", "Excel"
+]
+
+# --- Experience level (urutan penting: level pertama yang cocok dipakai)
+LEVEL_PATTERNS = {
+    "Entry": [r"entry", r"0[-\s]?to[-\s]?2\s+years?", r"under\s+1\s+year", r"junior", r"fresher",
+              r"0[-\s]?2\s+years?"],
+    "Mid": [r"mid", r"3[-\s]?to[-\s]?5\s+years?", r"intermediate", r"3[-\s]?5\s+years?"],
+    "Senior": [r"senior", r"lead", r"6\+?\s+years?", r"8\+?\s+years?", r"manager", r"principal",
+               r"staff", r"architect"]
+}
+
+# --- Job type
+JOB_TYPE_PATTERNS = {
+    "Full-time": r"full[-\s]?time",
+    "Part-time": r"part[-\s]?time",
+    "Contract": r"contract",
+    "Internship": r"intern(?:ship)?",
+    "Remote": r"remote",
+    "Hybrid": r"hybrid"
+}
+
+# --- Benefits
+BENEFITS_KEYWORDS = {
+    "insurance": ["insurance", "medical", "dental", "vision", "health"],
+    "bonus": ["bonus", "incentive", "commission"],
+    "retirement": ["retirement", "401k", "pension"],
+    "stock": ["stock", "equity", "shares", "rsu"],
+    "assistance": ["assistance", "support", "help"],
+    "development": ["development", "training", "education", "learning"],
+    "vacation": ["vacation", "pto", "paid time off", "leave"],
+    "flexible": ["flexible", "work from home", "wfh"]
+}
+
+DESCRIPTION_COLUMNS = ["skills", "experience_level", "job_type", "benefits"]
+
+
+def _build_matcher():
+    """
+    Gabungkan semua keyword/pattern jadi satu regex yang di-scan sekali per deskripsi.
+    Setiap alternatif punya named group sendiri ("g<n>") yang dipetakan ke
+    (kategori, label). Alternatif dikelompokkan per karakter pertama supaya
+    regex engine cukup cek satu huruf di tiap batas kata, dan dibungkus
+    lookahead supaya match yang overlap tetap ketemu seperti re.search per keyword.
+    """
+    entries = []
+    for skill in SKILLS_KEYWORDS:
+        entries.append(("skills", skill, re.escape(skill)))
+    for lvl, patterns in LEVEL_PATTERNS.items():
+        for pattern in patterns:
+            entries.append(("experience_level", lvl, pattern))
+    for job_type, pattern in JOB_TYPE_PATTERNS.items():
+        entries.append(("job_type", job_type, pattern))
+    for benefit_type, keywords in BENEFITS_KEYWORDS.items():
+        for keyword in keywords:
+            entries.append(("benefits", benefit_type.capitalize(), re.escape(keyword)))
+
+    labels = {}
+    buckets = {}
+    for category, label, pattern in entries:
+        name = f"g{len(labels)}"
+        labels[name] = (category, label)
+        head = pattern[0].lower()
+        if head.isalnum():
+            buckets.setdefault(head, []).append(f"(?P<{name}>{pattern[1:]}\\b)")
+        else:
+            buckets.setdefault("", []).append(f"(?P<{name}>{pattern}\\b)")
+
+    branches = [f"{head}(?:{'|'.join(alts)})" for head, alts in buckets.items()]
+    regex = re.compile(r"\b(?=" + "|".join(branches) + ")", re.IGNORECASE)
+    return regex, labels
+
+
+_MATCHER, _GROUP_LABELS = _build_matcher()
+
+# Urutan output per kategori mengikuti urutan deklarasi di atas
+_ORDER = {
+    "skills": list(SKILLS_KEYWORDS),
+    "experience_level": list(LEVEL_PATTERNS),
+    "job_type": list(JOB_TYPE_PATTERNS),
+    "benefits": [b.capitalize() for b in BENEFITS_KEYWORDS],
+}
+
+
+def _found_labels(desc):
+    found = set()
+    for m in _MATCHER.finditer(desc):
+        found.add(_GROUP_LABELS[m.lastgroup])
+    return found
+
+
+def parse_description(desc):
+    """
+    Parse satu job_description dalam satu kali scan.
+    Return tuple (skills, experience_level, job_type, benefits); None kalau tidak ada.
+    """
+    if pd.isna(desc):
+        return (None, None, None, None)
+
+    found = _found_labels(desc)
+
+    def joined(category):
+        hits = [label for label in _ORDER[category] if (category, label) in found]
+        return ", ".join(hits) if hits else None
+
+    # Experience level: first-match-wins sesuai urutan Entry → Mid → Senior
+    level = next(
+        (lvl for lvl in _ORDER["experience_level"] if ("experience_level", lvl) in found),
+        None
+    )
+
+    return (joined("skills"), level, joined("job_type"), joined("benefits"))
+
+
+def parse_descriptions(descriptions):
+    """
+    Versi column-wise dari parse_description.
+    Deskripsi yang sama hanya di-parse sekali (banyak posting berbagi deskripsi).
+    Return DataFrame dengan kolom skills, experience_level, job_type, benefits.
+    """
+    codes, uniques = pd.factorize(descriptions)
+    parsed = [parse_description(desc) for desc in uniques]
+    parsed.append((None, None, None, None))  # code -1 = NaN
+
+    rows = [parsed[code] for code in codes]
+    return pd.DataFrame(rows, columns=DESCRIPTION_COLUMNS, index=descriptions.index, dtype=object)
+
+
+def description_hash(descriptions):
+    """
+    Hash 64-bit job_description sebagai string hex 16 karakter (bukan int64,
+    supaya tidak dibulatkan jadi float di Excel). NaN tetap NaN.
+    """
+    codes, uniques = pd.factorize(descriptions)
+    hashes = pd.util.hash_array(pd.Series(uniques, dtype=object).to_numpy())
+    hexes = pd.array([f"{h:016x}" for h in hashes], dtype="string")
+    return pd.Series(hexes.take(codes, allow_fill=True), index=descriptions.index, name="description_hash")
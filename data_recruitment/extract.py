@@ -1,4 +1,7 @@
-import pandas as pd
+from common.schema import read_csv_typed
+from data_recruitment.schema import RECRUITMENT_SCHEMA, RECRUITMENT_USECOLS
 
-def extract_recruitment(PATH_FILE_RECRUITMENT):
-    return pd.read_csv(PATH_FILE_RECRUITMENT, index_col=False)
\ No newline at end of file
+def extract_recruitment(PATH_FILE_RECRUITMENT, chunksize=None, usecols=RECRUITMENT_USECOLS, engine=None):
+    # chunksize → iterator DataFrame per chunk (mode streaming)
+    # engine="pyarrow" → parser CSV lebih cepat (kalau pyarrow ter-install)
+    return read_csv_typed(PATH_FILE_RECRUITMENT, RECRUITMENT_SCHEMA, usecols, chunksize=chunksize, engine=engine)
@@ -0,0 +1,65 @@
+import pandas as pd
+
+# Strategi imputasi: list group keys yang dicoba berurutan.
+# Group pertama yang punya median dipakai; sisanya tetap NaN.
+SALARY_STRATEGIES = {
+    # Perilaku default: hanya job serupa (company_id + job_title + experience_level)
+    "exact": [["company_id", "job_title", "experience_level"]],
+    # Fallback ke group yang lebih kasar kalau group persis tidak ada
+    "coarse": [
+        ["company_id", "job_title", "experience_level"],
+        ["company_id", "job_title"],
+        ["job_title", "experience_level"],
+    ],
+    # Fallback terakhir ke median per salary_unit
+    "unit": [
+        ["company_id", "job_title", "experience_level"],
+        ["salary_unit"],
+    ],
+}
+
+
+def group_median(values, df, keys):
+    """
+    Median `values` per group `keys`, di-broadcast balik ke setiap row df.
+    Row dengan key NaN/None tidak masuk group mana pun (hasil NaN).
+    """
+    return values.groupby([df[k] for k in keys], dropna=True, sort=False, observed=True).transform("median")
+
+
+def salary_medians(valid, keys, col="salary_estimate"):
+    """
+    Tabel median per group dari salary valid (> 0). Dipakai mode streaming:
+    tabel dihitung sekali dari seluruh chunk lalu di-join ke setiap chunk.
+    """
+    return valid.groupby(keys, dropna=True, sort=False, observed=True)[col].median().reset_index()
+
+
+def impute_salary(df, strategy="exact", col="salary_estimate", medians=None):
+    """
+    Isi salary yang NaN atau <= 0 dengan median job serupa.
+    Median dihitung sekali per group lalu di-join balik (linear, bukan scan per row).
+    `strategy` bisa nama di SALARY_STRATEGIES atau list group keys.
+    `medians` (opsional): list tabel dari salary_medians(), satu per group keys,
+    kalau median sudah dihitung di luar df (mis. lintas chunk).
+    """
+    keys_list = SALARY_STRATEGIES[strategy] if isinstance(strategy, str) else strategy
+
+    salary = pd.to_numeric(df[col], errors="coerce")
+    known = salary.notna() & (salary > 0)
+    # Hanya salary valid yang dipakai untuk menghitung median
+    valid = salary.where(known)
+
+    filled = valid
+    for i, keys in enumerate(keys_list):
+        missing = filled.isna()
+        if not missing.any():
+            break
+        if medians is None:
+            group_values = group_median(valid, df, keys)
+        else:
+            joined = df[keys].merge(medians[i], on=keys, how="left")
+            group_values = pd.Series(joined[col].to_numpy(), index=df.index)
+        filled = filled.where(~missing, group_values)
+
+    return filled
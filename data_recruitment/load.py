@@ -1,38 +1,73 @@
 import pandas as pd
-import os
-
-def load(df, demographi_report, filename):
-    os.makedirs("output", exist_ok=True)
-    path = f"output/{filename}.xlsx"
-
-    with pd.ExcelWriter(path, engine="openpyxl") as writer:
-        # Sheet utama: data hasil transformasi
-        df.to_excel(writer, sheet_name="Cleaned_Data", index=False)
-
-        # Sheet demographi
-        if isinstance(demographi_report, dict):
-            for sheet, data in demographi_report.items():
-                # Kalau data berupa DataFrame → langsung simpan
-                if isinstance(data, pd.DataFrame):
-                    data.to_excel(writer, sheet_name=sheet[:31], index=False)
-
-                # Kalau data berupa dict (contoh Salary_Distribution per unit)
-                elif isinstance(data, dict):
-                    for subkey, subdata in data.items():
-                        sub_sheet = f"{sheet}_{subkey}"[:31]  # max 31 karakter
-                        if isinstance(subdata, pd.DataFrame):
-                            subdata.to_excel(writer, sheet_name=sub_sheet, index=False)
-                        else:
-                            pd.DataFrame([subdata], columns=["Value"]) \
-                                .to_excel(writer, sheet_name=sub_sheet, index=False)
-
-                # Kalau bukan DataFrame/dict → simpan jadi DataFrame biasa
-                else:
-                    pd.DataFrame([data], columns=["Value"]) \
-                        .to_excel(writer, sheet_name=sheet[:31], index=False)
-
-        else:
-            pd.DataFrame(demographi_report.split("\n"), columns=["Demographi"]) \
-                .to_excel(writer, sheet_name="Demographi", index=False)
-
-    print(f"[INFO] Saved to {path}")
\ No newline at end of file
+from common.sinks import write_outputs
+from data_recruitment.schema import POSTING_TABLE, POSTING_STAR_TABLE
+from data_recruitment.company import CompanyDimension, COMPANY_IDS_PATH
+
+# Jumlah row fact yang di-join ke frame lebar sekaligus saat ditulis
+JOIN_ROWS = 50_000
+
+def report_sheets(demographi_report):
+    # Ubah report demographi jadi pasangan (nama sheet, DataFrame)
+    if isinstance(demographi_report, dict):
+        for sheet, data in demographi_report.items():
+            # Kalau data berupa DataFrame → langsung simpan
+            if isinstance(data, pd.DataFrame):
+                yield sheet[:31], data
+
+            # Kalau data berupa dict (contoh Salary_Distribution per unit)
+            elif isinstance(data, dict):
+                for subkey, subdata in data.items():
+                    sub_sheet = f"{sheet}_{subkey}"[:31]  # max 31 karakter
+                    if isinstance(subdata, pd.DataFrame):
+                        yield sub_sheet, subdata
+                    else:
+                        yield sub_sheet, pd.DataFrame([subdata], columns=["Value"])
+
+            # Kalau bukan DataFrame/dict → simpan jadi DataFrame biasa
+            else:
+                yield sheet[:31], pd.DataFrame([data], columns=["Value"])
+
+    else:
+        yield "Demographi", pd.DataFrame(demographi_report.split("\n"), columns=["Demographi"])
+
+def load(df, demographi_report, filename, backends=("excel",), excel_rows=None, star_schema=False,
+         company_ids=COMPANY_IDS_PATH, companies=None):
+    """
+    Simpan Cleaned_Data + report demographi.
+    backends: "excel", "parquet", "feather", "sqlite" (bisa lebih dari satu).
+    excel_rows: batas row Cleaned_Data di Excel (0 = hanya sheet report).
+    star_schema: Cleaned_Data jadi fact (company_id) + sheet Dim_Company.
+    company_ids: file mapping company → company_id (star schema), dipakai ulang antar run.
+    companies: CompanyDimension dari transform() (df berisi company_id).
+    """
+    load_stream([df], lambda: demographi_report, filename, backends, excel_rows, star_schema, company_ids,
+                companies)
+
+def load_stream(chunks, get_report, filename, backends=("excel",), excel_rows=None, star_schema=False,
+                company_ids=COMPANY_IDS_PATH, companies=None):
+    """
+    Versi streaming: Cleaned_Data ditulis per chunk.
+    get_report dipanggil setelah semua chunk habis (report baru lengkap saat itu).
+    companies: CompanyDimension yang dipakai transform; chunks berisi company_id
+    dan kolom company dibangun ulang per JOIN_ROWS row saat ditulis. Tanpa
+    companies, chunks dianggap frame lebar (kolom company + atribut).
+    """
+    table = POSTING_TABLE
+    get_sheets = lambda: report_sheets(get_report())
+    if star_schema:
+        if companies is None:
+            companies = CompanyDimension(state_path=company_ids)
+            chunks = (companies.split(chunk) for chunk in chunks)
+
+        # Dim_Company terkumpul dari semua chunk, jadi ditulis bersama report
+        def get_sheets():
+            companies.save()
+            return [("Dim_Company", companies.frame()), *report_sheets(get_report())]
+        table = POSTING_STAR_TABLE
+    elif companies is not None:
+        # Frame lebar hanya ada per potongan row, tidak pernah utuh di memory
+        chunks = (companies.join(chunk.iloc[start:start + JOIN_ROWS])
+                  for chunk in chunks for start in range(0, max(len(chunk), 1), JOIN_ROWS))
+    paths = write_outputs(chunks, get_sheets, filename, backends, excel_rows, table=table)
+    for path in paths:
+        print(f"[INFO] Saved to {path}")
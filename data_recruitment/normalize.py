@@ -0,0 +1,46 @@
+"""
+Normalisasi kolom salary & tanggal recruitment secara vectorized.
+
+salary_estimate "$85,000 /yr (est.)" → salary_estimate 85000.0,
+salary_unit "per year", currency "$". Aturannya sama dengan parse_salary
+per row yang lama: value = deretan angka, koma & titik pertama, unit =
+"yr" di mana saja (per year), kalau tidak "hr" (per hour), currency = "$"
+di mana saja. Hanya
+dijalankan per nilai unik (salary estimate banyak yang sama), lalu dipetakan
+balik ke setiap row; unit & currency langsung jadi categorical dengan
+categories tetap, jadi schema sama antar chunk/partisi.
+
+dates → datetime64[ns] (lihat common/dates.py), tidak diubah balik ke string.
+Format dideteksi per panggilan, tidak ada parser/cache yang dibagi antar
+chunk, run atau thread.
+"""
+import numpy as np
+import pandas as pd
+from common.dates import DateParser
+
+VALUE_PATTERN = r"([\d,.]+)"
+# Urut prioritas: "yr" dicek dulu, baru "hr"
+SALARY_UNITS = {"yr": "per year", "hr": "per hour"}
+CURRENCIES = ["$"]
+
+
+def parse_salaries(salary):
+    """Series string → DataFrame [salary_estimate, salary_unit, currency]."""
+    codes, uniques = pd.factorize(salary)
+    uniques = pd.Series(uniques, dtype="string")
+    value = uniques.str.extract(VALUE_PATTERN, expand=False).str.replace(",", "", regex=False)
+    value = pd.to_numeric(value, errors="coerce").astype("float64")
+    found = [uniques.str.contains(key, regex=False).fillna(False).to_numpy(bool) for key in SALARY_UNITS]
+    unit = pd.Categorical(np.select(found, list(SALARY_UNITS.values()), None),
+                          categories=["per hour", "per year"])
+    has_currency = uniques.str.contains("$", regex=False).fillna(False).to_numpy(bool)
+    currency = pd.Categorical(np.where(has_currency, "$", None), categories=CURRENCIES)
+    return pd.DataFrame({
+        "salary_estimate": value.array.take(codes, allow_fill=True),
+        "salary_unit": unit.take(codes, allow_fill=True),
+        "currency": currency.take(codes, allow_fill=True),
+    }, index=salary.index)
+
+
+def parse_dates(dates):
+    return DateParser().parse(dates)
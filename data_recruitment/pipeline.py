@@ -0,0 +1,71 @@
+"""
+Pipeline recruitment untuk satu file CSV dengan frame utuh di memory:
+extract → inspect_data → transform → demographi → load.
+Dipakai main_recruitment.py dan service (main_service.py); build_dag() untuk
+runner DAG (main_pipelines.py).
+"""
+from common.instrumentation import stage
+from common.dag import Dag
+from common.reports import select
+from data_recruitment.extract import extract_recruitment
+from data_recruitment.data_profiling import inspect_data
+from data_recruitment.transform import transform, demographi
+from data_recruitment.load import load
+from data_recruitment.streaming import approximate_demographi
+from data_recruitment.company import company_dimension
+
+
+def build_report(df, approximate=False, state_path=None, sections=None, companies=None):
+    if approximate:
+        return select(approximate_demographi(df, state_path=state_path, companies=companies), sections)
+    return demographi(df, sections, companies=companies)
+
+
+def run_pipeline(path, filename, backends=("excel",), excel_rows=None, workers=None, partition_rows=None,
+                 cache=None, approximate=False, state_path=None, inspect_filename="inspect_data_recruitment.txt",
+                 star_schema=False, sections=None):
+    with stage("extract") as rec:
+        df = extract_recruitment(path)
+        rec["rows_out"] = len(df)
+    with stage("inspect_data", rows_in=len(df)):
+        inspect_data(df, inspect_filename)
+    companies = company_dimension(star_schema)
+    with stage("transform", rows_in=len(df)) as rec:
+        df = transform(df, workers=workers, partition_rows=partition_rows, cache=cache, companies=companies)
+        rec["rows_out"] = len(df)
+    with stage("demographi", rows_in=len(df)):
+        df_demo = build_report(df, approximate, state_path, sections, companies)
+    with stage("load", rows_in=len(df)):
+        load(df, demographi_report=df_demo, filename=filename,
+             backends=backends, excel_rows=excel_rows, star_schema=star_schema, companies=companies)
+    return df
+
+
+def build_dag(path, filename, backends=("excel",), excel_rows=None, workers=None, partition_rows=None,
+              cache=None, approximate=False, state_path=None, inspect_filename="inspect_data_recruitment.txt",
+              star_schema=False, sections=None):
+    """
+    Stage yang sama dengan run_pipeline sebagai DAG: profile & transform
+    jalan bersamaan setelah extract. profile/report/load boleh di-skip
+    (Dag.skip); load tanpa report hanya menulis Cleaned_Data.
+    """
+    # Dimensi company diisi task transform, dipakai report & load
+    companies = company_dimension(star_schema)
+
+    def load_output(transform, report):
+        load(transform, demographi_report=report or {}, filename=filename,
+             backends=backends, excel_rows=excel_rows, star_schema=star_schema, companies=companies)
+
+    dag = Dag("recruitment")
+    dag.task("extract", lambda: extract_recruitment(path), resource="io")
+    dag.task("profile", lambda extract: inspect_data(extract, inspect_filename), deps=["extract"],
+             optional=True)
+    # Shallow copy: transform hanya mengganti kolom, frame extract tetap utuh untuk profile
+    dag.task("transform", lambda extract: transform(extract.copy(deep=False), workers=workers,
+                                                    partition_rows=partition_rows, cache=cache,
+                                                    companies=companies),
+             deps=["extract"])
+    dag.task("report", lambda transform: build_report(transform, approximate, state_path, sections, companies),
+             deps=["transform"], optional=True)
+    dag.task("load", load_output, deps=["transform", "report"], resource="io", optional=True)
+    return dag
@@ -0,0 +1,47 @@
+# Schema CSV recruitment (job postings)
+RECRUITMENT_SCHEMA = {
+    "Unnamed: 0": "int64",
+    "company": "string",
+    "company_rating": "float64",
+    "location": "category",
+    "job_title": "string",
+    "job_description": "string",
+    "salary_estimate": "string",
+    "company_size": "category",
+    "company_type": "category",
+    "company_sector": "category",
+    "company_industry": "category",
+    "company_founded": "float64",
+    "company_revenue": "string",
+    "dates": "string",
+}
+
+# Kolom yang dibaca; "Unnamed: 0" (index lama) dibuang di transform jadi tidak di-load
+RECRUITMENT_USECOLS = [c for c in RECRUITMENT_SCHEMA if c != "Unnamed: 0"]
+
+# Kolom yang hanya dipakai sebagai bagian key upsert SQLite (hash
+# job_description: posting berbeda bisa sama di empat kolom key lainnya);
+# tidak masuk report maupun backend lain
+KEY_ONLY_COLUMNS = ["description_hash"]
+
+# Tabel Cleaned_Data di backend sqlite: upsert per posting (company, judul,
+# lokasi, tanggal posting, hash job_description), index untuk lookup per
+# company & unit salary
+POSTING_TABLE = {
+    "table": "postings",
+    "keys": ["company", "job_title", "location", "dates", "description_hash"],
+    "key_only": KEY_ONLY_COLUMNS,
+    "indexes": ["company", "salary_unit", "company_sector"],
+}
+
+# Star schema (--star-schema): fact posting hanya menyimpan company_id,
+# atribut company di tabel dimensi Dim_Company (upsert per company_id)
+POSTING_STAR_TABLE = {
+    "table": "fact_postings",
+    "keys": ["company_id", "job_title", "location", "dates", "description_hash"],
+    "key_only": KEY_ONLY_COLUMNS,
+    "indexes": ["company_id", "salary_unit"],
+    "dimensions": {
+        "Dim_Company": {"keys": ["company_id"], "indexes": ["company", "company_sector"]},
+    },
+}
@@ -0,0 +1,364 @@
+"""
+Mode streaming pipeline recruitment: CSV dibaca per chunk dan tidak pernah
+digabung jadi satu frame.
+
+Langkah lintas row butuh data seluruh file, jadi dijalankan dua pass:
+1. Setiap chunk di-transform (transform_rows), company dipindah ke
+   CompanyDimension (chunk tinggal company_id), chunk disimpan sementara ke
+   disk, dan salary valid per group dikumpulkan untuk median.
+2. Chunk dibaca ulang, salary diimputasi dari tabel median, lalu masuk ke
+   aggregat demographi (atribut company dari dimensi yang sudah lengkap) dan
+   langsung ditulis ke output.
+
+Memory tidak sepenuhnya dibatasi ukuran chunk: median salary per group dan
+report exact (median, quartile, pd.cut, duplicate rows) butuh nilai semua row
+(lihat common/aggregates.py), plus satu entry per company / skill distinct.
+approximate=True memakai sketch dengan memory konstan untuk report; tabel
+median salary tetap exact.
+"""
+import os
+import tempfile
+
+import pandas as pd
+from common.aggregates import FrameProfile, ColumnStore, ValueCounter
+from common.sketches import (NumericSummary, HeavyHitters, HyperLogLog, FixedHistogram, histogram_frame,
+                             numeric_stats_frame, accumulate_state)
+from common.instrumentation import stage, iter_stage
+from common.reports import select
+from common.parallel import map_partitions
+from data_recruitment.extract import extract_recruitment
+from data_recruitment.transform import transform_rows
+from data_recruitment.company import (CompanyDimension, NUMERIC_DTYPES, company_dimension, profile_sheets,
+                                      numeric_columns)
+from data_recruitment.imputation import SALARY_STRATEGIES, salary_medians, impute_salary
+from data_recruitment.load import load_stream
+from data_recruitment.schema import KEY_ONLY_COLUMNS
+from data_recruitment.data_profiling import inspect_data
+
+
+def _numeric(frame):
+    # Kolom numerik yang masuk report (company_id hanya surrogate key)
+    if frame is None:
+        return []
+    return [c for c in frame.select_dtypes(include=NUMERIC_DTYPES).columns if c != "company_id"]
+
+
+class SalaryMedians:
+    """
+    Kumpulkan salary valid (> 0) beserta group keys dari semua chunk,
+    lalu hitung tabel median sekali untuk impute_salary(medians=...).
+    Memory O(row salary valid): salary + kode categorical group keys.
+    """
+
+    def __init__(self, strategy="exact", col="salary_estimate"):
+        self.keys_list = SALARY_STRATEGIES[strategy] if isinstance(strategy, str) else strategy
+        self.col = col
+        self.key_columns = list(dict.fromkeys(k for keys in self.keys_list for k in keys))
+        self.store = ColumnStore()
+
+    def observe(self, chunk):
+        salary = pd.to_numeric(chunk[self.col], errors="coerce")
+        valid = chunk[salary.notna() & (salary > 0)]
+        self.store.update(valid, self.key_columns + [self.col])
+
+    def tables(self):
+        valid = self.store.frame()
+        if valid.empty:
+            valid = pd.DataFrame(columns=self.key_columns + [self.col], dtype=float)
+        return [salary_medians(valid, keys, col=self.col) for keys in self.keys_list]
+
+
+class DemographiAccumulator:
+    """
+    Versi incremental dari transform.demographi. Report yang dihasilkan punya
+    sheet dan kolom yang sama. Memory O(row): hash per row (duplicate) dan
+    kolom numerik + salary_unit (median, quartile, pd.cut).
+    """
+
+    def __init__(self):
+        self.profile = FrameProfile(exclude=KEY_ONLY_COLUMNS)
+        self.values = ColumnStore()
+        self.skills = ValueCounter()
+        self.experience = ValueCounter(dropna=False)
+        self.job_types = ValueCounter()
+        self.companies = ValueCounter()
+        self.company_missing = pd.Series(dtype="int64")
+
+    def update(self, chunk, companies):
+        """chunk: fact chunk dari companies.split(); companies sudah berisi semua chunk."""
+        self.profile.update(chunk)
+        self.company_missing = self.company_missing.add(companies.missing(chunk["company_id"]), fill_value=0)
+        numeric = _numeric(chunk) + _numeric(companies.table)
+        self.values.update(companies.attach(chunk, _numeric(companies.table)), numeric + ["salary_unit"])
+        self.skills.update(chunk["skills"].dropna().str.split(", ").explode())
+        self.experience.update(chunk["experience_level"])
+        self.job_types.update(chunk["job_type"].dropna().str.split(", ").explode())
+        # Dihitung per company_id seperti demographi(); nama dari dimensi saat report
+        self.companies.update(chunk["company_id"])
+
+    def merge(self, other):
+        self.profile.merge(other.profile)
+        self.values.merge(other.values)
+        self.skills.merge(other.skills)
+        self.experience.merge(other.experience)
+        self.job_types.merge(other.job_types)
+        self.companies.merge(other.companies)
+        self.company_missing = self.company_missing.add(other.company_missing, fill_value=0)
+        return self
+
+    def report(self, companies):
+        report = {}
+        df = self.values.frame()
+        basic_info, data_types, missing_by_column = profile_sheets(self.profile, companies, self.company_missing)
+
+        # === TEKNIS ===
+        report["Basic_Info"] = basic_info
+        report["Data_Types"] = data_types
+
+        num_cols = [c for c in numeric_columns(self.profile, companies) if c in df.columns]
+        if num_cols:
+            num_desc = df[num_cols].describe().T.reset_index()
+            num_desc.rename(columns={"index": "Column"}, inplace=True)
+            report["Numeric_Stats"] = num_desc
+
+        salary_by_unit = {}
+        for unit in df["salary_unit"].dropna().unique():
+            sub = df[df["salary_unit"] == unit]["salary_estimate"].dropna()
+            if not sub.empty:
+                salary_by_unit[unit] = sub
+
+        salary_stats = {}
+        for unit, sub in salary_by_unit.items():
+            desc = sub.describe().reset_index()
+            desc.columns = ["Stat", "Value"]
+            salary_stats[unit] = desc
+        if salary_stats:
+            report["Salary_Stats_By_Unit"] = salary_stats
+
+        report["Missing_By_Column"] = missing_by_column
+
+        # === BISNIS / DEMOGRAFI ===
+        biz = {}
+        if df["company_rating"].notna().any():
+            biz["Avg Company Rating"] = df["company_rating"].mean()
+            biz["Median Company Rating"] = df["company_rating"].median()
+
+        founded_valid = df["company_founded"].dropna()
+        if not founded_valid.empty:
+            biz["Earliest Founded"] = int(founded_valid.min())
+            biz["Latest Founded"] = int(founded_valid.max())
+
+        salary_summary = []
+        for unit, sub in salary_by_unit.items():
+            salary_summary.append([f"Median Salary ({unit})", sub.median()])
+            salary_summary.append([f"Average Salary ({unit})", sub.mean()])
+
+        biz_df = pd.DataFrame(list(biz.items()), columns=["Metric","Value"])
+        if salary_summary:
+            salary_df = pd.DataFrame(salary_summary, columns=["Metric","Value"])
+            report["Business_Summary"] = pd.concat([biz_df, salary_df], ignore_index=True)
+        else:
+            report["Business_Summary"] = biz_df
+
+        if self.skills.counts:
+            report["Top_Skills"] = self.skills.to_frame(["Skill","Count"], n=10)
+
+        report["Experience_Distribution"] = self.experience.to_frame(["Experience_Level","Count"])
+
+        if self.job_types.counts:
+            report["JobType_Distribution"] = self.job_types.to_frame(["Job_Type","Count"])
+
+        top = self.companies.to_frame(["Company","Job_Postings"], n=10)
+        top["Company"] = companies.lookup(top["Company"].astype("Int64"), "company").to_numpy()
+        report["Top_Companies"] = top
+
+        salary_dist_list = {}
+        for unit, sub in salary_by_unit.items():
+            salary_dist = pd.cut(sub, bins=5).value_counts().reset_index()
+            salary_dist.columns = ["Salary_Range","Count"]
+            salary_dist_list[unit] = salary_dist
+        if salary_dist_list:
+            report["Salary_Distribution"] = salary_dist_list
+
+        return report
+
+
+class ApproxDemographiAccumulator:
+    """
+    Versi approximate dengan memory konstan: quartile/median dari quantile
+    sketch, Top_Skills & Top_Companies dari heavy hitters, distribusi salary
+    dari histogram bin tetap, distinct/duplicate dari HyperLogLog. Distribusi
+    experience & job type (kategori sedikit) tetap exact. Sheet yang nilainya
+    estimasi mendapat kolom Error / Count_Error.
+    """
+
+    def __init__(self, relative_accuracy=0.01, top_capacity=1024):
+        self.relative_accuracy = relative_accuracy
+        self.profile = FrameProfile(approximate=True, exclude=KEY_ONLY_COLUMNS)
+        self.numeric = {}
+        self.salary = {}
+        self.salary_hist = {}
+        self.skills = HeavyHitters(top_capacity)
+        self.experience = ValueCounter(dropna=False)
+        self.job_types = ValueCounter()
+        self.companies = HeavyHitters(top_capacity)
+        self.distinct_companies = HyperLogLog()
+        self.company_missing = pd.Series(dtype="int64")
+
+    def _summary(self, col):
+        return self.numeric.setdefault(col, NumericSummary(self.relative_accuracy))
+
+    def update(self, chunk, companies):
+        self.profile.update(chunk)
+        self.company_missing = self.company_missing.add(companies.missing(chunk["company_id"]), fill_value=0)
+        chunk = companies.attach(chunk, _numeric(companies.table) + ["company"])
+        for col in _numeric(chunk):
+            self._summary(col).update(chunk[col])
+        salary = pd.to_numeric(chunk["salary_estimate"], errors="coerce")
+        for unit, sub in salary.groupby(chunk["salary_unit"], observed=True):
+            sub = sub.dropna()
+            if sub.empty:
+                continue
+            self.salary.setdefault(unit, NumericSummary(self.relative_accuracy)).update(sub)
+            self.salary_hist.setdefault(unit, FixedHistogram()).update(sub)
+        self.skills.update(chunk["skills"].dropna().str.split(", ").explode())
+        self.experience.update(chunk["experience_level"])
+        self.job_types.update(chunk["job_type"].dropna().str.split(", ").explode())
+        self.companies.update(chunk["company"])
+        self.distinct_companies.update(chunk["company"])
+
+    def merge(self, other):
+        self.profile.merge(other.profile)
+        for mine, theirs in ((self.numeric, other.numeric), (self.salary, other.salary),
+                             (self.salary_hist, other.salary_hist)):
+            for key, acc in theirs.items():
+                if key in mine:
+                    mine[key].merge(acc)
+                else:
+                    mine[key] = acc
+        self.skills.merge(other.skills)
+        self.experience.merge(other.experience)
+        self.job_types.merge(other.job_types)
+        self.companies.merge(other.companies)
+        self.distinct_companies.merge(other.distinct_companies)
+        self.company_missing = self.company_missing.add(other.company_missing, fill_value=0)
+        return self
+
+    def report(self, companies):
+        report = {}
+        basic_info, data_types, missing_by_column = profile_sheets(self.profile, companies, self.company_missing)
+
+        # === TEKNIS ===
+        report["Basic_Info"] = basic_info
+        report["Data_Types"] = data_types
+
+        num = {c: self.numeric[c] for c in numeric_columns(self.profile, companies) if c in self.numeric}
+        if num:
+            report["Numeric_Stats"] = numeric_stats_frame(num)
+
+        if self.salary:
+            report["Salary_Stats_By_Unit"] = {unit: s.describe() for unit, s in self.salary.items()}
+
+        report["Missing_By_Column"] = missing_by_column
+
+        # === BISNIS / DEMOGRAFI ===
+        biz = []
+        rating = self.numeric.get("company_rating")
+        if rating is not None and rating.count:
+            median = rating.quantile(0.5)
+            biz.append(["Avg Company Rating", rating.mean, 0.0])
+            biz.append(["Median Company Rating", median, rating.sketch.error_bound(median)])
+
+        founded = self.numeric.get("company_founded")
+        if founded is not None and founded.count:
+            biz.append(["Earliest Founded", int(founded.min), 0.0])
+            biz.append(["Latest Founded", int(founded.max), 0.0])
+
+        distinct = self.distinct_companies.estimate()
+        biz.append(["Distinct Companies", round(distinct), self.distinct_companies.error_bound(distinct)])
+
+        for unit, s in self.salary.items():
+            median = s.quantile(0.5)
+            biz.append([f"Median Salary ({unit})", median, s.sketch.error_bound(median)])
+            biz.append([f"Average Salary ({unit})", s.mean, 0.0])
+        report["Business_Summary"] = pd.DataFrame(biz, columns=["Metric", "Value", "Error"])
+
+        if self.skills.counts:
+            report["Top_Skills"] = self.skills.to_frame(["Skill","Count"], n=10)
+
+        report["Experience_Distribution"] = self.experience.to_frame(["Experience_Level","Count"])
+
+        if self.job_types.counts:
+            report["JobType_Distribution"] = self.job_types.to_frame(["Job_Type","Count"])
+
+        report["Top_Companies"] = self.companies.to_frame(["Company","Job_Postings"], n=10)
+
+        if self.salary_hist:
+            report["Salary_Distribution"] = {
+                unit: histogram_frame(hist, ["Salary_Range","Count"]) for unit, hist in self.salary_hist.items()
+            }
+
+        return report
+
+
+def approximate_demographi(df, state_path=None, companies=None):
+    """
+    Report demographi approximate untuk frame utuh. state_path: sketch
+    run sebelumnya (kalau ada) digabung, lalu state gabungan disimpan lagi.
+    companies: CompanyDimension dari transform(); tanpa itu df dianggap
+    frame lebar (kolom company) dan di-split di sini.
+    """
+    if companies is None:
+        companies = CompanyDimension()
+        df = companies.split(df)
+    demo = ApproxDemographiAccumulator()
+    demo.update(df, companies)
+    return accumulate_state(demo, state_path).report(companies)
+
+
+def run_stream(path, chunksize, filename, salary_strategy="exact", backends=("excel",), excel_rows=None,
+               workers=None, partition_rows=None, approximate=False, state_path=None, star_schema=False,
+               sections=None):
+    companies = company_dimension(star_schema)
+    salaries = SalaryMedians(salary_strategy)
+    demo = ApproxDemographiAccumulator() if approximate else DemographiAccumulator()
+
+    with tempfile.TemporaryDirectory(prefix="recruitment_chunks_") as spill_dir:
+        # Pass 1: transform per row + kumpulkan state global
+        spilled = []
+        chunks = iter_stage("extract", extract_recruitment(path, chunksize=chunksize))
+        for i, chunk in enumerate(chunks):
+            if i == 0:
+                # Profiling raw data hanya dari chunk pertama (sampel)
+                with stage("inspect_data", rows_in=len(chunk)):
+                    inspect_data(chunk)
+            with stage("transform_rows", rows_in=len(chunk)) as rec:
+                chunk = map_partitions(transform_rows, chunk, workers, partition_rows)
+                rec["rows_out"] = len(chunk)
+            with stage("company_dimension", rows_in=len(chunk)):
+                chunk = companies.split(chunk)
+            with stage("observe", rows_in=len(chunk)):
+                salaries.observe(chunk)
+            with stage("spill", rows_in=len(chunk)):
+                spill_path = os.path.join(spill_dir, f"chunk_{i:06d}.pkl")
+                chunk.to_pickle(spill_path)
+            spilled.append(spill_path)
+
+        with stage("salary_medians"):
+            medians = salaries.tables()
+
+        # Pass 2: langkah global per chunk → demographi → load
+        def cleaned():
+            for spill_path in spilled:
+                chunk = pd.read_pickle(spill_path)
+                with stage("impute_salary", rows_in=len(chunk)):
+                    chunk["salary_estimate"] = impute_salary(chunk, strategy=salaries.keys_list, medians=medians)
+                with stage("demographi_update", rows_in=len(chunk)):
+                    demo.update(chunk, companies)
+                yield chunk
+
+        def report():
+            demo_state = accumulate_state(demo, state_path) if approximate else demo
+            return select(demo_state.report(companies), sections)
+
+        load_stream(cleaned(), report, filename, backends, excel_rows, star_schema, companies=companies)
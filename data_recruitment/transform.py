@@ -1,147 +1,81 @@
 import pandas as pd
-import re
 import numpy as np
+from data_recruitment.company import normalize_company, CompanyDimension, profile_sheets, numeric_columns
+from data_recruitment.description import parse_descriptions, description_hash, DESCRIPTION_COLUMNS
+from data_recruitment.normalize import parse_salaries, parse_dates
+from data_recruitment.imputation import impute_salary
+from common.profiling import get_profile
+from data_recruitment.schema import KEY_ONLY_COLUMNS
+from common.instrumentation import stage
+from common.parallel import map_partitions
+from common.cache import cached_transform, code_version
+from common.reports import ReportRegistry
+from common.aggregates import ranked_counts
 
 pd.set_option('future.no_silent_downcasting', True)
 
-def transform(df):
+def transform(df, salary_strategy="exact", workers=None, partition_rows=None, cache=None, companies=None):
     """
     Transform recruitment data.
     Philosophy: Keep NaN for truly missing data to preserve data integrity.
     Only fill with meaningful defaults where it makes business sense.
+    salary_strategy: nama strategi di SALARY_STRATEGIES atau list group keys.
+    workers > 1 (0 = semua core): transform_rows dijalankan paralel per
+    partisi; dimensi company & imputasi tetap setelah merge.
+    cache (RowCache): mode incremental, transform_rows hanya untuk row
+    baru/berubah; dimensi company & imputasi dihitung ulang dari frame gabungan.
+    companies (CompanyDimension): company & atributnya dipindah ke sini dan
+    frame yang dikembalikan hanya membawa company_id (lihat company.py);
+    berikan objek yang sama ke demographi() & load().
+    """
+    if cache is None:
+        df = map_partitions(transform_rows, df, workers, partition_rows)
+    else:
+        # Termasuk modul yang dipakai transform_rows (company, description, normalize, common.dates, ...)
+        code = code_version(transform_rows)
+        df = cached_transform(transform_rows, df, cache, code, workers, partition_rows)
+
+    # 5-8. Company → company_id; atribut sekali per company di dimensi, diisi
+    # dengan nilai valid pertama company (NaN kalau memang tidak pernah ada)
+    with stage("company_dimension", rows_in=len(df)):
+        df = (companies if companies is not None else CompanyDimension()).split(df)
+
+    # 4b. Imputasi salary_estimate yang bernilai NaN
+    # Note: Only impute if we have similar jobs with known salaries
+    with stage("impute_salary", rows_in=len(df)):
+        df["salary_estimate"] = impute_salary(df, strategy=salary_strategy)
+
+    return df
+
+def transform_rows(df):
+    """
+    Langkah transform yang hanya butuh row itu sendiri, jadi aman dijalankan
+    per chunk/partisi. Langkah lintas row (dimensi company, imputasi salary)
+    ada di transform().
     """
-    
     # 0. Hapus kolom "Unnamed: 0" kalau ada
     if "Unnamed: 0" in df.columns:
         df = df.drop(columns=["Unnamed: 0"])
 
     # 1. Bersihkan kolom company (hapus angka di belakang nama)
-    df["company"] = df["company"].str.replace(r"\s*\d+(\.\d+)?$", "", regex=True).str.strip()
-    df = df[df["company"].notna() & (df["company"].str.strip() != "")]
+    with stage("clean_company", rows_in=len(df)) as rec:
+        df["company"] = normalize_company(df["company"])
+        df = df[df["company"].notna() & (df["company"] != "")]
+        rec["rows_out"] = len(df)
 
     # 2. company_rating → Keep NaN for missing ratings
     # Note: NaN means "not rated yet" which is different from rating of 0
     df["company_rating"] = pd.to_numeric(df["company_rating"], errors="coerce")
 
-    # 3. Parsing job_description
-    def parse_description(desc):
-        if pd.isna(desc):
-            return pd.Series([None, None, None, None])
-
-        # --- Skills (tambahkan lebih banyak skills dan case-insensitive matching)
-        skills_keywords = [
-            "Python", "SQL", "Spark", "Snowflake", "AWS", "Java", "JavaScript", "Scala",
-            "Tableau", "ETL", "Talend", "Informatica", "BigQuery", "PowerBI", "Looker",
-            "Redshift", "DBT", "Airflow", "HIVE", "Azure", "GCP", "Docker", "Kubernetes",
-            "Kafka", "MongoDB", "PostgreSQL", "MySQL", "Oracle", "Cassandra", "Redis",
-            "Terraform", "Jenkins", "Git", "Linux", "Hadoop", "Pandas", "NumPy",
-            "TensorFlow", "PyTorch", "Scikit-learn", "R", "SAS", "SPSS", "Excel"
-        ]
-        
-        # Improved skills detection - avoid partial matches
-        skills = []
-        for skill in skills_keywords:
-            if re.search(rf"\b{re.escape(skill)}\b", desc, re.IGNORECASE):
-                skills.append(skill)
-
-        # --- Experience level (perbaiki regex untuk lebih akurat)
-        level_patterns = {
-            "Entry": r"\b(entry|0[-\s]?to[-\s]?2\s+years?|under\s+1\s+year|junior|fresher|0[-\s]?2\s+years?)\b",
-            "Mid": r"\b(mid|3[-\s]?to[-\s]?5\s+years?|intermediate|3[-\s]?5\s+years?)\b", 
-            "Senior": r"\b(senior|lead|6\+?\s+years?|8\+?\s+years?|manager|principal|staff|architect)\b"
-        }
-        
-        level = None  # Keep as None instead of "Not Specified"
-        for lvl, pattern in level_patterns.items():
-            if re.search(pattern, desc, re.IGNORECASE):
-                level = lvl
-                break
-
-        # --- Job type (improved detection)
-        job_types = []
-        if re.search(r"\bfull[-\s]?time\b", desc, re.IGNORECASE):
-            job_types.append("Full-time")
-        if re.search(r"\bpart[-\s]?time\b", desc, re.IGNORECASE):
-            job_types.append("Part-time")
-        if re.search(r"\bcontract\b", desc, re.IGNORECASE):
-            job_types.append("Contract")
-        if re.search(r"\bintern(ship)?\b", desc, re.IGNORECASE):
-            job_types.append("Internship")
-        if re.search(r"\bremote\b", desc, re.IGNORECASE):
-            job_types.append("Remote")
-        if re.search(r"\bhybrid\b", desc, re.IGNORECASE):
-            job_types.append("Hybrid")
-            
-        job_type = ", ".join(job_types) if job_types else None
-
-        # --- Benefits
-        benefits_keywords = {
-            "insurance": ["insurance", "medical", "dental", "vision", "health"],
-            "bonus": ["bonus", "incentive", "commission"],
-            "retirement": ["retirement", "401k", "pension"],
-            "stock": ["stock", "equity", "shares", "rsu"],
-            "assistance": ["assistance", "support", "help"],
-            "development": ["development", "training", "education", "learning"],
-            "vacation": ["vacation", "pto", "paid time off", "leave"],
-            "flexible": ["flexible", "work from home", "wfh"]
-        }
-        
-        benefits = []
-        for benefit_type, keywords in benefits_keywords.items():
-            for keyword in keywords:
-                if re.search(rf"\b{re.escape(keyword)}\b", desc, re.IGNORECASE):
-                    benefits.append(benefit_type.capitalize())
-                    break  
-
-        return pd.Series([
-            ", ".join(skills) if skills else None,
-            level,
-            job_type,
-            ", ".join(benefits) if benefits else None
-        ])
-
-    df[["skills", "experience_level", "job_type", "benefits"]] = df["job_description"].apply(parse_description)
-
-    # 4. Parsing salary_estimate → float + unit + currency
-    def parse_salary(s):
-        if pd.isna(s):
-            return pd.Series([np.nan, None, None])
-        match = re.search(r"([\d,\.]+)", s)
-        salary = float(match.group(1).replace(",", "")) if match else np.nan
-        unit = "per year" if "yr" in s else "per hour" if "hr" in s else None
-        currency = "$" if "$" in s else None
-        return pd.Series([salary, unit, currency])
-
-    df[["salary_estimate", "salary_unit", "currency"]] = df["salary_estimate"].apply(parse_salary)
+    # 3. Parsing job_description (skills, level, job type, benefits) dalam satu scan
+    with stage("parse_description", rows_in=len(df)):
+        df[DESCRIPTION_COLUMNS] = parse_descriptions(df["job_description"])
 
-    # 4b. Imputasi salary_estimate yang bernilai NaN
-    # Note: Only impute if we have similar jobs with known salaries
-    def fill_salary(row):
-        if pd.notna(row["salary_estimate"]) and row["salary_estimate"] > 0:
-            return row["salary_estimate"]
-
-        mask = (
-            (df["company"] == row["company"]) &
-            (df["job_title"] == row["job_title"]) &
-            (df["experience_level"] == row["experience_level"]) &
-            (df["salary_estimate"].notna()) &
-            (df["salary_estimate"] > 0)
-        )
-        if mask.any():
-            return df.loc[mask, "salary_estimate"].median()
-        
-        # If no match found, keep as NaN (don't force to 0)
-        return np.nan
-
-    df["salary_estimate"] = df.apply(fill_salary, axis=1)
-
-    # 5-8. Keep NaN for missing categorical data
-    # Note: NaN is more honest than "-" for missing data
-    # Let downstream systems decide how to handle missing values
-    for col in ["company_size", "company_type", "company_sector", "company_industry"]:
-        # Try to fill within same company first
-        df[col] = df.groupby("company")[col].transform(lambda x: x.ffill().bfill())
-        # Keep remaining as NaN (don't fill with "-")
+    # 4. Parsing salary_estimate → float + unit + currency (categorical), satu regex per nilai unik
+    with stage("parse_salary", rows_in=len(df)):
+        salary = parse_salaries(df["salary_estimate"])
+        for col in salary.columns:
+            df[col] = salary[col]
 
     # 9. Company founded → Keep as nullable integer (Int64)
     # Note: NaN means "founding year unknown", which is different from year 0 or -1
@@ -151,130 +85,176 @@ def transform(df):
     # Note: NaN is clearer than "-" for data pipelines
     df["company_revenue"] = df["company_revenue"].replace("", np.nan)
 
-    # 11. Improved date formatting
-    df["dates"] = pd.to_datetime(df["dates"], errors="coerce", utc=True)
-    df["dates"] = df["dates"].dt.strftime("%Y-%m-%d")
+    # 11. dates → datetime64 (format dideteksi sekali lalu di-cache), tetap datetime sampai output
+    with stage("parse_dates", rows_in=len(df)):
+        df["dates"] = parse_dates(df["dates"])
 
-    # Drop original job_description
+    # Drop original job_description; hash-nya hanya untuk key upsert SQLite (lihat
+    # schema.KEY_ONLY_COLUMNS), tidak ikut report & backend lain
     if "job_description" in df.columns:
+        df["description_hash"] = description_hash(df["job_description"])
         df = df.drop(columns=["job_description"])
 
     return df
 
-def demographi(df):
-    """
-    Generate demographic report.
-    Handles NaN values appropriately in statistics.
-    """
-    report = {}
-
-    # === TEKNIS ===
-    report["Basic_Info"] = pd.DataFrame({
-        "Metric": [
-            "Total Rows", "Total Columns", "Missing Values",
-            "Duplicate Rows", "Memory Usage (KB)"
-        ],
-        "Value": [
-            len(df),
-            df.shape[1],
-            df.isnull().sum().sum(),
-            df.duplicated().sum(),
-            round(df.memory_usage().sum() / 1024, 2)
-        ]
-    })
+REPORT = ReportRegistry()
+
+
+@REPORT.intermediate("companies")
+def _companies(df):
+    # Diberikan pemanggil: demographi(df, companies=...) dengan dimensi dari transform()
+    raise ValueError("demographi butuh companies (CompanyDimension yang dipakai transform)")
+
+
+@REPORT.intermediate("profile")
+def _profile(df):
+    # Profil fact frame dihitung sekali per frame (lihat common/profiling.py)
+    return get_profile(df, exclude=KEY_ONLY_COLUMNS)
+
+
+@REPORT.intermediate("posting_profile", requires=["profile", "companies"])
+def _posting_profile(df, profile, companies):
+    # (Basic_Info, Data_Types, Missing_By_Column) dengan kolom company seperti frame lebar
+    return profile_sheets(profile, companies, companies.missing(df["company_id"]))
+
+
+@REPORT.intermediate("salary_by_unit")
+def _salary_by_unit(df):
+    # {unit: salary valid} sekali untuk Salary_Stats, Business_Summary & Salary_Distribution
+    salary_by_unit = {}
+    for unit in df["salary_unit"].dropna().unique():
+        sub = df["salary_estimate"][df["salary_unit"] == unit].dropna()
+        if not sub.empty:
+            salary_by_unit[unit] = sub
+    return salary_by_unit
+
 
-    # Data type counts
-    dtype_counts = df.dtypes.value_counts().reset_index()
-    dtype_counts.columns = ["Dtype", "Count"]
-    report["Data_Types"] = dtype_counts
+# === TEKNIS ===
+@REPORT.section("Basic_Info", requires=["posting_profile"])
+def basic_info(df, posting_profile):
+    return posting_profile[0]
 
-    # Descriptive stats untuk numeric (kecuali salary_estimate)
-    # Use dropna() in calculations to exclude NaN properly
-    num_cols = [c for c in df.select_dtypes(include=["int64","float64","Int64"]).columns 
-                if c != "salary_estimate"]
+
+@REPORT.section("Data_Types", requires=["posting_profile"])
+def data_types(df, posting_profile):
+    return posting_profile[1]
+
+
+@REPORT.section("Numeric_Stats", requires=["profile", "companies"])
+def numeric_stats(df, profile, companies):
+    # Descriptive stats untuk numeric (kecuali salary_estimate); kolom company per posting
+    num_cols = numeric_columns(profile, companies)
     if num_cols:
-        num_desc = df[num_cols].describe().T.reset_index()
+        dims = [c for c in num_cols if c in companies.dimension_columns()]
+        values = companies.attach(df[["company_id"] + [c for c in num_cols if c not in dims]], dims)
+        num_desc = values[num_cols].describe().T.reset_index()
         num_desc.rename(columns={"index": "Column"}, inplace=True)
-        report["Numeric_Stats"] = num_desc
+        return num_desc
+
 
+@REPORT.section("Salary_Stats_By_Unit", requires=["salary_by_unit"])
+def salary_stats_by_unit(df, salary_by_unit):
     # Descriptive stats salary dipisah berdasarkan unit
     salary_stats = {}
-    for unit in df["salary_unit"].dropna().unique():
-        sub = df[df["salary_unit"] == unit]["salary_estimate"].dropna()
-        if not sub.empty:
-            desc = sub.describe().reset_index()
-            desc.columns = ["Stat", "Value"]
-            salary_stats[unit] = desc
-    if salary_stats:
-        report["Salary_Stats_By_Unit"] = salary_stats
-
-    # Missing values detail
-    miss = df.isnull().sum().reset_index()
-    miss.columns = ["Column", "Missing_Count"]
-    report["Missing_By_Column"] = miss
-
-    # === BISNIS / DEMOGRAFI ===
+    for unit, sub in salary_by_unit.items():
+        desc = sub.describe().reset_index()
+        desc.columns = ["Stat", "Value"]
+        salary_stats[unit] = desc
+    return salary_stats or None
+
+
+@REPORT.section("Missing_By_Column", requires=["posting_profile"])
+def missing_by_column(df, posting_profile):
+    return posting_profile[2]
+
+
+# === BISNIS / DEMOGRAFI ===
+@REPORT.section("Business_Summary", requires=["salary_by_unit", "companies"])
+def business_summary(df, salary_by_unit, companies):
     biz = {}
-    
-    # Company rating stats (skip NaN)
-    if df["company_rating"].notna().any():
-        biz["Avg Company Rating"] = df["company_rating"].mean()
-        biz["Median Company Rating"] = df["company_rating"].median()
-    
+
+    # Company rating stats per posting (skip NaN)
+    rating = companies.lookup(df["company_id"], "company_rating")
+    if rating.notna().any():
+        biz["Avg Company Rating"] = rating.mean()
+        biz["Median Company Rating"] = rating.median()
+
     # Company founded stats (skip NaN)
-    founded_valid = df["company_founded"].dropna()
+    founded_valid = companies.lookup(df["company_id"], "company_founded").dropna()
     if not founded_valid.empty:
         biz["Earliest Founded"] = int(founded_valid.min())
         biz["Latest Founded"] = int(founded_valid.max())
 
     # Salary summary per unit
     salary_summary = []
-    for unit in df["salary_unit"].dropna().unique():
-        sub = df[df["salary_unit"] == unit]["salary_estimate"].dropna()
-        if not sub.empty:
-            salary_summary.append([f"Median Salary ({unit})", sub.median()])
-            salary_summary.append([f"Average Salary ({unit})", sub.mean()])
+    for unit, sub in salary_by_unit.items():
+        salary_summary.append([f"Median Salary ({unit})", sub.median()])
+        salary_summary.append([f"Average Salary ({unit})", sub.mean()])
 
     biz_df = pd.DataFrame(list(biz.items()), columns=["Metric","Value"])
     if salary_summary:
         salary_df = pd.DataFrame(salary_summary, columns=["Metric","Value"])
-        report["Business_Summary"] = pd.concat([biz_df, salary_df], ignore_index=True)
-    else:
-        report["Business_Summary"] = biz_df
+        return pd.concat([biz_df, salary_df], ignore_index=True)
+    return biz_df
+
 
+@REPORT.section("Top_Skills")
+def top_skills(df):
     # Top Skills (skip NaN)
     skills_series = df["skills"].dropna().str.split(", ")
     if not skills_series.empty:
-        all_skills = skills_series.explode().value_counts().reset_index()
+        all_skills = ranked_counts(skills_series.explode()).reset_index()
         all_skills.columns = ["Skill","Count"]
-        report["Top_Skills"] = all_skills.head(10)
+        return all_skills.head(10)
 
+
+@REPORT.section("Experience_Distribution")
+def experience_distribution(df):
     # Distribusi Experience Level (skip NaN)
-    exp_dist = df["experience_level"].value_counts(dropna=False).reset_index()
+    exp_dist = ranked_counts(df["experience_level"], dropna=False).reset_index()
     exp_dist.columns = ["Experience_Level","Count"]
-    report["Experience_Distribution"] = exp_dist
+    return exp_dist
+
 
+@REPORT.section("JobType_Distribution")
+def jobtype_distribution(df):
     # Distribusi Job Type (skip NaN)
     jobtype_series = df["job_type"].dropna().str.split(", ")
     if not jobtype_series.empty:
-        job_dist = jobtype_series.explode().value_counts().reset_index()
+        job_dist = ranked_counts(jobtype_series.explode()).reset_index()
         job_dist.columns = ["Job_Type","Count"]
-        report["JobType_Distribution"] = job_dist
+        return job_dist
+
+
+@REPORT.section("Top_Companies", requires=["companies"])
+def top_companies(df, companies):
+    # Top Companies dengan lowongan terbanyak: hitung per company_id, nama dari dimensi;
+    # jumlah sama → urut kemunculan pertama
+    counts = ranked_counts(df["company_id"]).head(10)
+    return pd.DataFrame({
+        "Company": companies.lookup(counts.index.to_series(), "company").to_numpy(),
+        "Job_Postings": counts.to_numpy(),
+    })
 
-    # Top Companies dengan lowongan terbanyak
-    top_companies = df["company"].value_counts().head(10).reset_index()
-    top_companies.columns = ["Company","Job_Postings"]
-    report["Top_Companies"] = top_companies
 
+@REPORT.section("Salary_Distribution", requires=["salary_by_unit"])
+def salary_distribution(df, salary_by_unit):
     # Distribusi Salary (binning per unit, skip NaN)
     salary_dist_list = {}
-    for unit in df["salary_unit"].dropna().unique():
-        sub = df[df["salary_unit"] == unit]["salary_estimate"].dropna()
-        if len(sub) > 0:
-            salary_dist = pd.cut(sub, bins=5).value_counts().reset_index()
-            salary_dist.columns = ["Salary_Range","Count"]
-            salary_dist_list[unit] = salary_dist
-    if salary_dist_list:
-        report["Salary_Distribution"] = salary_dist_list
-
-    return report
\ No newline at end of file
+    for unit, sub in salary_by_unit.items():
+        salary_dist = pd.cut(sub, bins=5).value_counts().reset_index()
+        salary_dist.columns = ["Salary_Range","Count"]
+        salary_dist_list[unit] = salary_dist
+    return salary_dist_list or None
+
+
+def demographi(df, sections=None, companies=None):
+    """
+    Generate demographic report.
+    Handles NaN values appropriately in statistics.
+    sections: subset nama di REPORT.names() (default semua); section lain
+    (dan intermediate yang hanya dipakai section itu) tidak dihitung.
+    companies: CompanyDimension dari transform() (nama & atribut company).
+    """
+    given = {} if companies is None else {"companies": companies}
+    return REPORT.build(df, sections, **given)
@@ -0,0 +1,81 @@
+"""
+Satu entry point untuk menjalankan beberapa pipeline sekaligus sebagai DAG
+(lihat common/dag.py): pipeline produk & recruitment jalan bersamaan, dan di
+dalam setiap pipeline profiling jalan paralel dengan transform.
+
+    python main_pipelines.py --pipeline products recruitment --limit cpu=1 io=2
+"""
+import argparse
+import sys
+
+from common.config import get_path
+from common.dag import run_dags, FAILED
+from common.instrumentation import add_arguments, run_context
+from data_products.pipeline import build_dag as products_dag
+from data_recruitment.pipeline import build_dag as recruitment_dag
+
+PIPELINES = {
+    "products": (products_dag, "PATH_FILE_PRODUCTS", "All Exercise and Fitness"),
+    "recruitment": (recruitment_dag, "PATH_FILE_RECRUITMENT", "data_requirements"),
+}
+
+# Stage yang boleh di-skip; extract & transform selalu jalan
+OPTIONAL_STAGES = ["profile", "report", "load"]
+
+
+def parse_limits(values):
+    limits = {}
+    for value in values or []:
+        resource, _, n = value.partition("=")
+        if not n.isdigit() or int(n) < 1:
+            raise argparse.ArgumentTypeError(f"--limit harus RESOURCE=N (N >= 1), bukan {value!r}")
+        limits[resource] = int(n)
+    return limits
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Jalankan pipeline produk & recruitment bersamaan (DAG)")
+    parser.add_argument("--pipeline", nargs="+", choices=list(PIPELINES), default=list(PIPELINES),
+                        help="Pipeline yang dijalankan (default: semua)")
+    parser.add_argument("--products-input", default=None,
+                        help="File CSV produk (default: PATH_FILE_PRODUCTS di env/config)")
+    parser.add_argument("--recruitment-input", default=None,
+                        help="File CSV recruitment (default: PATH_FILE_RECRUITMENT di env/config)")
+    parser.add_argument("--skip", nargs="+", choices=OPTIONAL_STAGES, default=[],
+                        help="Stage yang tidak dijalankan di semua pipeline")
+    parser.add_argument("--limit", nargs="+", default=None, metavar="RESOURCE=N",
+                        help="Batas stage yang jalan bersamaan per resource, mis. cpu=1 io=2 "
+                             "(extract & load = io, sisanya cpu)")
+    parser.add_argument("--max-stages", type=int, default=4,
+                        help="Jumlah thread runner DAG (stage yang bisa jalan bersamaan)")
+    parser.add_argument("--output", action="append", choices=["excel", "parquet", "feather", "sqlite"],
+                        help="Backend output (bisa diulang), default: excel")
+    parser.add_argument("--excel-rows", type=int, default=None,
+                        help="Batas row Cleaned_Data di Excel (0 = hanya sheet report)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Transform per row paralel dengan N proses (0 = semua core)")
+    add_arguments(parser)
+    args = parser.parse_args()
+    try:
+        limits = parse_limits(args.limit)
+    except argparse.ArgumentTypeError as e:
+        parser.error(str(e))
+    backends = args.output or ["excel"]
+
+    dags = []
+    for name in args.pipeline:
+        build, config_name, filename = PIPELINES[name]
+        try:
+            path = getattr(args, f"{name}_input") or get_path(config_name)
+        except RuntimeError as e:
+            parser.error(str(e))
+        dag = build(path, filename=filename, backends=backends, excel_rows=args.excel_rows,
+                    workers=args.workers)
+        dags.append(dag.skip(args.skip))
+
+    with run_context("pipelines", args):
+        status, _ = run_dags(dags, max_workers=args.max_stages, limits=limits)
+    for pipeline, tasks in status.items():
+        print(f"[INFO] {pipeline}: " + ", ".join(f"{task}={state}" for task, state in tasks.items()))
+    if any(state == FAILED for tasks in status.values() for state in tasks.values()):
+        sys.exit(1)
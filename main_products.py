@@ -1,12 +1,86 @@
-from config.config import PATH_FILE_PRODUCTS
-from data_products.extract import extract_product
-from data_products.transform import transform_product, demographi
-from data_products.load import load_product
-from data_products.data_profiling import inspect_data
+import argparse
+from common.config import get_path
+from common.instrumentation import add_arguments, run_context, stage
+from common.cache import RowCache
+from data_products.pipeline import run_pipeline
+from data_products.streaming import run_stream
+from data_products.batch import run_batch
+from common.multifile import is_multi
+from data_products.transform import REPORT
 
 if __name__ == "__main__":
-    df = extract_product(PATH_FILE_PRODUCTS)
-    inspect_data(df)
-    df = transform_product(df)
-    df_demo = demographi(df)
-    load_product(df, demographi_report=df_demo, filename="All Exercise and Fitness")
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Pipeline ETL produk e-commerce")
+    parser.add_argument("--input", default=None,
+                        help="File CSV, folder, atau glob (default: PATH_FILE_PRODUCTS di env/config)")
+    parser.add_argument("--per-category", action="store_true",
+                        help="Input folder/glob: transform setiap file kategori terpisah (paralel dengan --workers)")
+    parser.add_argument("--read-workers", type=int, default=None,
+                        help="Jumlah thread untuk membaca file (input folder/glob)")
+    parser.add_argument("--chunksize", type=int, default=None,
+                        help="Mode streaming: baca & proses CSV per N row")
+    parser.add_argument("--output", action="append", choices=["excel", "parquet", "feather", "sqlite"],
+                        help="Backend output (bisa diulang), default: excel")
+    parser.add_argument("--excel-rows", type=int, default=None,
+                        help="Batas row Cleaned_Data di Excel (0 = hanya sheet report)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Transform per row paralel dengan N proses (0 = semua core)")
+    parser.add_argument("--partition-rows", type=int, default=None,
+                        help="Ukuran partisi per task worker (default: otomatis)")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Hanya transform row baru/berubah, sisanya dari cache run sebelumnya")
+    parser.add_argument("--cache-dir", default=".cache", help="Folder cache mode incremental")
+    parser.add_argument("--cache-keep-runs", type=int, default=3,
+                        help="Row yang tidak muncul di N run terakhir dibuang dari cache")
+    parser.add_argument("--cache-max-rows", type=int, default=None, help="Batas jumlah row di cache")
+    parser.add_argument("--approximate", action="store_true",
+                        help="Report demographi dari sketch (memory konstan, nilai + batas error)")
+    parser.add_argument("--sketch-state", default=None,
+                        help="File state sketch: digabung dengan run sebelumnya lalu disimpan ulang "
+                             "(butuh --approximate; file pickle, hanya file terpercaya)")
+    parser.add_argument("--near-duplicates", action="store_true",
+                        help="Dedup juga nama produk yang hampir sama (MinHash/LSH), mis. nama terpotong \"...\"")
+    parser.add_argument("--dedup-state", default=None,
+                        help="File state dedup (.npz): produk yang sudah terlihat di run sebelumnya ikut dibuang")
+    parser.add_argument("--sections", nargs="+", default=None,
+                        choices=[*REPORT.names(), "Dedup_Summary", "Batch_Summary"],
+                        help="Hanya hitung & tulis section report ini (default: semua)")
+    add_arguments(parser)
+    args = parser.parse_args()
+    if args.sketch_state and not args.approximate:
+        parser.error("--sketch-state hanya untuk --approximate")
+    if args.incremental and args.chunksize:
+        parser.error("--incremental belum bisa digabung dengan --chunksize")
+    path = args.input or get_path("PATH_FILE_PRODUCTS")
+    batch = is_multi(path)
+    if batch and args.chunksize:
+        parser.error("Input folder/glob belum bisa digabung dengan --chunksize")
+    if args.per_category and (not batch or args.incremental):
+        parser.error("--per-category hanya untuk input folder/glob dan tanpa --incremental")
+    if args.per_category and args.dedup_state:
+        parser.error("--dedup-state belum bisa digabung dengan --per-category")
+    backends = args.output or ["excel"]
+    cache = RowCache(args.cache_dir, "products", keep_runs=args.cache_keep_runs,
+                     max_rows=args.cache_max_rows) if args.incremental else None
+
+    with run_context("products", args):
+        if batch:
+            run_batch(path, backends=backends, excel_rows=args.excel_rows, workers=args.workers,
+                      partition_rows=args.partition_rows, read_workers=args.read_workers,
+                      per_category=args.per_category, cache=cache,
+                      approximate=args.approximate, state_path=args.sketch_state,
+                      near_duplicates=args.near_duplicates, dedup_state=args.dedup_state,
+                      sections=args.sections)
+        elif args.chunksize:
+            with stage("stream"):
+                run_stream(path, args.chunksize, filename="All Exercise and Fitness",
+                           backends=backends, excel_rows=args.excel_rows,
+                           workers=args.workers, partition_rows=args.partition_rows,
+                           approximate=args.approximate, state_path=args.sketch_state,
+                           near_duplicates=args.near_duplicates, dedup_state=args.dedup_state,
+                           sections=args.sections)
+        else:
+            run_pipeline(path, filename="All Exercise and Fitness", backends=backends, excel_rows=args.excel_rows,
+                         workers=args.workers, partition_rows=args.partition_rows, cache=cache,
+                         approximate=args.approximate, state_path=args.sketch_state,
+                         near_duplicates=args.near_duplicates, dedup_state=args.dedup_state,
+                         sections=args.sections)
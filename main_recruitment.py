@@ -1,12 +1,61 @@
-from config.config import PATH_FILE_RECRUITMENT
-from data_recruitment.extract import extract_recruitment
-from data_recruitment.data_profiling import inspect_data
-from data_recruitment.transform import transform, demographi
-from data_recruitment.load import load
+import argparse
+from common.config import get_path
+from common.instrumentation import add_arguments, run_context, stage
+from common.cache import RowCache
+from data_recruitment.pipeline import run_pipeline
+from data_recruitment.streaming import run_stream
+from data_recruitment.transform import REPORT
 
 if __name__ == "__main__":
-    df = extract_recruitment(PATH_FILE_RECRUITMENT)
-    inspect_data(df)
-    df = transform(df)
-    df_demo = demographi(df)
-    load(df, demographi_report=df_demo, filename="data_requirements")
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Pipeline ETL data recruitment")
+    parser.add_argument("--input", default=None,
+                        help="File CSV (default: PATH_FILE_RECRUITMENT di env/config)")
+    parser.add_argument("--chunksize", type=int, default=None,
+                        help="Mode streaming: baca & proses CSV per N row")
+    parser.add_argument("--output", action="append", choices=["excel", "parquet", "feather", "sqlite"],
+                        help="Backend output (bisa diulang), default: excel")
+    parser.add_argument("--excel-rows", type=int, default=None,
+                        help="Batas row Cleaned_Data di Excel (0 = hanya sheet report)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Transform per row paralel dengan N proses (0 = semua core)")
+    parser.add_argument("--partition-rows", type=int, default=None,
+                        help="Ukuran partisi per task worker (default: otomatis)")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Hanya transform row baru/berubah, sisanya dari cache run sebelumnya")
+    parser.add_argument("--cache-dir", default=".cache", help="Folder cache mode incremental")
+    parser.add_argument("--cache-keep-runs", type=int, default=3,
+                        help="Row yang tidak muncul di N run terakhir dibuang dari cache")
+    parser.add_argument("--cache-max-rows", type=int, default=None, help="Batas jumlah row di cache")
+    parser.add_argument("--approximate", action="store_true",
+                        help="Report demographi dari sketch (memory konstan, nilai + batas error)")
+    parser.add_argument("--sketch-state", default=None,
+                        help="File state sketch: digabung dengan run sebelumnya lalu disimpan ulang "
+                             "(butuh --approximate; file pickle, hanya file terpercaya)")
+    parser.add_argument("--star-schema", action="store_true",
+                        help="Output fact posting (company_id) + tabel dimensi Dim_Company")
+    parser.add_argument("--sections", nargs="+", default=None, choices=REPORT.names(),
+                        help="Hanya hitung & tulis section report ini (default: semua)")
+    add_arguments(parser)
+    args = parser.parse_args()
+    if args.sketch_state and not args.approximate:
+        parser.error("--sketch-state hanya untuk --approximate")
+    if args.incremental and args.chunksize:
+        parser.error("--incremental belum bisa digabung dengan --chunksize")
+    path = args.input or get_path("PATH_FILE_RECRUITMENT")
+    backends = args.output or ["excel"]
+    cache = RowCache(args.cache_dir, "recruitment", keep_runs=args.cache_keep_runs,
+                     max_rows=args.cache_max_rows) if args.incremental else None
+
+    with run_context("recruitment", args):
+        if args.chunksize:
+            with stage("stream"):
+                run_stream(path, args.chunksize, filename="data_requirements",
+                           backends=backends, excel_rows=args.excel_rows,
+                           workers=args.workers, partition_rows=args.partition_rows,
+                           approximate=args.approximate, state_path=args.sketch_state,
+                           star_schema=args.star_schema, sections=args.sections)
+        else:
+            run_pipeline(path, filename="data_requirements", backends=backends, excel_rows=args.excel_rows,
+                         workers=args.workers, partition_rows=args.partition_rows, cache=cache,
+                         approximate=args.approximate, state_path=args.sketch_state,
+                         star_schema=args.star_schema, sections=args.sections)
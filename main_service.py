@@ -0,0 +1,71 @@
+"""
+Service pipeline yang tetap hidup: satu interpreter (pandas, regex description,
+schema sudah ter-load) memproses setiap file yang masuk ke folder watch.
+
+    <watch>/products/*.csv     → pipeline produk
+    <watch>/recruitment/*.csv  → pipeline recruitment
+
+Output ditulis ke output/<nama file>.* seperti run biasa.
+"""
+import argparse
+import time
+
+from common.multifile import source_name
+from common.watcher import FolderWatcher
+from data_products.pipeline import run_pipeline as run_products
+from data_recruitment.pipeline import run_pipeline as run_recruitment
+
+PIPELINES = {
+    "products": run_products,
+    "recruitment": run_recruitment,
+}
+
+# Dependency backend output yang di-import saat warm-up (hanya backend yang dipakai)
+BACKEND_MODULES = {
+    "excel": ["openpyxl"],
+    "parquet": ["pyarrow.parquet"],
+    "feather": ["pyarrow.feather"],
+    "sqlite": [],
+}
+
+
+def warm_up(backends):
+    import importlib
+    for backend in backends:
+        for module in BACKEND_MODULES[backend]:
+            importlib.import_module(module)
+
+
+def make_handler(backends, excel_rows=None, workers=None):
+    def handle(route, path):
+        name = source_name(path)
+        PIPELINES[route](path, filename=name, backends=backends, excel_rows=excel_rows,
+                         workers=workers, inspect_filename=f"inspect_{name}.txt")
+    return handle
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Service ETL: proses setiap file yang masuk ke folder watch")
+    parser.add_argument("--watch", default="inbox", help="Folder watch (subfolder products/ dan recruitment/)")
+    parser.add_argument("--pipeline", nargs="+", choices=list(PIPELINES), default=list(PIPELINES),
+                        help="Pipeline yang dilayani")
+    parser.add_argument("--concurrency", type=int, default=2, help="Jumlah file yang diproses bersamaan")
+    parser.add_argument("--queue-size", type=int, default=100, help="Batas antrian file")
+    parser.add_argument("--interval", type=float, default=1.0, help="Jeda scan folder (detik)")
+    parser.add_argument("--once", action="store_true", help="Proses file yang sudah ada lalu keluar")
+    parser.add_argument("--output", action="append", choices=list(BACKEND_MODULES),
+                        help="Backend output (bisa diulang), default: excel")
+    parser.add_argument("--excel-rows", type=int, default=None,
+                        help="Batas row Cleaned_Data di Excel (0 = hanya sheet report)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Transform per row paralel dengan N proses per file (0 = semua core)")
+    args = parser.parse_args()
+    backends = args.output or ["excel"]
+
+    started = time.perf_counter()
+    warm_up(backends)
+    watcher = FolderWatcher(args.watch, args.pipeline, make_handler(backends, args.excel_rows, args.workers),
+                            concurrency=args.concurrency, queue_size=args.queue_size, interval=args.interval)
+    print(f"[INFO] Service siap dalam {time.perf_counter() - started:.2f}s, watch {args.watch}/{{{','.join(args.pipeline)}}}")
+    stats = watcher.run(once=args.once)
+    print(f"[INFO] Selesai: {stats['done']} file sukses, {stats['failed']} gagal")
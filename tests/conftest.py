@@ -0,0 +1,85 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PRODUCTS_CSV = os.path.join(ROOT, "dataset", "All Exercise and Fitness.csv")
+
+
+@pytest.fixture
+def products_csv():
+    return PRODUCTS_CSV
+
+
+@pytest.fixture
+def products_raw():
+    from data_products.extract import extract_product
+    return extract_product(PRODUCTS_CSV)
+
+
+COMPANIES = [f"{a} {b}" for a in ("Acme", "Globex", "Initech", "Hooli", "Wonka") for b in ("Labs", "Corp", "Group")]
+PHRASES = ["Python and SQL", "Spark, AWS", "senior engineer", "0-2 years", "full-time", "contract role",
+           "remote", "health insurance", "bonus", "training", "Tableau Excel", "lead"]
+
+
+def recruitment_frame(rows=300, seed=0):
+    """CSV recruitment sintetis: atribut tetap per company, sebagian posting kosong."""
+    rng = np.random.default_rng(seed)
+    company = rng.integers(0, len(COMPANIES), rows)
+    attrs = {
+        "company_rating": np.round(rng.uniform(2, 5, len(COMPANIES)), 1),
+        "company_size": rng.choice(["1 to 50 Employees", "51 to 200 Employees", "10000+ Employees"], len(COMPANIES)),
+        "company_type": rng.choice(["Company - Private", "Company - Public"], len(COMPANIES)),
+        "company_sector": rng.choice(["Finance", "Retail", "Information Technology"], len(COMPANIES)),
+        "company_industry": rng.choice(["Banking", "Stores", "Software"], len(COMPANIES)),
+        "company_revenue": rng.choice(["$10+ billion (USD)", "Unknown / Non-Applicable"], len(COMPANIES)),
+        "company_founded": rng.integers(1900, 2020, len(COMPANIES)).astype(float),
+    }
+    salary = np.where(rng.random(rows) < 0.5, [f"${v:,} /yr (est.)" for v in rng.integers(50, 200, rows) * 1000],
+                      [f"${v:.2f} /hr (est.)" for v in rng.uniform(20, 80, rows)])
+    df = pd.DataFrame({
+        "Unnamed: 0": np.arange(rows),
+        # Sebagian nama membawa rating di belakang, seperti data asli
+        "company": [f"{COMPANIES[c]} {attrs['company_rating'][c]}" if i % 3 == 0 else COMPANIES[c]
+                    for i, c in enumerate(company)],
+        "location": rng.choice(["Austin, TX", "Boston, MA", "Remote"], rows),
+        "job_title": rng.choice(["Data Analyst", "Data Engineer"], rows),
+        "job_description": [", ".join(rng.choice(PHRASES, 3)) for _ in range(rows)],
+        "salary_estimate": np.where(rng.random(rows) < 0.3, None, salary),
+        "dates": [f"2023-0{m}-1{d}" for m, d in zip(rng.integers(1, 10, rows), rng.integers(0, 10, rows))],
+    })
+    for col, values in attrs.items():
+        df[col] = np.where(rng.random(rows) < 0.3, None, values[company].astype(object))
+    return df
+
+
+@pytest.fixture
+def recruitment_csv(tmp_path):
+    path = tmp_path / "recruitment.csv"
+    recruitment_frame().to_csv(path, index=False)
+    return str(path)
+
+
+def _assert_reports_equal(left, right):
+    assert list(left) == list(right)
+    for name in left:
+        a, b = left[name], right[name]
+        if name == "Basic_Info":
+            # Memory mode streaming boleh beda sedikit (lihat FrameProfile)
+            a, b = (x[x["Metric"] != "Memory Usage (KB)"].reset_index(drop=True) for x in (a, b))
+        if isinstance(a, dict):
+            assert list(a) == list(b), name
+            for unit in a:
+                pd.testing.assert_frame_equal(a[unit], b[unit], check_dtype=False, obj=f"{name}_{unit}")
+        else:
+            # Index sheet tidak ditulis ke output
+            pd.testing.assert_frame_equal(a.reset_index(drop=True), b.reset_index(drop=True),
+                                          check_dtype=False, obj=name)
+
+
+@pytest.fixture
+def assert_reports_equal():
+    """Bandingkan dua report demographi sheet per sheet."""
+    return _assert_reports_equal
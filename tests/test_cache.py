@@ -0,0 +1,36 @@
+import inspect
+
+import pandas as pd
+
+import common.dates
+from common.cache import RowCache, cached_transform, code_modules, code_version
+from data_products.transform import transform_product_rows
+from data_recruitment.extract import extract_recruitment
+from data_recruitment.transform import transform_rows
+
+
+def test_code_version_covers_indirect_modules():
+    assert {"common.dates", "data_recruitment.normalize", "data_recruitment.description",
+            "data_recruitment.company"} <= set(code_modules(transform_rows))
+    assert {"common.compact", "data_products.compact"} <= set(code_modules(transform_product_rows))
+
+
+def run_cached(df, tmp_path, capsys):
+    cache = RowCache(str(tmp_path), "recruitment")
+    out = cached_transform(transform_rows, df.copy(), cache, code_version(transform_rows))
+    return out, capsys.readouterr().out
+
+
+def test_cache_invalidated_when_dependency_changes(recruitment_csv, tmp_path, capsys, monkeypatch):
+    df = extract_recruitment(recruitment_csv)
+    first, _ = run_cached(df, tmp_path, capsys)
+    _, log = run_cached(df, tmp_path, capsys)
+    assert f"0 row baru/berubah, {len(df)} row dari cache" in log
+
+    # Edit di common.dates (hanya di-import normalize, tidak langsung oleh transform_rows)
+    getsource = inspect.getsource
+    monkeypatch.setattr(inspect, "getsource",
+                        lambda obj: getsource(obj) + ("\n# edit" if obj is common.dates else ""))
+    out, log = run_cached(df, tmp_path, capsys)
+    assert f"{len(df)} row baru/berubah, 0 row dari cache" in log
+    pd.testing.assert_frame_equal(out, first)
@@ -0,0 +1,38 @@
+import pandas as pd
+
+from common.profiling import memory_usage
+from data_products import load
+from data_products.compact import compact_columns, expand_urls
+from data_products.load import load_product
+from data_products.transform import transform_product, demographi
+
+
+def test_expand_restores_urls(products_raw):
+    compact = compact_columns(products_raw.copy())
+    assert "image" not in compact.columns and "link" not in compact.columns
+    expanded = expand_urls(compact)
+    assert expanded["image"].tolist() == products_raw["image"].tolist()
+    # Link kanonik: host + /dp/<ASIN>
+    link = expanded["link"].dropna()
+    assert link.str.fullmatch(r"https?://[^/]+/dp/[A-Z0-9]{10}").all()
+    assert expanded["asin"].notna().sum() == len(link)
+
+
+def test_report_profiles_compact_frame(products_raw):
+    df = transform_product(products_raw)
+    report = demographi(df, ["Basic_Info", "Missing_By_Column"])
+    info = report["Basic_Info"].set_index("Metric")["Value"]
+    assert info["Memory Usage (KB)"] == round(memory_usage(df).sum() / 1024, 2)
+    assert info["Memory Usage (KB)"] < round(memory_usage(expand_urls(df)).sum() / 1024, 2)
+    columns = report["Missing_By_Column"]["Column"].tolist()
+    assert "image_id" in columns and "image" not in columns
+
+
+def test_load_expands_urls_per_slice(products_raw, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(load, "EXPAND_ROWS", 100)
+    df = transform_product(products_raw)
+    load_product(df, {}, "products", backends=["parquet"])
+    written = pd.read_parquet(tmp_path / "output" / "products_parquet" / "Cleaned_Data.parquet")
+    expected = expand_urls(df).reset_index(drop=True)
+    assert written[["name", "image", "link"]].astype(object).equals(expected[["name", "image", "link"]].astype(object))
@@ -0,0 +1,134 @@
+import sqlite3
+
+import pandas as pd
+import pytest
+
+import data_recruitment.streaming as streaming
+from common.aggregates import ValueCounter
+from data_recruitment.company import CompanyDimension
+from data_recruitment.extract import extract_recruitment
+from data_recruitment.load import load
+from data_recruitment.transform import transform, transform_rows, demographi
+
+
+def chunk(names, sizes, sectors, categories):
+    return pd.DataFrame({
+        "company": pd.array(names, dtype="string"),
+        "job_title": ["x"] * len(names),
+        "company_size": pd.Categorical(sizes, categories=categories),
+        "company_sector": sectors,
+    })
+
+
+def test_split_join_first_valid_across_chunks():
+    companies = CompanyDimension()
+    first = companies.split(chunk(["A", "B", "A"], [None, "small", None], ["IT", None, None], ["small"]))
+    second = companies.split(chunk(["A", "C", "B"], ["big", None, "big"], [None, "Retail", None], ["big"]))
+
+    assert first.columns.tolist() == ["company_id", "job_title"]
+    assert first["company_id"].tolist() == [1, 2, 1]
+    assert second["company_id"].tolist() == [1, 3, 2]
+
+    dim = companies.frame().set_index("company")
+    # Nilai valid pertama per company, termasuk dari chunk berikutnya; yang tidak pernah ada tetap NaN
+    assert dim.loc["A", "company_size"] == "big"
+    assert dim.loc["B", "company_size"] == "small"
+    assert pd.isna(dim.loc["C", "company_size"])
+    assert pd.isna(dim.loc["B", "company_sector"])
+    assert list(dim["company_size"].cat.categories) == ["big", "small"]
+
+    wide = companies.join(second)
+    assert wide.columns.tolist() == ["company", "job_title", "company_size", "company_sector"]
+    assert wide["company"].tolist() == ["A", "C", "B"]
+    assert wide["company_sector"].tolist()[:2] == ["IT", "Retail"]
+    missing = companies.missing(second["company_id"])
+    assert missing.to_dict() == {"company": 0, "company_size": 1, "company_sector": 1}
+
+
+def test_transform_keeps_company_attributes_in_dimension(recruitment_csv):
+    df = extract_recruitment(recruitment_csv)
+    wide = transform_rows(df.copy())
+    companies = CompanyDimension()
+    facts = transform(df, companies=companies)
+
+    assert "company_id" in facts.columns
+    assert not [c for c in facts.columns if c.startswith("company") and c != "company_id"]
+    assert len(companies.frame()) == wide["company"].nunique()
+
+    joined = companies.join(facts)
+    assert joined.columns.tolist() == wide.columns.tolist()
+    assert joined["company"].tolist() == wide["company"].tolist()
+    # Atribut hanya diisi, tidak pernah diganti dengan nilai company lain
+    known = wide["company_sector"].notna()
+    assert joined.loc[known, "company_sector"].astype(str).equals(wide.loc[known, "company_sector"].astype(str))
+    assert joined["company_sector"].notna().all()
+
+
+def test_streaming_matches_in_memory(recruitment_csv, monkeypatch, assert_reports_equal):
+    companies = CompanyDimension()
+    facts = transform(extract_recruitment(recruitment_csv), companies=companies)
+    expected = demographi(facts, companies=companies)
+
+    captured = {}
+
+    def load_stream(chunks, get_report, *args, companies=None):
+        captured["rows"] = pd.concat([companies.join(c) for c in chunks], ignore_index=True)
+        captured["report"] = get_report()
+
+    monkeypatch.setattr(streaming, "load_stream", load_stream)
+    monkeypatch.setattr(streaming, "inspect_data", lambda chunk: None)
+    streaming.run_stream(recruitment_csv, 70, "unused")
+
+    assert_reports_equal(expected, captured["report"])
+    pd.testing.assert_frame_equal(captured["rows"], companies.join(facts).reset_index(drop=True))
+
+
+def test_demographi_needs_companies(recruitment_csv):
+    facts = transform(extract_recruitment(recruitment_csv), companies=CompanyDimension())
+    with pytest.raises(ValueError, match="CompanyDimension"):
+        demographi(facts, ["Top_Companies"])
+
+
+def test_ids_stable_across_runs(tmp_path):
+    path = str(tmp_path / "company_ids.csv")
+    first = CompanyDimension(state_path=path)
+    first.split(chunk(["A", "B"], [None, None], [None, None], []))
+    first.save()
+
+    second = CompanyDimension(state_path=path)
+    facts = second.split(chunk(["C", "B", "A"], [None, None, None], [None, None, None], []))
+    assert facts["company_id"].tolist() == [3, 2, 1]
+
+
+def test_description_hash_only_in_sqlite(recruitment_csv, tmp_path, monkeypatch):
+    companies = CompanyDimension()
+    facts = transform(extract_recruitment(recruitment_csv), companies=companies)
+    report = demographi(facts, companies=companies)
+    assert "description_hash" in facts.columns
+    assert "description_hash" not in report["Missing_By_Column"]["Column"].tolist()
+    assert "description_hash" not in report["Data_Types"].to_string()
+
+    monkeypatch.chdir(tmp_path)
+    load(facts, report, "out", backends=("sqlite", "parquet"), companies=companies)
+    assert "description_hash" not in pd.read_parquet("output/out_parquet/Cleaned_Data.parquet").columns
+    with sqlite3.connect("output/out.sqlite") as conn:
+        columns = pd.read_sql_query("SELECT * FROM postings LIMIT 1", conn).columns
+    assert "description_hash" in columns
+
+
+def test_top_companies_ties_in_first_appearance_order():
+    companies = CompanyDimension()
+    names = ["C", "A", "B", "A", "B", "C", "D"]
+    facts = companies.split(chunk(names, [None] * 7, [None] * 7, []))
+    expected = pd.DataFrame({"Company": ["C", "A", "B", "D"], "Job_Postings": [2, 2, 2, 1]})
+
+    top = demographi(facts, ["Top_Companies"], companies=companies)["Top_Companies"]
+    pd.testing.assert_frame_equal(top, expected, check_dtype=False)
+
+    # Streaming: kemunculan pertama dihitung lintas chunk
+    counter = ValueCounter()
+    for start, stop in ((0, 3), (3, 5), (5, 7)):
+        counter.update(facts["company_id"].iloc[start:stop])
+    top = counter.to_frame(["Company", "Job_Postings"])
+    top["Company"] = companies.lookup(top["Company"].astype("Int64"), "company").to_numpy()
+    pd.testing.assert_frame_equal(top, expected, check_dtype=False)
@@ -0,0 +1,113 @@
+import importlib
+import threading
+import time
+
+import pytest
+
+from common.dag import Dag, run_dags, DONE, FAILED, SKIPPED
+
+
+class Recorder:
+    """Catat urutan start/finish task (lintas thread)."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.events = []
+        self.running = {}
+        self.peak = {}
+
+    def task(self, name, resource="cpu", delay=0.02, result=None, fail=False):
+        def run(**inputs):
+            with self.lock:
+                self.events.append(("start", name))
+                self.running[resource] = self.running.get(resource, 0) + 1
+                self.peak[resource] = max(self.peak.get(resource, 0), self.running[resource])
+            time.sleep(delay)
+            with self.lock:
+                self.running[resource] -= 1
+                self.events.append(("end", name))
+            if fail:
+                raise RuntimeError(name)
+            return (name, inputs) if result is None else result
+        return run
+
+    def index(self, kind, name):
+        return self.events.index((kind, name))
+
+
+def test_tasks_start_after_dependencies_and_receive_results():
+    rec = Recorder()
+    dag = Dag("p")
+    dag.task("extract", rec.task("extract", result=1), resource="io")
+    dag.task("profile", rec.task("profile"), deps=["extract"])
+    dag.task("transform", rec.task("transform", result=2), deps=["extract"])
+    dag.task("load", rec.task("load"), deps=["transform", "profile"], resource="io")
+
+    status, results = run_dags([dag])
+
+    assert status["p"] == {name: DONE for name in ("extract", "profile", "transform", "load")}
+    for dep, task in [("extract", "profile"), ("extract", "transform"), ("transform", "load"), ("profile", "load")]:
+        assert rec.index("end", dep) < rec.index("start", task)
+    # Hasil dependency diberikan sebagai argumen; hasil antara dilepas dari results
+    assert results["p"] == {"load": ("load", {"transform": 2, "profile": ("profile", {"extract": 1})})}
+    # profile & transform independen → jalan bersamaan
+    assert rec.peak["cpu"] == 2
+
+
+def test_resource_limit_and_pipelines_in_parallel():
+    rec = Recorder()
+    dags = []
+    for name in ("a", "b", "c"):
+        dag = Dag(name)
+        dag.task("transform", rec.task(f"{name}/transform"))
+        dags.append(dag)
+
+    status, _ = run_dags(dags, max_workers=4, limits={"cpu": 1})
+    assert all(s == {"transform": DONE} for s in status.values())
+    assert rec.peak["cpu"] == 1
+
+
+def test_failure_stops_descendants_only():
+    rec = Recorder()
+    failing, healthy = Dag("failing"), Dag("healthy")
+    failing.task("extract", rec.task("extract"))
+    failing.task("transform", rec.task("transform", fail=True), deps=["extract"])
+    failing.task("profile", rec.task("profile"), deps=["extract"])
+    failing.task("load", rec.task("load"), deps=["transform"])
+    healthy.task("extract", rec.task("healthy/extract"))
+
+    status, _ = run_dags([failing, healthy])
+    assert status["failing"] == {"extract": DONE, "transform": FAILED, "profile": DONE, "load": FAILED}
+    assert status["healthy"] == {"extract": DONE}
+    assert ("start", "load") not in rec.events
+
+
+def test_skipped_optional_task_passes_none():
+    rec = Recorder()
+    dag = Dag("p")
+    dag.task("transform", rec.task("transform", result=1))
+    dag.task("report", rec.task("report"), deps=["transform"], optional=True)
+    dag.task("load", rec.task("load"), deps=["transform", "report"])
+    dag.skip(["report"])
+
+    status, results = run_dags([dag])
+    assert status["p"] == {"transform": DONE, "report": SKIPPED, "load": DONE}
+    assert results["p"]["load"] == ("load", {"transform": 1, "report": None})
+    with pytest.raises(ValueError):
+        dag.skip(["transform"])
+
+
+def test_unknown_dependency_rejected():
+    with pytest.raises(ValueError, match="dependency belum didefinisikan"):
+        Dag("p").task("load", lambda transform: None, deps=["transform"])
+
+
+@pytest.mark.parametrize("module", ["data_products.pipeline", "data_recruitment.pipeline"])
+def test_pipeline_dag_stage_order(module, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    dag = importlib.import_module(module).build_dag(str(tmp_path / "input.csv"), "out")
+    assert {name: task.deps for name, task in dag.tasks.items()} == {
+        "extract": [], "profile": ["extract"], "transform": ["extract"],
+        "report": ["transform"], "load": ["transform", "report"],
+    }
+    assert [name for name, task in dag.tasks.items() if task.optional] == ["profile", "report", "load"]
@@ -0,0 +1,178 @@
+import numpy as np
+import pandas as pd
+
+from common.dedup import HashSet, MinHashLSH, Deduplicator, hash_keys
+from data_products.dedup import product_deduplicator
+
+WORDS = [f"w{i}" for i in range(1, 14)]
+
+
+def chunks(df, size):
+    return [df.iloc[start:start + size] for start in range(0, len(df), size)]
+
+
+def run(dedup, df, size):
+    return pd.concat([dedup.apply(chunk) for chunk in chunks(df, size)])
+
+
+def test_hashset_add_and_contains():
+    keys = HashSet([5, 1, 3])
+    keys.add(np.array([3, 2, 2, 9]))
+    assert keys.keys.tolist() == [1, 2, 3, 5, 9]
+    assert keys.contains([0, 2, 9, 10]).tolist() == [False, True, True, False]
+    assert not HashSet().contains([1]).any()
+
+
+def test_matches_drop_duplicates_across_chunks():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({"key": rng.integers(0, 300, 2_000).astype(str), "value": np.arange(2_000)})
+    dedup = Deduplicator([("key", lambda d: d["key"])])
+    out = run(dedup, df, 97)
+    expected = df.drop_duplicates("key", keep="first")
+    pd.testing.assert_frame_equal(out, expected)
+    assert dedup.removed["key"] == len(df) - len(expected)
+
+
+def test_nan_keys_never_duplicates():
+    df = pd.DataFrame({"key": ["a", None, "a", None, np.nan]})
+    dedup = Deduplicator([("key", lambda d: d["key"])])
+    out = run(dedup, df, 2)
+    assert out.index.tolist() == [0, 1, 3, 4]
+
+
+def test_state_path_round_trip(tmp_path):
+    path = str(tmp_path / "state" / "dedup.npz")
+    first = Deduplicator([("key", lambda d: d["key"])], state_path=path)
+    first.apply(pd.DataFrame({"key": ["a", "b"]}))
+    first.save()
+
+    second = Deduplicator([("key", lambda d: d["key"])], state_path=path)
+    out = second.apply(pd.DataFrame({"key": ["b", "c", "a", "c"]}))
+    assert out["key"].tolist() == ["c"]
+    assert second.summary().set_index("Rule").loc["total", "Removed"] == 3
+
+
+def key_dedup(path, run_id=None, **kwargs):
+    return Deduplicator([("key", lambda d: d["key"])], state_path=path, run_id=run_id, **kwargs)
+
+
+def run_saved(dedup, keys):
+    out = dedup.apply(pd.DataFrame({"key": keys}))
+    dedup.save()
+    return out["key"].tolist()
+
+
+def test_rerun_same_input_keeps_rows(tmp_path):
+    path = str(tmp_path / "dedup.npz")
+    assert run_saved(key_dedup(path, "feed-1"), ["a", "b", "a"]) == ["a", "b"]
+    # Re-run feed yang sama: key run itu diganti, bukan dianggap sudah terlihat
+    assert run_saved(key_dedup(path, "feed-1"), ["a", "b", "a"]) == ["a", "b"]
+    assert run_saved(key_dedup(path, "feed-2"), ["b", "c"]) == ["c"]
+    # Re-run feed-1 dengan isi berbeda: key lama feed-1 (a, b) tidak lagi ada di state;
+    # b tidak ikut tercatat untuk feed-2 karena di sana dibuang sebagai duplikat
+    assert run_saved(key_dedup(path, "feed-1"), ["c", "d"]) == ["d"]
+    assert run_saved(key_dedup(path, "feed-3"), ["a", "b", "d"]) == ["a", "b"]
+
+
+def test_state_window_and_capacity(tmp_path):
+    path = str(tmp_path / "dedup.npz")
+    for run, keys in enumerate([["a"], ["b"], ["c"]]):
+        run_saved(key_dedup(path, run, keep_runs=2), keys)
+    # Run 0 sudah keluar dari window 2 run terakhir
+    assert run_saved(key_dedup(path, "new"), ["a", "b", "c"]) == ["a"]
+
+    path = str(tmp_path / "capped.npz")
+    run_saved(key_dedup(path, 0, max_keys=3), ["a", "b"])
+    run_saved(key_dedup(path, 1, max_keys=3), ["c", "d"])
+    # Lebih dari 3 key: key run terlama dibuang duluan
+    assert np.load(path)["key"].size == 3
+    assert run_saved(key_dedup(path, "new"), ["a", "b", "c", "d"]) in (["a"], ["b"])
+
+
+def test_near_duplicate_rerun_keeps_rows(tmp_path):
+    path = str(tmp_path / "dedup.npz")
+    texts = [" ".join(WORDS[:10]), " ".join(WORDS[:10]) + " extra", "something else entirely"]
+
+    def near(run_id):
+        dedup = Deduplicator([], near=("near", lambda d: d["name"], MinHashLSH()), state_path=path, run_id=run_id)
+        out = dedup.apply(pd.DataFrame({"name": texts}))
+        dedup.save()
+        return out.index.tolist()
+
+    assert near("feed") == [0, 2]
+    assert near("feed") == [0, 2]
+    assert near("other") == []
+
+
+def test_product_rerun_on_identical_file(tmp_path):
+    csv = tmp_path / "products.csv"
+    df = pd.DataFrame({"name": ["Yoga Mat", "Yoga Mat", "Kettlebell 10kg"],
+                       "link": ["https://www.amazon.com/x/dp/B000000001", None, None]})
+    df.to_csv(csv, index=False)
+    state = str(tmp_path / "products_seen.npz")
+
+    for _ in range(2):
+        dedup = product_deduplicator(state_path=state, source=str(csv))
+        assert dedup.apply(df).index.tolist() == [0, 2]
+        dedup.save()
+
+    # File lain (delta) dengan produk yang sama tetap dibuang
+    delta = tmp_path / "delta.csv"
+    df.iloc[[2]].to_csv(delta, index=False)
+    assert product_deduplicator(state_path=state, source=str(delta)).apply(df.iloc[[2]]).empty
+
+
+def test_near_duplicate_state_round_trip(tmp_path):
+    path = str(tmp_path / "dedup.npz")
+    text = " ".join(WORDS[:10])
+    first = Deduplicator([], near=("near", lambda d: d["name"], MinHashLSH()), state_path=path)
+    first.apply(pd.DataFrame({"name": [text]}))
+    first.save()
+
+    second = Deduplicator([], near=("near", lambda d: d["name"], MinHashLSH()), state_path=path)
+    out = second.apply(pd.DataFrame({"name": [text + " extra", "something else entirely"]}))
+    assert out["name"].tolist() == ["something else entirely"]
+
+
+def test_truncated_name_is_duplicate_unless_asin_differs():
+    # Nama & ASIN tidak sama persis, jadi hanya rule near_name yang bisa membuang
+    df = pd.DataFrame({
+        "name": ["Adjustable Dumbbell Set 52.5 lb with Stand for Home Gym Workout Black",
+                 "Adjustable Dumbbell Set 52.5 lb with Stand for Home Gym...",
+                 "Adjustable Dumbbell Set 52.5 lb with Stand for Home Gym Workout..."],
+        "link": ["https://www.amazon.com/x/dp/B000000001", None, "https://www.amazon.com/z/dp/B000000002"],
+    })
+    dedup = product_deduplicator(near_duplicates=True)
+    out = dedup.apply(df)
+    assert out.index.tolist() == [0, 2]
+    assert dedup.removed["near_name"] == 1
+
+
+def test_no_chain_through_removed_row():
+    # B mirip A (dibuang); C mirip B tapi tidak mirip A → C disimpan
+    a, b, c = " ".join(WORDS[:10]), " ".join(WORDS), " ".join(WORDS[2:])
+    lsh = MinHashLSH()
+    assert lsh.mark(pd.Series([a, b, c])).tolist() == [False, True, False]
+
+
+def test_near_duplicates_chunked_equals_whole():
+    rng = np.random.default_rng(1)
+    vocab = np.array([f"t{i}" for i in range(40)])
+    base = [" ".join(rng.choice(vocab, 12)) for _ in range(60)]
+    texts = pd.Series([
+        " ".join(name.split()[:rng.integers(9, 13)]) for name in rng.choice(base, 400)
+    ])
+    groups = hash_keys(rng.integers(0, 3, len(texts)))
+    whole = MinHashLSH().mark(texts, groups)
+    lsh = MinHashLSH()
+    chunked = np.concatenate([
+        lsh.mark(texts.iloc[start:start + 33], groups[start:start + 33]) for start in range(0, len(texts), 33)
+    ])
+    assert whole.any()
+    np.testing.assert_array_equal(chunked, whole)
+
+
+def test_empty_chunk():
+    lsh = MinHashLSH()
+    assert len(lsh.mark(pd.Series([], dtype="string"))) == 0
+    assert lsh.mark(pd.Series(["a b", "a b"])).tolist() == [False, True]
@@ -0,0 +1,33 @@
+import numpy as np
+import pandas as pd
+
+from benchmarks.bench_parse_description import legacy_parse_description, make_descriptions
+from data_recruitment.description import DESCRIPTION_COLUMNS, parse_descriptions
+
+EDGE_CASES = [
+    None, np.nan, "", "   ", "Senior Python developer, 6+ years, FULL TIME, remote",
+    "part-time internship in R&D using C++ and C#", "Mid level 3 to 5 years contract, hybrid",
+    "sql SQL Sql nosql mysql", "entry-level (0-2 years) with health insurance and 401k",
+    "Python" * 3, "no keywords here at all",
+]
+
+
+def legacy(descs):
+    out = descs.apply(legacy_parse_description)
+    out.columns = DESCRIPTION_COLUMNS
+    return out.astype(object)
+
+
+def test_parse_descriptions_matches_legacy():
+    descs = pd.concat([pd.Series(EDGE_CASES, dtype=object), make_descriptions(400, seed=7)],
+                      ignore_index=True)
+    descs.index = descs.index + 100
+    out = parse_descriptions(descs)
+    assert out.index.equals(descs.index)
+    pd.testing.assert_frame_equal(out.astype(object), legacy(descs))
+
+
+def test_parse_descriptions_arrow_strings():
+    descs = make_descriptions(100, seed=3)
+    out = parse_descriptions(descs.astype("string[pyarrow]"))
+    pd.testing.assert_frame_equal(out.astype(object), legacy(descs))
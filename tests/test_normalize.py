@@ -0,0 +1,61 @@
+import re
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from common.dates import DateParser
+from data_recruitment.normalize import parse_salaries, parse_dates
+
+
+def legacy_parse_salary(s):
+    # parse_salary per row dari transform lama
+    if pd.isna(s):
+        return [np.nan, None, None]
+    match = re.search(r"([\d,\.]+)", s)
+    salary = float(match.group(1).replace(",", "")) if match else np.nan
+    unit = "per year" if "yr" in s else "per hour" if "hr" in s else None
+    currency = "$" if "$" in s else None
+    return [salary, unit, currency]
+
+
+SALARIES = [
+    "$85,000 /yr (est.)", "$40 /hr", "$40 per hr", "$100,000 yr", "50000 $ /yr", ".5 /hr", "$25.50 /hr",
+    "USD 120,000", "yr hr 10", "Competitive", "$", "", None, np.nan, "1,000-2,000 /yr", "hourly $30 hr",
+]
+
+
+def test_parse_salaries_matches_legacy():
+    out = parse_salaries(pd.Series(SALARIES, index=range(10, 10 + len(SALARIES))))
+    assert out.index.tolist() == list(range(10, 10 + len(SALARIES)))
+    for raw, (_, row) in zip(SALARIES, out.iterrows()):
+        value, unit, currency = legacy_parse_salary(raw)
+        assert row["salary_estimate"] == pytest.approx(value, nan_ok=True), raw
+        assert (None if pd.isna(row["salary_unit"]) else row["salary_unit"]) == unit, raw
+        assert (None if pd.isna(row["currency"]) else row["currency"]) == currency, raw
+
+
+def test_parse_salaries_fixed_categories():
+    out = parse_salaries(pd.Series(["$1 /hr"]))
+    assert list(out["salary_unit"].cat.categories) == ["per hour", "per year"]
+    assert list(out["currency"].cat.categories) == ["$"]
+
+
+def test_parse_dates_mixed_formats():
+    out = parse_dates(pd.Series(["2023-01-05", "Jan 06, 2023", " 2023-01-07 ", "bukan tanggal", None]))
+    expected = pd.to_datetime(["2023-01-05", "2023-01-06", "2023-01-07", None, None])
+    assert out.tolist()[:3] == expected.tolist()[:3]
+    assert out.iloc[3:].isna().all()
+
+
+def test_parse_dates_independent_of_previous_batches():
+    # Tanggal ambigu tidak boleh ikut format yang terdeteksi di batch sebelumnya
+    ambiguous = pd.Series(["03/04/2023"])
+    expected = DateParser().parse(ambiguous)
+    assert expected.iloc[0] == pd.Timestamp("2023-03-04")
+
+    parser = DateParser()
+    parser.parse(pd.Series(["13/04/2023", "25/12/2023"]))
+    assert parser.parse(ambiguous).equals(expected)
+    parse_dates(pd.Series(["13/04/2023"]))
+    assert parse_dates(ambiguous).equals(expected)
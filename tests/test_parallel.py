@@ -0,0 +1,49 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+from common.parallel import get_pool, map_partitions, shutdown_pool
+from data_products.transform import transform_product
+from data_recruitment.company import CompanyDimension
+from data_recruitment.extract import extract_recruitment
+from data_recruitment.transform import transform
+
+
+def test_get_pool_per_worker_count_thread_safe():
+    try:
+        with ThreadPoolExecutor(8) as threads:
+            pools = list(threads.map(lambda _: get_pool(2), range(16)))
+        assert len({id(p) for p in pools}) == 1
+        # Pool ukuran lain tidak men-shutdown pool yang sedang dipakai
+        other = get_pool(3)
+        assert other is not pools[0]
+        assert pools[0].submit(abs, -1).result() == 1
+        assert pools[0]._mp_context.get_start_method() in ("forkserver", "spawn")
+    finally:
+        shutdown_pool()
+
+
+def test_workers_match_serial_recruitment(recruitment_csv):
+    df = extract_recruitment(recruitment_csv)
+    try:
+        serial, parallel = CompanyDimension(), CompanyDimension()
+        expected = transform(df.copy(), companies=serial)
+        out = transform(df.copy(), workers=2, partition_rows=70, companies=parallel)
+    finally:
+        shutdown_pool()
+    pd.testing.assert_frame_equal(out, expected)
+    pd.testing.assert_frame_equal(parallel.frame(), serial.frame())
+
+
+def test_workers_match_serial_products(products_raw):
+    df = products_raw.iloc[:3_000]
+    try:
+        out = transform_product(df.copy(), workers=2, partition_rows=700)
+    finally:
+        shutdown_pool()
+    pd.testing.assert_frame_equal(out, transform_product(df.copy()))
+
+
+def test_map_partitions_serial_path_runs_inline():
+    df = pd.DataFrame({"x": range(5)})
+    assert map_partitions(lambda d: d.assign(y=d["x"] * 2), df, workers=4)["y"].tolist() == [0, 2, 4, 6, 8]
@@ -0,0 +1,38 @@
+import gc
+
+import numpy as np
+import pandas as pd
+
+from common.profiling import get_profile
+
+
+def frame(values):
+    return pd.DataFrame({"salary_estimate": values, "job_title": ["a", "b", "c"]})
+
+
+def test_profile_refreshed_after_in_place_change():
+    df = frame([1.0, np.nan, 3.0])
+    assert get_profile(df).nulls["salary_estimate"] == 1
+    assert get_profile(df) is get_profile(df)
+
+    # Shape, kolom & dtype sama; hanya nilai yang berubah (seperti imputasi)
+    df["salary_estimate"] = df["salary_estimate"].fillna(2.0)
+    prof = get_profile(df)
+    assert prof.nulls["salary_estimate"] == 0
+    assert prof.stats["salary_estimate"]["mean"] == 2.0
+
+
+def test_profile_not_reused_for_new_frame_with_same_id():
+    # Frame lama dibuang → id() bisa dipakai frame baru dengan shape & dtype sama
+    for values in ([1.0, 1.0, 1.0], [5.0, 6.0, 7.0]):
+        df = frame(values)
+        assert get_profile(df).stats["salary_estimate"]["max"] == max(values)
+        del df
+        gc.collect()
+
+
+def test_exclude_is_part_of_cache_key():
+    df = frame([1.0, 2.0, 3.0]).assign(description_hash=["x", "y", "z"])
+    assert "description_hash" in get_profile(df).columns
+    assert "description_hash" not in get_profile(df, exclude=["description_hash"]).columns
+    assert get_profile(df).duplicates == 0
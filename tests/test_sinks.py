@@ -0,0 +1,79 @@
+import sqlite3
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from common.sinks import SqliteSink, RowKeyCollision, write_outputs
+
+TABLE = {"table": "Cleaned_Data", "keys": ["id"], "indexes": ["city"]}
+
+
+def load(path, *chunks, table=TABLE):
+    sink = SqliteSink(path, table=table)
+    for chunk in chunks:
+        sink.write_chunk(chunk)
+    sink.close()
+    return sink
+
+
+def read(path, sql="SELECT id, city, value FROM Cleaned_Data ORDER BY id"):
+    with sqlite3.connect(path) as conn:
+        return pd.read_sql_query(sql, conn)
+
+
+def frame(ids, cities, values):
+    return pd.DataFrame({"id": ids, "city": cities, "value": values})
+
+
+def test_reload_updates_instead_of_duplicating(tmp_path):
+    path = str(tmp_path / "out.sqlite")
+    load(path, frame([1, 2], ["a", "b"], [1.0, 2.0]), frame([3], ["c"], [3.0]))
+    sink = load(path, frame([2, 3, 4], ["b", "c", "d"], [20.0, 30.0, 40.0]))
+
+    out = read(path)
+    assert out["id"].tolist() == [1, 2, 3, 4]
+    assert out["value"].tolist() == [1.0, 20.0, 30.0, 40.0]
+    assert sink.collisions["Cleaned_Data"] == {"duplicate_keys": 0}
+    indexes = read(path, "SELECT name FROM sqlite_master WHERE type = 'index'")["name"].tolist()
+    assert "idx_Cleaned_Data_city" in indexes
+
+
+def test_duplicate_keys_in_one_load_counted(tmp_path):
+    path = str(tmp_path / "out.sqlite")
+    sink = load(path, frame([1, 2], ["a", "b"], [1.0, 2.0]), frame([1], ["a"], [10.0]))
+    assert read(path)["value"].tolist() == [10.0, 2.0]
+    assert sink.collisions["Cleaned_Data"] == {"duplicate_keys": 1}
+
+
+def test_hash_collision_raises(tmp_path, monkeypatch):
+    path = str(tmp_path / "out.sqlite")
+    load(path, frame([1], ["a"], [1.0]))
+    # Semua keys di-hash ke row_key yang sama
+    monkeypatch.setattr(pd.util, "hash_pandas_object",
+                        lambda df, index=False: pd.Series(np.zeros(len(df), dtype="uint64"), index=df.index))
+    sink = SqliteSink(path, table=TABLE)
+    with pytest.raises(RowKeyCollision):
+        sink.write_chunk(frame([1, 2], ["a", "b"], [10.0, 2.0]))
+    sink.conn.close()
+
+    # Batch yang collision di-rollback, row lama tidak tertimpa
+    assert read(path)[["id", "value"]].values.tolist() == [[1, 1.0]]
+
+
+def test_without_keys_rows_are_appended(tmp_path):
+    path = str(tmp_path / "out.sqlite")
+    load(path, frame([1], ["a"], [1.0]), table={})
+    load(path, frame([1], ["a"], [1.0]), table={})
+    assert len(read(path)) == 2
+
+
+def test_key_only_columns_only_in_sqlite(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    table = dict(TABLE, keys=["id", "digest"], key_only=["digest"])
+    chunk = frame([1, 1], ["a", "b"], [1.0, 2.0]).assign(digest=["x", "y"])
+    write_outputs([chunk], lambda: {}, "out", backends=("sqlite", "parquet"), table=table)
+
+    assert read("output/out.sqlite", "SELECT id, digest FROM Cleaned_Data ORDER BY digest")["digest"].tolist() == ["x", "y"]
+    assert "digest" not in pd.read_parquet("output/out_parquet/Cleaned_Data.parquet").columns
+    assert "digest" in chunk.columns
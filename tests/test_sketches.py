@@ -0,0 +1,157 @@
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from common.sketches import (QuantileSketch, NumericSummary, HeavyHitters, HyperLogLog, FixedHistogram,
+                             histogram_frame, numeric_stats_frame)
+
+QUANTILES = [0.01, 0.1, 0.25, 0.5, 0.75, 0.9, 0.99]
+
+
+def order_statistic(values, q):
+    # Quantile yang diestimasi sketch: row ke-floor(q * (n-1)) setelah sort
+    return np.sort(values)[int(q * (len(values) - 1))]
+
+
+def assert_within_bound(sketch, values, quantiles=QUANTILES):
+    for q in quantiles:
+        estimate, actual = sketch.quantile(q), order_statistic(values, q)
+        assert abs(estimate - actual) <= sketch.error_bound(estimate) * (1 + 1e-9), q
+
+
+@pytest.fixture
+def values():
+    rng = np.random.default_rng(0)
+    return np.concatenate([rng.lognormal(3, 2, 20_000), -rng.lognormal(1, 1, 2_000), np.zeros(500)])
+
+
+def test_quantile_within_relative_error(values):
+    sketch = QuantileSketch(0.01)
+    sketch.update(values)
+    assert_within_bound(sketch, values)
+    assert sketch.collapsed_positive is None and sketch.collapsed_negative is None
+
+
+def test_quantile_at_bucket_edge():
+    # Nilai tepat di batas atas bucket: error terbesar relatif terhadap estimasi
+    sketch = QuantileSketch(0.01)
+    edge = sketch.gamma ** 50
+    sketch.update([edge])
+    assert_within_bound(sketch, np.array([edge]), [0.5])
+
+
+def test_merged_partitions_keep_bound(values):
+    merged = QuantileSketch(0.01)
+    for part in np.array_split(values, 7):
+        sketch = QuantileSketch(0.01)
+        sketch.update(part)
+        merged.merge(sketch)
+    assert merged.count == len(values)
+    assert_within_bound(merged, values)
+
+
+def test_merge_rejects_different_accuracy():
+    with pytest.raises(ValueError):
+        QuantileSketch(0.01).merge(QuantileSketch(0.02))
+
+
+def test_collapsed_bucket_widens_bound():
+    rng = np.random.default_rng(1)
+    values = np.exp(rng.uniform(-20, 20, 50_000))
+    sketch = QuantileSketch(0.01, max_buckets=200)
+    sketch.update(values)
+    assert len(sketch.positive) == 200
+    assert sketch.collapsed_positive is not None
+
+    limit = sketch.gamma ** sketch.collapsed_positive
+    low = sketch.quantile(0.1)
+    assert low <= limit
+    assert sketch.error_bound(low) == limit
+    assert sketch.relative_error(low) > sketch.relative_accuracy
+    # Batas tetap benar di bawah & di atas bucket gabungan
+    assert_within_bound(sketch, values)
+    high = sketch.quantile(0.99)
+    assert high > limit
+    assert sketch.relative_error(high) == sketch.relative_accuracy
+
+
+def test_collapsed_flag_survives_merge_and_pickle():
+    collapsed = QuantileSketch(0.01, max_buckets=10)
+    collapsed.update(np.exp(np.linspace(-5, 5, 1_000)))
+    assert collapsed.collapsed_positive is not None
+
+    merged = QuantileSketch(0.01, max_buckets=10)
+    merged.update([1.0, 2.0])
+    merged.merge(collapsed)
+    assert merged.collapsed_positive >= collapsed.collapsed_positive
+
+    restored = pickle.loads(pickle.dumps(merged))
+    assert restored.collapsed_positive == merged.collapsed_positive
+
+
+def test_state_without_collapsed_flag_loads():
+    # State pickle lama belum punya atribut collapsed_*
+    sketch = QuantileSketch(0.01)
+    sketch.update([1.0, 10.0])
+    state = sketch.__dict__.copy()
+    old = QuantileSketch.__new__(QuantileSketch)
+    old.__dict__.update(state)
+    assert old.collapsed_positive is None
+    assert old.error_bound(old.quantile(0.5)) > 0
+
+
+def test_numeric_stats_reports_collapsed_error():
+    rng = np.random.default_rng(2)
+    summary = NumericSummary(0.01)
+    summary.sketch.max_buckets = 50
+    summary.update(np.exp(rng.uniform(-10, 10, 10_000)))
+    frame = numeric_stats_frame({"x": summary})
+    assert frame.loc[0, "Quantile_Rel_Error"] > 0.01
+
+    exact = NumericSummary(0.01)
+    exact.update(rng.lognormal(0, 1, 1_000))
+    assert numeric_stats_frame({"x": exact}).loc[0, "Quantile_Rel_Error"] == 0.01
+
+
+def test_numeric_summary_exact_moments(values):
+    summary = NumericSummary()
+    for part in np.array_split(values, 5):
+        summary.update(part)
+    desc = summary.describe().set_index("Stat")
+    expected = pd.Series(values).describe()
+    for stat in ["count", "mean", "std", "min", "max"]:
+        assert desc.loc[stat, "Value"] == pytest.approx(expected[stat])
+        assert desc.loc[stat, "Error"] == 0
+
+
+def test_heavy_hitters_count_range():
+    rng = np.random.default_rng(3)
+    values = pd.Series(rng.zipf(1.5, 50_000) % 5_000)
+    hitters = HeavyHitters(capacity=64)
+    for start in range(0, len(values), 12_500):
+        hitters.update(values.iloc[start:start + 12_500])
+    actual = values.value_counts()
+    for key, count in hitters.top(10):
+        assert count <= actual[key] <= count + hitters.error
+
+
+def test_hyperloglog_within_bound():
+    hll = HyperLogLog()
+    for start in range(0, 40_000, 10_000):
+        hll.update(pd.Series(np.arange(start, start + 10_000)).astype(str))
+    hll.update(pd.Series(np.arange(5_000)).astype(str))
+    estimate = hll.estimate()
+    assert abs(estimate - 40_000) <= hll.error_bound(estimate)
+
+
+def test_histogram_counts_within_error():
+    rng = np.random.default_rng(4)
+    values = pd.Series(rng.lognormal(5, 1, 20_000))
+    hist = FixedHistogram()
+    hist.update(values)
+    frame = histogram_frame(hist, ["Range", "Count"])
+    expected = pd.cut(values, bins=5).value_counts()
+    for _, row in frame.iterrows():
+        assert abs(row["Count"] - expected[row["Range"]]) <= row["Count_Error"]
@@ -0,0 +1,27 @@
+import pandas as pd
+
+import data_products.streaming as streaming
+from common.parallel import concat_partitions
+from data_products.dedup import product_deduplicator
+from data_products.extract import extract_product
+from data_products.pipeline import build_report
+from data_products.transform import transform_product
+
+
+def test_products_streaming_matches_in_memory(products_csv, monkeypatch, assert_reports_equal):
+    dedup = product_deduplicator()
+    df = transform_product(extract_product(products_csv), dedup=dedup)
+    expected = build_report(df, dedup)
+
+    captured = {}
+
+    def load_product_stream(chunks, get_report, *args):
+        captured["rows"] = concat_partitions(list(chunks))
+        captured["report"] = get_report()
+
+    monkeypatch.setattr(streaming, "load_product_stream", load_product_stream)
+    monkeypatch.setattr(streaming, "inspect_data", lambda chunk: None)
+    streaming.run_stream(products_csv, 300, "unused")
+
+    assert_reports_equal(expected, captured["report"])
+    pd.testing.assert_frame_equal(captured["rows"], df)